@@ -5,12 +5,15 @@ from __future__ import annotations
 import time
 import json
 import base64
+import zipfile
 from io import BytesIO
 from pathlib import Path
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 from urllib.parse import urlencode
 
 from datetime import date
+from functools import partial
 
 import pandas as pd
 import streamlit as st
@@ -23,10 +26,14 @@ from documents import DocumentAgent, DocumentGenerationError
 from photo import (
     MediaPageContext,
     PhotoAgent,
+    album_zip_builder,
+    catalog_media_items,
+    load_media_catalog,
     render_media_page,
     render_onedrive_embed_panel,
+    render_parent_photo_gallery,
 )
-from storage import DriveAgent
+from storage import DriveAgent, LazyFileListing
 from config import get_app_config, validate_config_or_stop
 from services.calendar_service import (
     CalendarServiceError,
@@ -35,8 +42,27 @@ from services.calendar_service import (
     add_event,
     list_events,
 )
-from services.drive_service import DriveServiceError, get_photos_root_folder_id
+from services.drive_service import (
+    DriveBatchResult,
+    DriveServiceError,
+    batch_check_folder_access,
+    get_photos_root_folder_id,
+)
 from services.content_repo import ContentRepository, ContentRepositoryError
+from services.document_jobs import (
+    DocumentJob,
+    DocumentJobResult,
+    get_document_job_queue,
+)
+from services.album_export import unique_arcname
+from services.food_invoicing import compute_invoice_ledger, run_invoice_batch
+from services.report_batch import (
+    ReportOutcome,
+    ReportRequest,
+    generate_reports,
+    write_reports_zip,
+)
+from services.google_clients import get_client_pool_stats
 from services.registration_form_service import (
     RegistrationPayload,
     extract_acroform_fields,
@@ -47,7 +73,7 @@ from services.sheets_repo import (
     map_schema_v1_payload_to_tab_records,
 )
 from services.sheets_service import SheetsServiceError, read_sheet_values
-from services.photos_service import get_download_bytes
+from ui.document_list import DOCX_MIME_TYPE, render_document_list
 from ui.layout import bootstrap_page
 from ui.state_keys import UIKeys, ensure_defaults, ss_get, ss_set
 
@@ -145,12 +171,22 @@ def _extract_docx_preview_text(
     return "\n\n".join(preview_lines)
 
 
+def _load_document_bytes(file_id: str, revision: str) -> bytes:
+    """Ungecacht, da auch Download-Callable; gecacht wird nur der Vorschautext."""
+    return DriveAgent().fetch_file(file_id)
+
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _load_document_preview(file_id: str, revision: str) -> str:
+    """Vorschautext je Dateistand; bleibt gültig, bis sich die Datei ändert."""
+    return _extract_docx_preview_text(_load_document_bytes(file_id, revision))
+
+
 def _normalize_active_flag(value: str | bool | None) -> bool:
     return str(value or "false").strip().lower() == "true"
 
 
-PHOTO_STATUS_OPTIONS = ("draft", "published", "archived")
-DEFAULT_PARENT_VISIBILITY_STATUS = "draft"
+PARENT_PHOTO_PAGE_SIZE = 24
 CONTRACT_LANGUAGE_OPTIONS = (
     "de",
     "en",
@@ -331,13 +367,6 @@ def _render_calendar_embed(section_key: str) -> None:
     )
 
 
-def _normalize_photo_status(value: str | None) -> str:
-    normalized = str(value or "").strip().lower()
-    if normalized in PHOTO_STATUS_OPTIONS:
-        return normalized
-    return DEFAULT_PARENT_VISIBILITY_STATUS
-
-
 def _active_flag_to_string(value: bool) -> str:
     return "true" if value else "false"
 
@@ -880,10 +909,241 @@ def _render_admin_child_creation_and_import(
                         st.caption(f"Details / Details: {exc}")
 
 
-@st.cache_data(show_spinner=False)
-def _get_photo_download_bytes(file_id: str, consent_mode: str) -> bytes:
-    original_bytes = drive_agent.download_file(file_id)
-    return get_download_bytes(original_bytes, consent_mode)
+def _run_report_job(
+    doc_agent: DocumentAgent,
+    drive_agent: DriveAgent,
+    child: dict[str, Any],
+    notes: str,
+    *,
+    language: str,
+    is_draft: bool,
+    save_to_drive: bool,
+    regenerate: bool = False,
+    on_progress: Callable[[str], None] | None = None,
+) -> DocumentJobResult:
+    """Läuft im Worker-Thread der Job-Queue (ohne Streamlit-Aufrufe).
+
+    ``on_progress`` erhält den gestreamten Berichtstext für die Vorschau.
+    """
+    doc_bytes, file_name = doc_agent.generate_document(
+        child,
+        notes,
+        language=language,
+        is_draft=is_draft,
+        regenerate=regenerate,
+        on_progress=on_progress,
+    )
+    notice = ""
+    if save_to_drive:
+        folder_id = str(child.get("folder_id", "")).strip()
+        if not folder_id:
+            notice = "Kein Drive-Ordner für dieses Kind vorhanden."
+        else:
+            try:
+                drive_agent.upload_file(file_name, doc_bytes, DOCX_MIME_TYPE, folder_id)
+                notice = "Dokument wurde im Drive-Ordner gespeichert."
+            except DriveServiceError as exc:
+                notice = f"Speichern im Drive-Ordner fehlgeschlagen: {exc}"
+    return DocumentJobResult(doc_bytes=doc_bytes, file_name=file_name, notice=notice)
+
+
+def _run_bulk_report_job(
+    doc_agent: DocumentAgent,
+    drive_agent: DriveAgent,
+    requests: list[ReportRequest],
+    *,
+    language: str,
+    is_draft: bool,
+    save_to_drive: bool,
+    max_concurrency: int,
+) -> DocumentJobResult:
+    """Sammelberichte als ZIP; optional zusätzlich in die Kinder-Ordner."""
+    uploaded: list[str] = []
+    upload_errors: list[str] = []
+
+    def _generate(request: ReportRequest) -> tuple[bytes, str]:
+        # Ratenlimits gehen direkt an den adaptiven Limiter von generate_reports.
+        return doc_agent.generate_document(
+            request.child,
+            request.notes,
+            language=language,
+            is_draft=is_draft,
+            retry_rate_limits=False,
+        )
+
+    def _save_to_drive(outcomes: Iterable[ReportOutcome]) -> Iterator[ReportOutcome]:
+        """Lädt fertige Berichte hoch, ohne einen OpenAI-Slot zu belegen."""
+        for outcome in outcomes:
+            if outcome.ok and outcome.doc_bytes is not None:
+                folder_id = str(outcome.request.child.get("folder_id", "")).strip()
+                child_name = str(outcome.request.child.get("name", "")).strip()
+                if not folder_id:
+                    upload_errors.append(f"{child_name}: kein Drive-Ordner")
+                else:
+                    try:
+                        drive_agent.upload_file(
+                            outcome.file_name,
+                            outcome.doc_bytes,
+                            DOCX_MIME_TYPE,
+                            folder_id,
+                        )
+                        uploaded.append(outcome.file_name)
+                    except DriveServiceError as exc:
+                        upload_errors.append(f"{child_name}: {exc}")
+            yield outcome
+
+    outcomes = generate_reports(requests, _generate, max_concurrency=max_concurrency)
+    report_archive = write_reports_zip(
+        _save_to_drive(outcomes) if save_to_drive else outcomes
+    )
+    notice_lines = [
+        f"{report_archive.file_count} von {len(requests)} Berichten erstellt."
+    ]
+    if save_to_drive:
+        notice_lines.append(f"{len(uploaded)} im Drive-Ordner gespeichert.")
+    notice_lines.extend(
+        f"{outcome.request.child.get('name', '')}: {outcome.error}"
+        for outcome in report_archive.failed
+    )
+    notice_lines.extend(upload_errors)
+    date_stamp = date.today().strftime("%Y%m%d")
+    return DocumentJobResult(
+        doc_bytes=b"",
+        file_name=f"Berichte_{date_stamp}.zip",
+        notice="\n\n".join(notice_lines),
+        archive=report_archive.archive,
+    )
+
+
+def _run_invoice_batch_job(
+    doc_agent: DocumentAgent,
+    drive_agent: DriveAgent,
+    children: list[dict[str, Any]],
+    *,
+    period_start: date,
+    period_end: date,
+    monthly_amount_eur: float,
+    save_to_drive: bool,
+) -> DocumentJobResult:
+    """Sammelabrechnung aller aktiven Kinder als ZIP mit Ledger."""
+    ledger = compute_invoice_ledger(
+        children, period_start, period_end, monthly_amount_eur
+    )
+
+    def _render(row: dict[str, Any]) -> tuple[bytes, str]:
+        return doc_agent.generate_food_allowance_invoice(
+            {"name": row["child_name"], "parent_email": row["parent_email"]},
+            date.fromisoformat(row["billable_from"]),
+            period_end,
+            monthly_amount_eur,
+            total_amount_eur=row["total_amount_eur"],
+        )
+
+    def _upload(file_name: str, doc_bytes: bytes, folder_id: str) -> str | None:
+        return drive_agent.upload_file(file_name, doc_bytes, DOCX_MIME_TYPE, folder_id)
+
+    batch_name = f"Lebensmittelpauschale_{period_start.strftime('%Y%m')}"
+    invoice_batch = run_invoice_batch(
+        ledger,
+        _render,
+        upload=_upload if save_to_drive else None,
+        ledger_name=batch_name,
+    )
+    notice_lines = [
+        (
+            f"{invoice_batch.invoice_count} Abrechnungen, Summe "
+            f"{invoice_batch.ledger['total_amount_eur'].sum():.2f} €."
+        )
+    ]
+    notice_lines.extend(invoice_batch.upload_errors)
+    return DocumentJobResult(
+        doc_bytes=invoice_batch.archive,
+        file_name=f"{batch_name}.zip",
+        notice="\n\n".join(notice_lines),
+    )
+
+
+def _group_contracts_zip(
+    doc_agent: DocumentAgent,
+    children: list[dict[str, Any]],
+    *,
+    language: str,
+    is_draft: bool,
+) -> bytes:
+    """Verträge einer Gruppe aus der vorkompilierten Vorlage als ZIP."""
+    output = BytesIO()
+    used_names: set[str] = set()
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as zf:
+        for doc_bytes, file_name in doc_agent.generate_care_contracts(
+            children, language=language, is_draft=is_draft
+        ):
+            zf.writestr(unique_arcname(file_name, used_names), doc_bytes)
+    return output.getvalue()
+
+
+def _render_document_job(job: DocumentJob) -> None:
+    if job.pending:
+        st.info(
+            f"⏳ {job.label}: "
+            + ("wartet / queued" if job.status == "queued" else "läuft / running")
+        )
+        if job.preview:
+            with st.container(border=True):
+                st.caption("Live-Vorschau / Live preview")
+                st.markdown(job.preview + " ▌")
+        return
+    if job.status == "failed" or job.result is None:
+        st.error(
+            f"{job.label}: Dokument konnte nicht erstellt werden. / "
+            "Document could not be generated."
+        )
+        st.info(job.error)
+    else:
+        st.success("Dokument erstellt: " + job.result.file_name)
+        if job.result.notice:
+            st.info(job.result.notice)
+        if job.result.file_name.endswith(".docx"):
+            with st.expander("Vorschau des neuen Dokuments / Preview new document"):
+                st.markdown(_extract_docx_preview_text(job.result.doc_bytes))
+        st.download_button(
+            "📄 Dokument herunterladen",
+            data=job.result.download_data(),
+            file_name=job.result.file_name,
+            key=f"document_job_download_{job.job_id}",
+        )
+    if st.button("Ausblenden / Dismiss", key=f"document_job_dismiss_{job.job_id}"):
+        get_document_job_queue().discard(job.job_id)
+        ss_set(
+            UIKeys.DOCUMENT_JOB_IDS,
+            [
+                job_id
+                for job_id in ss_get(UIKeys.DOCUMENT_JOB_IDS, [])
+                if job_id != job.job_id
+            ],
+        )
+        st.rerun()
+
+
+def _render_document_jobs() -> None:
+    """Zeigt die Jobs dieser Session; solange Jobs laufen, pollt ein Fragment."""
+    jobs = get_document_job_queue().jobs(list(ss_get(UIKeys.DOCUMENT_JOB_IDS, [])))
+    if not jobs:
+        return
+
+    def _jobs_fragment() -> None:
+        current_jobs = get_document_job_queue().jobs([job.job_id for job in jobs])
+        for job in current_jobs:
+            _render_document_job(job)
+        if not any(job.pending for job in current_jobs):
+            # Polling beenden, sobald alle Jobs fertig sind.
+            st.rerun(scope="app")
+
+    st.write("**Aufträge / Jobs**")
+    if any(job.pending for job in jobs):
+        st.fragment(run_every=1.0)(_jobs_fragment)()
+    else:
+        for job in jobs:
+            _render_document_job(job)
 
 
 def _run_google_connection_check() -> list[tuple[str, bool, str]]:
@@ -902,9 +1162,18 @@ def _run_google_connection_check() -> list[tuple[str, bool, str]]:
                 app_config.google.drive_contracts_folder_id,
             ),
         ]
+        batch_error: Exception | None = None
+        folder_access = DriveBatchResult()
+        try:
+            folder_access = batch_check_folder_access(
+                folder_id for _, folder_id in drive_checks
+            )
+        except Exception as exc:  # pragma: no cover - runtime external dependency
+            batch_error = exc
+
         for folder_label, folder_id in drive_checks:
-            try:
-                drive_agent.list_files(folder_id)
+            folder_error = batch_error or folder_access.errors.get(folder_id)
+            if folder_error is None:
                 checks.append(
                     (
                         f"Google Drive Zugriff ({folder_label}) / Google Drive access ({folder_label})",
@@ -913,20 +1182,14 @@ def _run_google_connection_check() -> list[tuple[str, bool, str]]:
                         f"Folder ID: `{folder_id}`.",
                     )
                 )
-            except DriveServiceError as exc:
-                checks.append(
-                    (
-                        f"Google Drive Zugriff ({folder_label}) / Google Drive access ({folder_label})",
-                        False,
-                        _format_drive_healthcheck_error(folder_label, folder_id, exc),
-                    )
-                )
-            except Exception as exc:  # pragma: no cover - runtime external dependency
+            else:
                 checks.append(
                     (
                         f"Google Drive Zugriff ({folder_label}) / Google Drive access ({folder_label})",
                         False,
-                        _format_drive_healthcheck_error(folder_label, folder_id, exc),
+                        _format_drive_healthcheck_error(
+                            folder_label, folder_id, folder_error
+                        ),
                     )
                 )
     else:
@@ -1618,6 +1881,31 @@ else:
                         hide_index=True,
                         width="stretch",
                     )
+                    missing_folder_count = sum(
+                        1
+                        for child_record in children
+                        if not str(child_record.get("folder_id", "")).strip()
+                    )
+                    if missing_folder_count and st.button(
+                        f"Fehlende Drive-Ordner anlegen ({missing_folder_count}) / "
+                        f"Create missing Drive folders ({missing_folder_count})",
+                        key="create_missing_child_folders",
+                    ):
+                        try:
+                            created_folders = (
+                                stammdaten_manager.create_missing_child_folders()
+                            )
+                            st.success(
+                                f"{len(created_folders)} Ordner angelegt. / "
+                                f"{len(created_folders)} folders created."
+                            )
+                            _trigger_rerun()
+                        except DriveServiceError as exc:
+                            st.error(
+                                "Nicht alle Drive-Ordner konnten angelegt werden. / "
+                                "Not all Drive folders could be created."
+                            )
+                            st.info(str(exc))
                 elif not children_load_error:
                     st.write(
                         "*Noch keine Kinder registriert. / No children registered yet.*"
@@ -2069,54 +2357,104 @@ else:
                     "Dokument im Drive-Ordner des Kindes speichern? / "
                     "Save document in child's Drive folder?"
                 )
+                regenerate_document = st.checkbox(
+                    "Text neu generieren (Cache ignorieren) / "
+                    "Regenerate text (bypass cache)",
+                    value=False,
+                    key="admin_document_regenerate",
+                    help=(
+                        "Ohne Haken beantwortet der Cache identische Notizen. / "
+                        "Unchecked, identical notes are answered from the cache."
+                    ),
+                )
                 if st.button("Bericht erstellen / Create report"):
-                    with st.spinner("Generiere Dokument mit OpenAI..."):
-                        try:
-                            doc_bytes, file_name = doc_agent.generate_document(
-                                sel_child,
-                                doc_notes,
-                                language=document_language,
-                                is_draft=mark_document_as_draft,
-                            )
-                            st.success("Dokument erstellt: " + file_name)
-                            with st.expander(
-                                "Vorschau des neuen Dokuments / Preview new document",
-                                expanded=True,
-                            ):
-                                st.markdown(_extract_docx_preview_text(doc_bytes))
-                            # Download-Button anzeigen
-                            st.download_button(
-                                "📄 Dokument herunterladen",
-                                data=doc_bytes,
-                                file_name=file_name,
-                            )
-                            # Optional: in Drive speichern
-                            if save_to_drive:
-                                folder_id = sel_child.get("folder_id")
-                                if folder_id:
-                                    drive_agent.upload_file(
-                                        file_name,
-                                        doc_bytes,
-                                        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                        folder_id,
-                                    )
-                                    st.info(
-                                        "Dokument wurde im Drive-Ordner gespeichert."
-                                    )
-                                else:
-                                    st.error(
-                                        "Kein Drive-Ordner für dieses Kind vorhanden."
-                                    )
-                        except DocumentGenerationError as e:
-                            st.error(
-                                "Dokument konnte nicht erstellt werden. Bitte Hinweise prüfen und erneut versuchen."
-                            )
-                            st.error(
-                                "Document could not be generated. Please review the message and retry."
-                            )
-                            st.info(str(e))
-                        except Exception as e:
-                            st.error(f"Fehler bei der Dokumentenerstellung: {e}")
+                    job_id = get_document_job_queue().submit(
+                        f"Bericht {sel_child.get('name', '')}".strip(),
+                        partial(
+                            _run_report_job,
+                            doc_agent,
+                            drive_agent,
+                            dict(sel_child),
+                            doc_notes,
+                            language=document_language,
+                            is_draft=mark_document_as_draft,
+                            save_to_drive=save_to_drive,
+                            regenerate=regenerate_document,
+                        ),
+                        with_progress=True,
+                    )
+                    ss_set(
+                        UIKeys.DOCUMENT_JOB_IDS,
+                        [*ss_get(UIKeys.DOCUMENT_JOB_IDS, []), job_id],
+                    )
+                    st.toast(
+                        "Bericht wird im Hintergrund erstellt. / "
+                        "Report is being generated in the background."
+                    )
+
+                st.write("**Sammelberichte / Bulk reports**")
+                bulk_df = st.data_editor(
+                    pd.DataFrame(
+                        [
+                            {
+                                "Auswahl / Select": True,
+                                "Kind / Child": str(child.get("name", "")),
+                                "Notizen / Notes": "",
+                            }
+                            for child in children
+                        ]
+                    ),
+                    hide_index=True,
+                    width="stretch",
+                    key="admin_bulk_report_table",
+                    column_config={
+                        "Auswahl / Select": st.column_config.CheckboxColumn(
+                            "Auswahl / Select"
+                        ),
+                        "Notizen / Notes": st.column_config.TextColumn(
+                            "Notizen / Notes", width="large"
+                        ),
+                    },
+                    disabled=["Kind / Child"],
+                )
+                bulk_requests = [
+                    ReportRequest(child=dict(child), notes=str(notes or ""))
+                    for child, selected, notes in zip(
+                        children,
+                        bulk_df["Auswahl / Select"].tolist(),
+                        bulk_df["Notizen / Notes"].tolist(),
+                        strict=True,
+                    )
+                    if bool(selected) and str(notes or "").strip()
+                ]
+                bulk_save_to_drive = st.checkbox(
+                    "Berichte zusätzlich in den Drive-Ordnern der Kinder speichern / "
+                    "Also save reports in each child's Drive folder",
+                    key="admin_bulk_report_drive",
+                )
+                if st.button(
+                    f"Sammelberichte erstellen ({len(bulk_requests)}) / "
+                    "Generate bulk reports",
+                    disabled=not bulk_requests,
+                ):
+                    job_id = get_document_job_queue().submit(
+                        f"Sammelberichte ({len(bulk_requests)})",
+                        partial(
+                            _run_bulk_report_job,
+                            doc_agent,
+                            drive_agent,
+                            bulk_requests,
+                            language=document_language,
+                            is_draft=mark_document_as_draft,
+                            save_to_drive=bulk_save_to_drive,
+                            max_concurrency=app_config.openai.bulk_concurrency,
+                        ),
+                    )
+                    ss_set(
+                        UIKeys.DOCUMENT_JOB_IDS,
+                        [*ss_get(UIKeys.DOCUMENT_JOB_IDS, []), job_id],
+                    )
+                _render_document_jobs()
 
                 st.divider()
                 st.write("**Vorlagen aus Stammdaten / Templates from master data**")
@@ -2168,6 +2506,46 @@ else:
                             )
                             st.info(str(exc))
 
+                    contract_groups = sorted(
+                        {
+                            str(child.get("group", "")).strip()
+                            for child in children
+                            if str(child.get("group", "")).strip()
+                        }
+                    )
+                    if contract_groups:
+                        contract_group = st.selectbox(
+                            "Gruppe / Group",
+                            options=contract_groups,
+                            index=(
+                                contract_groups.index(sel_child.get("group", ""))
+                                if sel_child.get("group", "") in contract_groups
+                                else 0
+                            ),
+                            key="admin_contract_group",
+                        )
+                        group_children = [
+                            child
+                            for child in children
+                            if str(child.get("group", "")).strip() == contract_group
+                        ]
+                        st.download_button(
+                            f"🗂️ Verträge der Gruppe ({len(group_children)}) / "
+                            "Group contracts (ZIP)",
+                            data=partial(
+                                _group_contracts_zip,
+                                doc_agent,
+                                group_children,
+                                language=contract_language,
+                                is_draft=mark_contract_as_draft,
+                            ),
+                            file_name=(
+                                f"Vertraege_{contract_group.replace(' ', '_')}.zip"
+                            ),
+                            mime="application/zip",
+                            key="admin_group_contracts_download",
+                        )
+
                 with invoice_col:
                     st.write("Lebensmittelpauschale abrechnen / Food allowance invoice")
                     period_start = st.date_input(
@@ -2223,31 +2601,51 @@ else:
                         except Exception as exc:
                             st.error(f"Fehler bei der Abrechnungserstellung: {exc}")
 
+                    invoice_save_to_drive = st.checkbox(
+                        "Abrechnungen im Drive-Ordner der Kinder speichern / "
+                        "Save invoices in each child's Drive folder",
+                        key="food_invoice_batch_drive",
+                    )
+                    if st.button(
+                        "Sammelabrechnung aller aktiven Kinder / "
+                        "Batch invoices for all active children",
+                        key="create_food_invoice_batch_button",
+                        disabled=period_end < period_start,
+                    ):
+                        job_id = get_document_job_queue().submit(
+                            "Sammelabrechnung Lebensmittelpauschale "
+                            f"{period_start.strftime('%m/%Y')}",
+                            partial(
+                                _run_invoice_batch_job,
+                                doc_agent,
+                                drive_agent,
+                                children,
+                                period_start=period_start,
+                                period_end=period_end,
+                                monthly_amount_eur=float(monthly_amount),
+                                save_to_drive=invoice_save_to_drive,
+                            ),
+                        )
+                        ss_set(
+                            UIKeys.DOCUMENT_JOB_IDS,
+                            [*ss_get(UIKeys.DOCUMENT_JOB_IDS, []), job_id],
+                        )
+                        # Job-Liste steht weiter oben; neu rendern, damit er erscheint.
+                        st.rerun()
+
                 # Optionale Liste vorhandener Dokumente im Drive
                 if sel_child.get("folder_id"):
                     docs_list = drive_agent.list_files(
-                        sel_child["folder_id"],
-                        mime_type_filter="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                        sel_child["folder_id"], mime_type_filter=DOCX_MIME_TYPE
                     )
                     if docs_list:
                         st.write("**Bereits gespeicherte Dokumente für dieses Kind:**")
-                        for doc in docs_list:
-                            file_name = doc.get("name")
-                            file_id = doc.get("id")
-                            doc_bytes = drive_agent.download_file(file_id)
-                            preview_title = (
-                                "Vorschau gespeichertes Dokument"
-                                " / Preview saved document"
-                            )
-                            with st.expander(f"📄 {file_name}"):
-                                st.caption(preview_title)
-                                st.markdown(_extract_docx_preview_text(doc_bytes))
-                                st.download_button(
-                                    "Download / Herunterladen",
-                                    data=doc_bytes,
-                                    file_name=file_name,
-                                    key=file_id,
-                                )
+                        render_document_list(
+                            docs_list,
+                            key_prefix="admin_documents",
+                            load_bytes=_load_document_bytes,
+                            load_preview=_load_document_preview,
+                        )
                     else:
                         st.write(
                             "(Keine gespeicherten Dokumente vorhanden. / "
@@ -2289,6 +2687,7 @@ else:
                                 or "application/octet-stream",
                                 parent_folder_id=contracts_folder_id,
                             )
+                            st.session_state.pop(UIKeys.CONTRACTS_LISTING, None)
                             st.success(
                                 "Datei in Google Drive gespeichert. / "
                                 f"File saved to Google Drive (ID: {file_id})."
@@ -2304,7 +2703,15 @@ else:
 
                 st.write("**Vorhandene Vertragsdateien / Existing contract files**")
                 try:
-                    contract_files = drive_agent.list_files(contracts_folder_id)
+                    contract_listing = LazyFileListing(
+                        drive_agent,
+                        contracts_folder_id,
+                        state=st.session_state,
+                        state_key=UIKeys.CONTRACTS_LISTING,
+                        page_size=50,
+                    )
+                    contract_listing.page(0)
+                    contract_files = contract_listing.loaded_items()
                     if contract_files:
                         for file_meta in contract_files:
                             st.markdown(
@@ -2312,6 +2719,12 @@ else:
                                 f"`{file_meta.get('mimeType', '-')}` · "
                                 f"{file_meta.get('modifiedTime', '-')}"
                             )
+                        if contract_listing.has_more and st.button(
+                            "Weitere Dateien laden / Load more files",
+                            key="contracts_load_more",
+                        ):
+                            contract_listing.load_next_page()
+                            _trigger_rerun()
                     else:
                         st.caption(
                             "Noch keine Dateien vorhanden. / No files available yet."
@@ -2390,6 +2803,16 @@ else:
                         st.success(f"{check_title}: {message}")
                     else:
                         st.error(f"{check_title}: {message}")
+                if app_config.storage_mode == "google":
+                    for pool_stats in get_client_pool_stats():
+                        st.caption(
+                            f"Client-Pool {pool_stats.service}: "
+                            f"{pool_stats.created} erstellt / created, "
+                            f"{pool_stats.in_use} aktiv / in use, "
+                            f"{pool_stats.idle} frei / idle, "
+                            f"{pool_stats.checkouts} Ausleihen / checkouts, "
+                            f"{pool_stats.reused} wiederverwendet / reused"
+                        )
             else:
                 st.info(
                     "Nutzen Sie den Button in der Sidebar, um den Check zu starten. / "
@@ -2536,20 +2959,15 @@ else:
             st.subheader("Dokumente Ihres Kindes")
             if child and child.get("folder_id"):
                 docs_list = drive_agent.list_files(
-                    child["folder_id"],
-                    mime_type_filter="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    child["folder_id"], mime_type_filter=DOCX_MIME_TYPE
                 )
                 if docs_list:
-                    for doc in docs_list:
-                        file_name = doc.get("name")
-                        file_id = doc.get("id")
-                        st.markdown(f"**{file_name}** ")
-                        st.download_button(
-                            "Herunterladen",
-                            data=drive_agent.download_file(file_id),
-                            file_name=file_name,
-                            key=file_id,
-                        )
+                    render_document_list(
+                        docs_list,
+                        key_prefix="parent_documents",
+                        load_bytes=_load_document_bytes,
+                        download_label="Herunterladen",
+                    )
                 else:
                     st.write("Keine Dokumente vorhanden.")
             else:
@@ -2558,35 +2976,35 @@ else:
             st.subheader("Fotos / Photos")
             render_onedrive_embed_panel()
             if child and child.get("id"):
+                published_photos: list[dict[str, Any]] = []
                 try:
                     if app_config.storage_mode == "google":
                         photo_folder_id = get_photos_root_folder_id()
                     else:
                         photo_folder_id = "root"
-                    photos = (
-                        drive_agent.list_files(
-                            photo_folder_id, mime_type_filter="image/"
-                        )
-                        if photo_folder_id
-                        else []
-                    )
-                    published_photos: list[dict[str, str]] = []
                     current_child_id = str(child.get("id", "")).strip()
-                    for photo in photos:
-                        file_id = str(photo.get("id", "")).strip()
-                        if not file_id:
-                            continue
-                        meta = stammdaten_manager.get_photo_meta_by_file_id(file_id)
-                        if not meta:
-                            continue
-                        if str(meta.get("child_id", "")).strip() != current_child_id:
-                            continue
-                        status = _normalize_photo_status(meta.get("status"))
-                        if status == "published":
-                            published_photos.append(photo)
-                    photos = published_photos
+                    media_catalog = load_media_catalog(
+                        stammdaten_manager, drive_agent, photo_folder_id
+                    )
+                    published_photos = [
+                        item
+                        for item in media_catalog.media_for(
+                            current_child_id, "published"
+                        )
+                        if str(item.get("mimeType", "")).startswith("image/")
+                    ]
+                    published_media = [
+                        item
+                        for item in catalog_media_items(
+                            media_catalog,
+                            current_child_id,
+                            status="published",
+                            source=app_config.storage_mode,
+                        )
+                        if item.is_image
+                    ]
                 except Exception as exc:
-                    photos = []
+                    published_photos = []
                     st.error(
                         "Fotos konnten nicht geladen werden. / Could not load photos."
                     )
@@ -2631,34 +3049,33 @@ else:
                         "In der App bleibt die Vorschau unverändert. Der Consent betrifft nur den Download. / "
                         "In-app preview remains unchanged. Consent affects download only."
                     )
-                if photos:
+                if published_photos:
                     active_consent_mode = (
                         str((child or {}).get("download_consent", "pixelated"))
                         .strip()
                         .lower()
                     )
-                    for photo in photos:
-                        file_name = str(photo.get("name", "photo"))
-                        file_id = str(photo.get("id", ""))
-                        img_bytes = drive_agent.download_file(file_id)
-                        st.image(
-                            img_bytes,
-                            caption=f"{file_name} · Vorschau / Preview",
-                            width="stretch",
+                    if active_consent_mode != "denied":
+                        photo_count = len(published_photos)
+                        st.download_button(
+                            f"Album herunterladen (ZIP, {photo_count} Fotos) / "
+                            f"Download album (ZIP, {photo_count} photos)",
+                            data=album_zip_builder(
+                                photo_folder_id,
+                                published_photos,
+                                active_consent_mode,
+                            ),
+                            file_name=f"album_{current_child_id}.zip",
+                            mime="application/zip",
+                            key=f"download_album_{current_child_id}_{active_consent_mode}",
                         )
-                        if active_consent_mode == "denied":
-                            st.caption("Download nicht erlaubt / Download not allowed.")
-                        else:
-                            download_bytes = _get_photo_download_bytes(
-                                file_id=file_id,
-                                consent_mode=active_consent_mode,
-                            )
-                            st.download_button(
-                                "Foto herunterladen / Download photo",
-                                data=download_bytes,
-                                file_name=file_name,
-                                key=f"download_photo_{file_id}_{active_consent_mode}",
-                            )
+                    render_parent_photo_gallery(
+                        photo_folder_id,
+                        current_child_id,
+                        published_media,
+                        active_consent_mode,
+                        page_size=PARENT_PHOTO_PAGE_SIZE,
+                    )
                 else:
                     st.write(
                         "Keine veröffentlichten Fotos vorhanden. / No published photos available."
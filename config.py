@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Mapping
 from urllib.parse import parse_qs, urlparse
@@ -16,6 +16,9 @@ DEFAULT_OPENAI_MODEL_FAST = "gpt-4o-mini"
 DEFAULT_OPENAI_MODEL_PRECISE = "o3-mini"
 DEFAULT_OPENAI_TIMEOUT_SECONDS = 30.0
 DEFAULT_OPENAI_MAX_RETRIES = 3
+DEFAULT_OPENAI_BULK_CONCURRENCY = 4
+DEFAULT_OPENAI_CACHE_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_OPENAI_CACHE_MAX_ENTRIES = 500
 DEFAULT_OPENAI_REASONING_EFFORT: Literal["low", "medium", "high"] = "medium"
 DEFAULT_STORAGE_MODE: Literal["local", "google"] = "local"
 DEFAULT_DATA_DIR = "./data"
@@ -56,6 +59,24 @@ class LocalConfig:
     drive_root: Path
 
 
+@dataclass(frozen=True)
+class PhotoConfig:
+    """Parameter für Gesichtserkennung, Kodierung und Upload-Normalisierung."""
+
+    face_detection_max_edge: int = 1600
+    face_scale_factor: float = 1.1
+    face_min_neighbors: int = 5
+    face_min_size: int = 0
+    jpeg_quality: int = 85
+    webp_quality: int = 85
+    webp_lossless: bool = False
+    webp_method: int = 4
+    normalize_uploads: bool = False
+    upload_max_edge: int = 2560
+    upload_quality: int = 85
+    keep_upload_originals: bool = False
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """App-weite Konfigurationswerte."""
@@ -64,6 +85,7 @@ class AppConfig:
     google: GoogleConfig | None
     local: LocalConfig
     openai: "OpenAIConfig"
+    photos: PhotoConfig = field(default_factory=PhotoConfig)
 
 
 @dataclass(frozen=True)
@@ -80,6 +102,9 @@ class OpenAIConfig:
     base_url: str | None
     vector_store_id: str | None
     enable_web_search: bool
+    bulk_concurrency: int = DEFAULT_OPENAI_BULK_CONCURRENCY
+    cache_ttl_seconds: float = DEFAULT_OPENAI_CACHE_TTL_SECONDS
+    cache_max_entries: int = DEFAULT_OPENAI_CACHE_MAX_ENTRIES
 
 
 REQUIRED_GCP_SERVICE_ACCOUNT_KEYS = (
@@ -493,6 +518,34 @@ def _load_openai_config(secrets: Mapping[str, Any]) -> OpenAIConfig:
         "OPENAI_ENABLE_WEB_SEARCH",
         default=True,
     )
+    bulk_concurrency = int(
+        _read_number(
+            openai_section,
+            "bulk_concurrency",
+            "OPENAI_BULK_CONCURRENCY",
+            default=DEFAULT_OPENAI_BULK_CONCURRENCY,
+            minimum=1,
+            section="openai",
+        )
+    )
+    cache_ttl_seconds = _read_number(
+        openai_section,
+        "cache_ttl_seconds",
+        "OPENAI_CACHE_TTL_SECONDS",
+        default=DEFAULT_OPENAI_CACHE_TTL_SECONDS,
+        minimum=0,
+        section="openai",
+    )
+    cache_max_entries = int(
+        _read_number(
+            openai_section,
+            "cache_max_entries",
+            "OPENAI_CACHE_MAX_ENTRIES",
+            default=DEFAULT_OPENAI_CACHE_MAX_ENTRIES,
+            minimum=1,
+            section="openai",
+        )
+    )
 
     return OpenAIConfig(
         api_key=api_key,
@@ -505,6 +558,150 @@ def _load_openai_config(secrets: Mapping[str, Any]) -> OpenAIConfig:
         base_url=base_url,
         vector_store_id=vector_store_id,
         enable_web_search=enable_web_search,
+        bulk_concurrency=bulk_concurrency,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_max_entries=cache_max_entries,
+    )
+
+
+def _read_number(
+    secrets_section: Mapping[str, Any],
+    key: str,
+    env_key: str,
+    *,
+    default: float,
+    minimum: float,
+    section: str = "photos",
+) -> float:
+    secret_value = secrets_section.get(key)
+    if isinstance(secret_value, (int, float)) and not isinstance(secret_value, bool):
+        value = float(secret_value)
+    else:
+        raw_value = _read_secret_or_env(secrets_section, key, env_key)
+        if raw_value is None:
+            return default
+        try:
+            value = float(raw_value)
+        except ValueError as exc:
+            raise ConfigError(f"{section}.{key} muss eine Zahl sein.") from exc
+    if value < minimum:
+        raise ConfigError(f"{section}.{key} muss mindestens {minimum:g} sein.")
+    return value
+
+
+def _read_quality(
+    secrets_section: Mapping[str, Any],
+    key: str,
+    env_key: str,
+    *,
+    default: int,
+) -> int:
+    quality = int(
+        _read_number(secrets_section, key, env_key, default=default, minimum=1)
+    )
+    if quality > 100:
+        raise ConfigError(f"photos.{key} darf höchstens 100 sein.")
+    return quality
+
+
+def _load_photo_config(secrets: Mapping[str, Any]) -> PhotoConfig:
+    photos_section_raw = secrets.get("photos", {})
+    photos_section = (
+        photos_section_raw if isinstance(photos_section_raw, Mapping) else {}
+    )
+    defaults = PhotoConfig()
+    webp_method = int(
+        _read_number(
+            photos_section,
+            "webp_method",
+            "PHOTO_WEBP_METHOD",
+            default=defaults.webp_method,
+            minimum=0,
+        )
+    )
+    if webp_method > 6:
+        raise ConfigError("photos.webp_method muss zwischen 0 und 6 liegen.")
+    return PhotoConfig(
+        face_detection_max_edge=int(
+            _read_number(
+                photos_section,
+                "face_detection_max_edge",
+                "PHOTO_FACE_DETECTION_MAX_EDGE",
+                default=defaults.face_detection_max_edge,
+                minimum=0,
+            )
+        ),
+        face_scale_factor=_read_number(
+            photos_section,
+            "face_scale_factor",
+            "PHOTO_FACE_SCALE_FACTOR",
+            default=defaults.face_scale_factor,
+            minimum=1.01,
+        ),
+        face_min_neighbors=int(
+            _read_number(
+                photos_section,
+                "face_min_neighbors",
+                "PHOTO_FACE_MIN_NEIGHBORS",
+                default=defaults.face_min_neighbors,
+                minimum=0,
+            )
+        ),
+        face_min_size=int(
+            _read_number(
+                photos_section,
+                "face_min_size",
+                "PHOTO_FACE_MIN_SIZE",
+                default=defaults.face_min_size,
+                minimum=0,
+            )
+        ),
+        jpeg_quality=_read_quality(
+            photos_section,
+            "jpeg_quality",
+            "PHOTO_JPEG_QUALITY",
+            default=defaults.jpeg_quality,
+        ),
+        webp_quality=_read_quality(
+            photos_section,
+            "webp_quality",
+            "PHOTO_WEBP_QUALITY",
+            default=defaults.webp_quality,
+        ),
+        webp_lossless=_read_bool(
+            photos_section,
+            "webp_lossless",
+            "PHOTO_WEBP_LOSSLESS",
+            default=defaults.webp_lossless,
+        ),
+        webp_method=webp_method,
+        normalize_uploads=_read_bool(
+            photos_section,
+            "normalize_uploads",
+            "PHOTO_NORMALIZE_UPLOADS",
+            default=defaults.normalize_uploads,
+        ),
+        upload_max_edge=int(
+            _read_number(
+                photos_section,
+                "upload_max_edge",
+                "PHOTO_UPLOAD_MAX_EDGE",
+                default=defaults.upload_max_edge,
+                minimum=0,
+            )
+        ),
+        upload_quality=_read_quality(
+            photos_section,
+            "upload_quality",
+            "PHOTO_UPLOAD_QUALITY",
+            default=defaults.upload_quality,
+        ),
+        keep_upload_originals=_read_bool(
+            photos_section,
+            "keep_upload_originals",
+            "PHOTO_KEEP_UPLOAD_ORIGINALS",
+            default=defaults.keep_upload_originals,
+        ),
     )
 
 
@@ -531,12 +728,14 @@ def get_app_config() -> AppConfig:
     local = _load_local_config(st.secrets)
     google = _load_google_config(st.secrets) if storage_mode == "google" else None
     openai = _load_openai_config(st.secrets)
+    photos = _load_photo_config(st.secrets)
 
     return AppConfig(
         storage_mode=storage_mode,
         google=google,
         local=local,
         openai=openai,
+        photos=photos,
     )
 
 
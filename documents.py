@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import random
 import time
 import logging
+from collections.abc import Callable
 from datetime import date, datetime
-from io import BytesIO
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from docx import Document
+from docx.document import Document as DocumentObject
 from docx.shared import Inches
 from openai import (
     APITimeoutError,
@@ -23,6 +26,8 @@ from openai import (
 )
 
 from config import OpenAIConfig, get_app_config
+from services.docx_templates import DocxTemplate
+from services.generation_cache import GenerationCache, generation_cache_key
 
 
 class DocumentGenerationError(RuntimeError):
@@ -31,6 +36,184 @@ class DocumentGenerationError(RuntimeError):
 
 logger = logging.getLogger(__name__)
 
+REPORT_SYSTEM_PROMPT = (
+    "Du bist eine professionelle pädagogische Assistenz. "
+    "Schreibe warmherzige, klare Elternkommunikation."
+)
+
+
+DRAFT_MARKER = "ENTWURF / DRAFT"
+
+
+def _draft_marker(is_draft: bool) -> str:
+    return DRAFT_MARKER if is_draft else ""
+
+
+def _field_or_dash(child_data: dict[str, Any], key: str) -> str:
+    return str(child_data.get(key, "")).strip() or "—"
+
+
+def _new_template_document(logo_path: Path) -> DocumentObject:
+    doc = Document()
+    if logo_path.exists():
+        doc.add_picture(str(logo_path), width=Inches(1.8))
+    return doc
+
+
+@cache
+def _report_template(language: str, logo_path: Path) -> DocxTemplate:
+    """Berichtsvorlage je Sprache; Logo und Styles werden nur einmal eingebettet."""
+    doc = _new_template_document(logo_path)
+    doc.add_paragraph("{{draft_marker}}")
+    doc.add_heading("{{title}}", level=1)
+    doc.add_paragraph("Datum: {{date}}" if language == "de" else "Date: {{date}}")
+    doc.add_paragraph("")
+    doc.add_paragraph("{{body}}")
+    return DocxTemplate.from_document(doc)
+
+
+@cache
+def _contract_template(language: str, logo_path: Path) -> DocxTemplate:
+    """Vertragsvorlage je Sprache mit statischem Vertragstext."""
+    doc = _new_template_document(logo_path)
+    doc.add_paragraph("Erstellt am / Generated on: {{generated_on}}")
+    doc.add_paragraph("")
+    doc.add_paragraph("{{draft_marker}}")
+
+    if language == "de":
+        doc.add_heading("Betreuungsvertrag", level=1)
+        doc.add_paragraph(
+            "Zwischen der Großtagespflege 9 Freunde und den Sorgeberechtigten "
+            "wird folgender Betreuungsvertrag geschlossen."
+        )
+        doc.add_heading("1. Vertragsdaten", level=2)
+        doc.add_paragraph("Kind: {{child_name}}")
+        doc.add_paragraph("Elternkontakt: {{parent_email}}")
+        doc.add_paragraph("Geburtsdatum: {{birthdate}}")
+        doc.add_paragraph("Betreuungsbeginn: {{start_date}}")
+        doc.add_paragraph("Gruppe: {{group}}")
+        doc.add_paragraph("Allergien: {{allergies}}")
+        doc.add_heading("2. Leistungsumfang", level=2)
+        doc.add_paragraph(
+            "Die Einrichtung übernimmt die regelmäßige Betreuung, Förderung und "
+            "Verpflegung im vereinbarten Betreuungsrahmen."
+        )
+        doc.add_heading("3. Hinweise", level=2)
+    else:
+        doc.add_heading("Childcare Contract", level=1)
+        doc.add_paragraph(
+            "Between Großtagespflege 9 Freunde and the legal guardians the "
+            "following childcare contract is concluded."
+        )
+        doc.add_heading("1. Contract details", level=2)
+        doc.add_paragraph("Child: {{child_name}}")
+        doc.add_paragraph("Parent contact: {{parent_email}}")
+        doc.add_paragraph("Birthdate: {{birthdate}}")
+        doc.add_paragraph("Start date: {{start_date}}")
+        doc.add_paragraph("Group: {{group}}")
+        doc.add_paragraph("Allergies: {{allergies}}")
+        doc.add_heading("2. Scope of care", level=2)
+        doc.add_paragraph(
+            "The daycare provides regular care, educational support and meals "
+            "within the agreed scope."
+        )
+        doc.add_heading("3. Notes", level=2)
+
+    doc.add_paragraph("{{notes}}")
+    doc.add_paragraph("")
+    if language == "de":
+        doc.add_paragraph(
+            "Ort, Datum: _____________________    Unterschrift Eltern: "
+            "_____________________"
+        )
+        doc.add_paragraph(
+            "Ort, Datum: _____________________    Unterschrift Tagespflege: "
+            "_____________________"
+        )
+    else:
+        doc.add_paragraph(
+            "Place, Date: _____________________    Signature parent: "
+            "_____________________"
+        )
+        doc.add_paragraph(
+            "Place, Date: _____________________    Signature daycare: "
+            "_____________________"
+        )
+    return DocxTemplate.from_document(doc)
+
+
+@cache
+def _invoice_template(logo_path: Path) -> DocxTemplate:
+    """Zweisprachige Vorlage für die Lebensmittelpauschale."""
+    doc = _new_template_document(logo_path)
+    doc.add_paragraph("Erstellt am / Generated on: {{generated_on}}")
+    doc.add_paragraph("")
+    doc.add_heading(
+        "Abrechnung Lebensmittelpauschale / Food allowance invoice", level=1
+    )
+    doc.add_paragraph("Kind / Child: {{child_name}}")
+    doc.add_paragraph("Elternkontakt / Parent contact: {{parent_email}}")
+    doc.add_paragraph("Abrechnungszeitraum / Billing period: {{period}}")
+
+    table = doc.add_table(rows=4, cols=2)
+    table.style = "Light List"
+    table.cell(0, 0).text = "Pauschale pro Monat / Monthly allowance"
+    table.cell(0, 1).text = "{{monthly_amount}}"
+    table.cell(1, 0).text = "Tagessatz (Monat/30) / Daily rate (month/30)"
+    table.cell(1, 1).text = "{{daily_amount}}"
+    table.cell(2, 0).text = "Anzahl Tage / Number of days"
+    table.cell(2, 1).text = "{{days}}"
+    table.cell(3, 0).text = "Gesamtbetrag / Total amount"
+    table.cell(3, 1).text = "{{total_amount}}"
+
+    doc.add_paragraph("")
+    doc.add_paragraph(
+        "Bitte überweisen Sie den Gesamtbetrag bis zum 10. des Folgemonats. / "
+        "Please transfer the total amount by the 10th of the following month."
+    )
+    return DocxTemplate.from_document(doc)
+
+
+def _partial_json_string(buffer: str, key: str) -> str:
+    """Liest den bisher gestreamten Wert eines JSON-Strings (ggf. unvollständig).
+
+    Abgeschnittene Escape-Sequenzen am Ende werden ausgelassen, bis der
+    nächste Abschnitt eintrifft.
+    """
+    marker = f'"{key}"'
+    key_index = buffer.find(marker)
+    while key_index > 0 and buffer[key_index - 1] == "\\":
+        # Escaptes ``\"body\"`` innerhalb eines anderen Werts überspringen.
+        key_index = buffer.find(marker, key_index + 1)
+    if key_index < 0:
+        return ""
+    colon_index = buffer.find(":", key_index + len(marker))
+    start = buffer.find('"', colon_index + 1) + 1 if colon_index >= 0 else 0
+    if start <= 0:
+        return ""
+    index = start
+    while index < len(buffer):
+        char = buffer[index]
+        if char == '"':
+            break
+        if char != "\\":
+            index += 1
+            continue
+        step = 2
+        if buffer.startswith("\\u", index):
+            step = 6
+            code = buffer[index + 2 : index + 6]
+            # Hohe Surrogate nur zusammen mit dem zweiten Teil übernehmen.
+            if len(code) == 4 and code.lower().startswith(("d8", "d9", "da", "db")):
+                step = 12
+        if index + step > len(buffer):
+            break
+        index += step
+    try:
+        return json.loads(f'"{buffer[start:index]}"', strict=False)
+    except ValueError:
+        return ""
+
 
 class DocumentAgent:
     """Erstellt Berichte auf Basis von Notizen und Kinddaten."""
@@ -40,6 +223,15 @@ class DocumentAgent:
         self.openai_config: OpenAIConfig = app_config.openai
         self.client = self._build_client()
         self.logo_path = Path(__file__).resolve().parent / "images" / "logo.png"
+        self.generation_cache = (
+            GenerationCache(
+                app_config.local.data_dir / "openai_cache",
+                ttl_seconds=self.openai_config.cache_ttl_seconds,
+                max_entries=self.openai_config.cache_max_entries,
+            )
+            if self.openai_config.cache_ttl_seconds > 0
+            else None
+        )
 
     def _build_client(self) -> OpenAI | None:
         if not self.openai_config.api_key:
@@ -88,7 +280,74 @@ class DocumentAgent:
             "strict": True,
         }
 
-    def _generate_with_retry(self, prompt: str) -> dict[str, str]:
+    def _validated_payload(self, payload: Any) -> dict[str, str]:
+        """Prüft die Antwort gegen das Schema aus ``_response_format``."""
+        schema = self._response_format()["schema"]
+        if not isinstance(payload, dict):
+            raise DocumentGenerationError(
+                "Die KI-Antwort konnte nicht strukturiert verarbeitet werden."
+            )
+        if set(payload) - set(schema["properties"]) or any(
+            not isinstance(payload.get(key), str) for key in schema["required"]
+        ):
+            raise DocumentGenerationError(
+                "Die KI-Antwort entspricht nicht dem erwarteten Format."
+            )
+        title = payload["title"].strip()
+        body = payload["body"].strip()
+        if not title or not body:
+            raise DocumentGenerationError(
+                "Die KI-Antwort ist unvollständig. Bitte erneut versuchen."
+            )
+        return {"title": title, "body": body}
+
+    def _stream_payload(
+        self,
+        request: dict[str, Any],
+        on_progress: Callable[[str], None],
+    ) -> Any:
+        """Liest den Event-Stream und meldet den bisherigen Berichtstext.
+
+        Das Ergebnis ist erst nach ``response.completed`` gültig und wird wie
+        bei der nicht gestreamten Antwort validiert.
+        """
+        buffer = ""
+        final_text: str | None = None
+        last_preview = ""
+        for event in self.client.responses.create(**request, stream=True):
+            event_type = getattr(event, "type", "")
+            if event_type == "response.output_text.delta":
+                buffer += event.delta
+                preview = _partial_json_string(buffer, "body")
+                if preview != last_preview:
+                    last_preview = preview
+                    on_progress(preview)
+            elif event_type == "response.completed":
+                final_text = getattr(event.response, "output_text", None)
+            elif event_type in {"response.failed", "response.incomplete", "error"}:
+                raise DocumentGenerationError(
+                    "Die KI-Antwort wurde vorzeitig abgebrochen. "
+                    "Bitte erneut versuchen."
+                )
+        try:
+            return json.loads(final_text or buffer)
+        except ValueError:
+            return None
+
+    def _generate_with_retry(
+        self,
+        prompt: str,
+        on_progress: Callable[[str], None] | None = None,
+        *,
+        retry_rate_limits: bool = True,
+    ) -> dict[str, str]:
+        """Ruft OpenAI mit Wiederholungen auf.
+
+        Mit ``on_progress`` wird die Antwort gestreamt; der Callback erhält den
+        bisher empfangenen Berichtstext (bei einem Neuversuch wieder von vorn).
+        Ohne ``retry_rate_limits`` wird ein Ratenlimit sofort weitergereicht,
+        damit ein äußerer Limiter (Sammelberichte) drosseln kann.
+        """
         if not self.client:
             raise DocumentGenerationError(
                 "OpenAI API-Schlüssel fehlt. Bitte [openai].api_key in secrets.toml "
@@ -107,34 +366,21 @@ class DocumentAgent:
 
         for attempt in range(self.openai_config.max_retries + 1):
             try:
-                response = self.client.responses.create(
-                    model=self.selected_model,
-                    input=[
-                        {
-                            "role": "system",
-                            "content": "Du bist eine professionelle pädagogische Assistenz. "
-                            "Schreibe warmherzige, klare Elternkommunikation.",
-                        },
+                request: dict[str, Any] = {
+                    "model": self.selected_model,
+                    "input": [
+                        {"role": "system", "content": REPORT_SYSTEM_PROMPT},
                         {"role": "user", "content": prompt},
                     ],
-                    reasoning={"effort": self.openai_config.reasoning_effort},
-                    tools=tools,
-                    text={"format": self._response_format()},
-                )
-
-                payload = response.output_parsed
-                if not isinstance(payload, dict):
-                    raise DocumentGenerationError(
-                        "Die KI-Antwort konnte nicht strukturiert verarbeitet werden."
-                    )
-
-                title = str(payload.get("title", "")).strip()
-                body = str(payload.get("body", "")).strip()
-                if not title or not body:
-                    raise DocumentGenerationError(
-                        "Die KI-Antwort ist unvollständig. Bitte erneut versuchen."
-                    )
-                return {"title": title, "body": body}
+                    "reasoning": {"effort": self.openai_config.reasoning_effort},
+                    "tools": tools,
+                    "text": {"format": self._response_format()},
+                }
+                if on_progress is not None:
+                    payload = self._stream_payload(request, on_progress)
+                else:
+                    payload = self.client.responses.create(**request).output_parsed
+                return self._validated_payload(payload)
             except (APITimeoutError, RateLimitError) as exc:
                 last_error = exc
                 error_category = "timeout_or_rate_limit"
@@ -146,6 +392,8 @@ class DocumentAgent:
                     self.selected_model,
                     [str(tool.get("type", "unknown")) for tool in tools],
                 )
+                if isinstance(exc, RateLimitError) and not retry_rate_limits:
+                    break
             except (AuthenticationError, PermissionDeniedError) as exc:
                 last_error = exc
                 error_category = "auth"
@@ -254,6 +502,47 @@ class DocumentAgent:
 
         raise DocumentGenerationError(message) from last_error
 
+    def _generate_cached(
+        self,
+        prompt: str,
+        *,
+        regenerate: bool = False,
+        on_progress: Callable[[str], None] | None = None,
+        retry_rate_limits: bool = True,
+    ) -> dict[str, str]:
+        """Nutzt eine gespeicherte Antwort für identische Eingaben.
+
+        ``regenerate`` erzwingt einen neuen Aufruf und überschreibt den Eintrag.
+        """
+        if self.generation_cache is None or not self.client:
+            return self._generate_with_retry(
+                prompt, on_progress, retry_rate_limits=retry_rate_limits
+            )
+
+        cache_key = generation_cache_key(
+            model=self.selected_model,
+            reasoning_effort=self.openai_config.reasoning_effort,
+            tools=self._build_tools(),
+            system_prompt=REPORT_SYSTEM_PROMPT,
+            user_prompt=prompt,
+        )
+        if not regenerate:
+            cached = self.generation_cache.get(cache_key)
+            if cached and cached.get("title") and cached.get("body"):
+                logger.info(
+                    "OpenAI response served from cache [key=%s].", cache_key[:12]
+                )
+                return cached
+
+        result = self._generate_with_retry(
+            prompt, on_progress, retry_rate_limits=retry_rate_limits
+        )
+        try:
+            self.generation_cache.put(cache_key, result)
+        except OSError as exc:
+            logger.warning("OpenAI response not cached: %s", exc)
+        return result
+
     @staticmethod
     def _normalized_language(language: str) -> str:
         return "en" if language.strip().lower() == "en" else "de"
@@ -264,8 +553,18 @@ class DocumentAgent:
         notes: str,
         language: str = "de",
         is_draft: bool = False,
+        regenerate: bool = False,
+        on_progress: Callable[[str], None] | None = None,
+        retry_rate_limits: bool = True,
     ) -> tuple[bytes, str]:
-        """Generiert einen Dokumenttext mit OpenAI und erstellt ein Word-Dokument."""
+        """Generiert einen Dokumenttext mit OpenAI und erstellt ein Word-Dokument.
+
+        Identische Notizen (z. B. Entwurf und Endfassung) nutzen den Antwort-Cache,
+        sofern ``regenerate`` nicht gesetzt ist. ``on_progress`` erhält den
+        gestreamten Berichtstext als Vorschau; das DOCX entsteht erst aus der
+        validierten Gesamtantwort. ``retry_rate_limits=False`` überlässt
+        Wiederholungen nach einem Ratenlimit dem Aufrufer.
+        """
         selected_language = self._normalized_language(language)
         child_name = str(child_data.get("name", "Ihr Kind")).strip() or "Ihr Kind"
         language_instruction = (
@@ -280,25 +579,21 @@ class DocumentAgent:
             "Nutze einen positiven, klaren Stil. Gib nur valides JSON gemäß Schema zurück."
         )
 
-        result = self._generate_with_retry(prompt)
-
-        doc = Document()
-        if self.logo_path.exists():
-            doc.add_picture(str(self.logo_path), width=Inches(1.8))
-        if is_draft:
-            doc.add_paragraph("ENTWURF / DRAFT")
-        doc.add_heading(result["title"], level=1)
-        today_str = datetime.now().strftime("%d.%m.%Y")
-        if selected_language == "de":
-            doc.add_paragraph(f"Datum: {today_str}")
-        else:
-            doc.add_paragraph(f"Date: {today_str}")
-        doc.add_paragraph("")
-        doc.add_paragraph(result["body"])
+        result = self._generate_cached(
+            prompt,
+            regenerate=regenerate,
+            on_progress=on_progress,
+            retry_rate_limits=retry_rate_limits,
+        )
 
-        output = BytesIO()
-        doc.save(output)
-        doc_bytes = output.getvalue()
+        doc_bytes = _report_template(selected_language, self.logo_path).render(
+            {
+                "draft_marker": _draft_marker(is_draft),
+                "title": result["title"],
+                "date": datetime.now().strftime("%d.%m.%Y"),
+                "body": result["body"],
+            }
+        )
 
         safe_name = child_name.replace(" ", "_")
         date_stamp = datetime.now().strftime("%Y%m%d")
@@ -307,13 +602,6 @@ class DocumentAgent:
         file_name = f"{file_prefix}_{safe_name}_{date_stamp}{draft_suffix}.docx"
         return doc_bytes, file_name
 
-    def _add_logo_and_generation_date(self, doc: Document) -> None:
-        if self.logo_path.exists():
-            doc.add_picture(str(self.logo_path), width=Inches(1.8))
-        today_str = datetime.now().strftime("%d.%m.%Y")
-        doc.add_paragraph(f"Erstellt am / Generated on: {today_str}")
-        doc.add_paragraph("")
-
     @staticmethod
     def _safe_child_name(child_data: dict[str, Any]) -> str:
         return str(child_data.get("name", "Kind")).strip() or "Kind"
@@ -327,89 +615,46 @@ class DocumentAgent:
         """Erstellt einen Betreuungsvertrag auf Basis der Stammdaten."""
         selected_language = self._normalized_language(language)
         child_name = self._safe_child_name(child_data)
-        parent_email = str(child_data.get("parent_email", "")).strip() or "—"
-        birthdate = str(child_data.get("birthdate", "")).strip() or "—"
-        start_date = str(child_data.get("start_date", "")).strip() or "—"
-        group = str(child_data.get("group", "")).strip() or "—"
-        allergies = str(child_data.get("allergies", "")).strip() or "Keine / None"
-
-        doc = Document()
-        self._add_logo_and_generation_date(doc)
-        if is_draft:
-            doc.add_paragraph("ENTWURF / DRAFT")
-
-        if selected_language == "de":
-            doc.add_heading("Betreuungsvertrag", level=1)
-            doc.add_paragraph(
-                "Zwischen der Großtagespflege 9 Freunde und den Sorgeberechtigten "
-                "wird folgender Betreuungsvertrag geschlossen."
-            )
-            doc.add_heading("1. Vertragsdaten", level=2)
-            doc.add_paragraph(f"Kind: {child_name}")
-            doc.add_paragraph(f"Elternkontakt: {parent_email}")
-            doc.add_paragraph(f"Geburtsdatum: {birthdate}")
-            doc.add_paragraph(f"Betreuungsbeginn: {start_date}")
-            doc.add_paragraph(f"Gruppe: {group}")
-            doc.add_paragraph(f"Allergien: {allergies}")
-            doc.add_heading("2. Leistungsumfang", level=2)
-            doc.add_paragraph(
-                "Die Einrichtung übernimmt die regelmäßige Betreuung, Förderung und "
-                "Verpflegung im vereinbarten Betreuungsrahmen."
-            )
-            doc.add_heading("3. Hinweise", level=2)
-        else:
-            doc.add_heading("Childcare Contract", level=1)
-            doc.add_paragraph(
-                "Between Großtagespflege 9 Freunde and the legal guardians the "
-                "following childcare contract is concluded."
-            )
-            doc.add_heading("1. Contract details", level=2)
-            doc.add_paragraph(f"Child: {child_name}")
-            doc.add_paragraph(f"Parent contact: {parent_email}")
-            doc.add_paragraph(f"Birthdate: {birthdate}")
-            doc.add_paragraph(f"Start date: {start_date}")
-            doc.add_paragraph(f"Group: {group}")
-            doc.add_paragraph(f"Allergies: {allergies}")
-            doc.add_heading("2. Scope of care", level=2)
-            doc.add_paragraph(
-                "The daycare provides regular care, educational support and meals "
-                "within the agreed scope."
-            )
-            doc.add_heading("3. Notes", level=2)
-
         notes_parent = str(child_data.get("notes_parent_visible", "")).strip()
-        if selected_language == "de":
-            doc.add_paragraph(notes_parent or "Keine zusätzlichen Hinweise.")
-        else:
-            doc.add_paragraph(notes_parent or "No extra notes.")
-
-        doc.add_paragraph("")
-        if selected_language == "de":
-            doc.add_paragraph(
-                "Ort, Datum: _____________________    Unterschrift Eltern: "
-                "_____________________"
-            )
-            doc.add_paragraph(
-                "Ort, Datum: _____________________    Unterschrift Tagespflege: "
-                "_____________________"
-            )
-        else:
-            doc.add_paragraph(
-                "Place, Date: _____________________    Signature parent: "
-                "_____________________"
-            )
-            doc.add_paragraph(
-                "Place, Date: _____________________    Signature daycare: "
-                "_____________________"
+        if not notes_parent:
+            notes_parent = (
+                "Keine zusätzlichen Hinweise."
+                if selected_language == "de"
+                else "No extra notes."
             )
 
-        output = BytesIO()
-        doc.save(output)
+        doc_bytes = _contract_template(selected_language, self.logo_path).render(
+            {
+                "generated_on": datetime.now().strftime("%d.%m.%Y"),
+                "draft_marker": _draft_marker(is_draft),
+                "child_name": child_name,
+                "parent_email": _field_or_dash(child_data, "parent_email"),
+                "birthdate": _field_or_dash(child_data, "birthdate"),
+                "start_date": _field_or_dash(child_data, "start_date"),
+                "group": _field_or_dash(child_data, "group"),
+                "allergies": str(child_data.get("allergies", "")).strip()
+                or "Keine / None",
+                "notes": notes_parent,
+            }
+        )
+
         date_stamp = datetime.now().strftime("%Y%m%d")
         file_prefix = "Betreuungsvertrag" if selected_language == "de" else "Contract"
         draft_suffix = "_Entwurf" if is_draft else ""
         file_name = f"{file_prefix}_{child_name.replace(' ', '_')}_{date_stamp}{draft_suffix}.docx"
-        return output.getvalue(), file_name
+        return doc_bytes, file_name
+
+    def generate_care_contracts(
+        self,
+        children: list[dict[str, Any]],
+        language: str = "de",
+        is_draft: bool = False,
+    ) -> list[tuple[bytes, str]]:
+        """Erstellt Verträge für eine ganze Gruppe aus derselben Vorlage."""
+        return [
+            self.generate_care_contract(child, language=language, is_draft=is_draft)
+            for child in children
+        ]
 
     def generate_food_allowance_invoice(
         self,
@@ -417,52 +662,44 @@ class DocumentAgent:
         period_start: date,
         period_end: date,
         monthly_amount_eur: float,
+        *,
+        total_amount_eur: float | None = None,
     ) -> tuple[bytes, str]:
-        """Erstellt eine Abrechnung der Lebensmittelpauschale für einen Zeitraum."""
+        """Erstellt eine Abrechnung der Lebensmittelpauschale für einen Zeitraum.
+
+        ``total_amount_eur`` übernimmt einen bereits berechneten Betrag (z. B.
+        aus dem Ledger der Sammelabrechnung), damit Dokument und Ledger
+        übereinstimmen.
+        """
         if period_end < period_start:
             raise DocumentGenerationError(
                 "Das Enddatum muss nach dem Startdatum liegen. / End date must be after start date."
             )
 
         child_name = self._safe_child_name(child_data)
-        parent_email = str(child_data.get("parent_email", "")).strip() or "—"
         days_in_period = (period_end - period_start).days + 1
         daily_amount_eur = monthly_amount_eur / 30.0
-        total_amount_eur = round(days_in_period * daily_amount_eur, 2)
-
-        doc = Document()
-        self._add_logo_and_generation_date(doc)
-        doc.add_heading(
-            "Abrechnung Lebensmittelpauschale / Food allowance invoice", level=1
-        )
-        doc.add_paragraph(f"Kind / Child: {child_name}")
-        doc.add_paragraph(f"Elternkontakt / Parent contact: {parent_email}")
-        doc.add_paragraph(
-            "Abrechnungszeitraum / Billing period: "
-            f"{period_start.strftime('%d.%m.%Y')} - {period_end.strftime('%d.%m.%Y')}"
+        if total_amount_eur is None:
+            total_amount_eur = round(days_in_period * daily_amount_eur, 2)
+
+        doc_bytes = _invoice_template(self.logo_path).render(
+            {
+                "generated_on": datetime.now().strftime("%d.%m.%Y"),
+                "child_name": child_name,
+                "parent_email": _field_or_dash(child_data, "parent_email"),
+                "period": (
+                    f"{period_start.strftime('%d.%m.%Y')} - "
+                    f"{period_end.strftime('%d.%m.%Y')}"
+                ),
+                "monthly_amount": f"{monthly_amount_eur:.2f} €",
+                "daily_amount": f"{daily_amount_eur:.2f} €",
+                "days": str(days_in_period),
+                "total_amount": f"{total_amount_eur:.2f} €",
+            }
         )
 
-        table = doc.add_table(rows=4, cols=2)
-        table.style = "Light List"
-        table.cell(0, 0).text = "Pauschale pro Monat / Monthly allowance"
-        table.cell(0, 1).text = f"{monthly_amount_eur:.2f} €"
-        table.cell(1, 0).text = "Tagessatz (Monat/30) / Daily rate (month/30)"
-        table.cell(1, 1).text = f"{daily_amount_eur:.2f} €"
-        table.cell(2, 0).text = "Anzahl Tage / Number of days"
-        table.cell(2, 1).text = str(days_in_period)
-        table.cell(3, 0).text = "Gesamtbetrag / Total amount"
-        table.cell(3, 1).text = f"{total_amount_eur:.2f} €"
-
-        doc.add_paragraph("")
-        doc.add_paragraph(
-            "Bitte überweisen Sie den Gesamtbetrag bis zum 10. des Folgemonats. / "
-            "Please transfer the total amount by the 10th of the following month."
-        )
-
-        output = BytesIO()
-        doc.save(output)
         date_stamp = datetime.now().strftime("%Y%m%d")
         file_name = (
             f"Lebensmittelpauschale_{child_name.replace(' ', '_')}_{date_stamp}.docx"
         )
-        return output.getvalue(), file_name
+        return doc_bytes, file_name
@@ -0,0 +1,89 @@
+"""Verknüpfung von Drive-Listing und photo_meta zu einem Medien-Katalog."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any
+
+MEDIA_MIME_PREFIXES = ("image/", "video/")
+
+
+@dataclass(slots=True)
+class MediaCatalog:
+    """Medien je Kind und Status; ``photo_meta`` hat Vorrang vor appProperties."""
+
+    meta_by_file_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    files_by_child_status: dict[tuple[str, str], list[dict[str, Any]]] = field(
+        default_factory=dict
+    )
+
+    def media_for(
+        self, child_id: str, status: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Listing-Einträge eines Kindes (optional je Status) in Listing-Reihenfolge."""
+        normalized_child_id = child_id.strip()
+        if status is not None:
+            return list(
+                self.files_by_child_status.get((normalized_child_id, status), [])
+            )
+        files: list[dict[str, Any]] = []
+        for (entry_child_id, _), entries in self.files_by_child_status.items():
+            if entry_child_id == normalized_child_id:
+                files.extend(entries)
+        files.sort(key=itemgetter("_catalog_position"))
+        return files
+
+    def meta_for(self, file_id: str) -> dict[str, Any]:
+        return self.meta_by_file_id.get(file_id.strip(), {})
+
+
+def build_media_catalog(
+    files: Iterable[Mapping[str, Any]],
+    photo_meta_records: Iterable[Mapping[str, Any]],
+    *,
+    normalize_status: Callable[[str], str] | None = None,
+    default_status: str = "draft",
+) -> MediaCatalog:
+    """Indiziert photo_meta einmalig nach ``file_id`` und ordnet das Listing zu.
+
+    Kind und Status kommen aus photo_meta; fehlt ein Eintrag, werden die
+    Drive-appProperties genutzt; Medien ohne Kind werden übergangen. Jeder
+    Listing-Eintrag erhält die Schlüssel ``child_id``/``status`` sowie
+    ``_catalog_position`` für stabile Sortierung.
+    """
+    catalog = MediaCatalog()
+    for record in photo_meta_records:
+        file_id = str(record.get("file_id", "")).strip()
+        if file_id:
+            catalog.meta_by_file_id[file_id] = dict(record)
+
+    for position, raw_file in enumerate(files):
+        file_id = str(raw_file.get("id", "")).strip()
+        mime_type = str(raw_file.get("mimeType", ""))
+        if not file_id or not mime_type.startswith(MEDIA_MIME_PREFIXES):
+            continue
+
+        meta = catalog.meta_by_file_id.get(file_id, {})
+        app_properties = raw_file.get("appProperties") or {}
+        child_id = str(
+            meta.get("child_id") or app_properties.get("child_id") or ""
+        ).strip()
+        raw_status = meta.get("status") or app_properties.get("status") or ""
+        status = (
+            normalize_status(str(raw_status))
+            if normalize_status is not None
+            else str(raw_status).strip().lower() or default_status
+        )
+        if not child_id:
+            continue
+        catalog.files_by_child_status.setdefault((child_id, status), []).append(
+            {
+                **raw_file,
+                "child_id": child_id,
+                "status": status,
+                "_catalog_position": position,
+            }
+        )
+    return catalog
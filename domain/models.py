@@ -29,6 +29,7 @@ class MediaItem:
     source: Literal["google", "local"]
     created_time: str | None = None
     modified_time: str | None = None
+    checksum: str | None = None
     thumb_bytes: bytes | None = None
     preview_bytes: bytes | None = None
     preview_url: str | None = None
@@ -41,6 +42,11 @@ class MediaItem:
     def is_image(self) -> bool:
         return self.kind == "image" or self.mime_type.startswith("image/")
 
+    @property
+    def revision(self) -> str:
+        """Inhaltsstand für abgeleitete Varianten (MD5, sonst Änderungszeit)."""
+        return self.checksum or self.modified_time or ""
+
     @property
     def ext(self) -> str:
         return Path(self.name).suffix.lower()
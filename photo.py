@@ -1,14 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import base64
+import logging
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable
+import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 
+from config import PhotoConfig, get_app_config
+from domain.media_catalog import MediaCatalog, build_media_catalog
 from domain.models import MediaItem
-from services.drive_service import DriveServiceError
-from storage import DriveAgent
+from services.album_export import AlbumEntry, write_album_zip
+from services.drive_service import DRIVE_FOLDER_MIME_TYPE, DriveServiceError
+from services.media_derivatives import (
+    DERIVATIVES_FOLDER_NAME,
+    IMAGE_DERIVATIVE_SPECS,
+    PREVIEW_SPEC,
+    THUMBNAIL_SPEC,
+    VIDEO_DERIVATIVE_SPECS,
+    VIDEO_POSTER_SPEC,
+    VIDEO_PREVIEW_SPEC,
+    DerivativeSpec,
+    MediaDerivativeStore,
+    pixelated_spec,
+)
+from services.photos_service import VALID_CONSENT_MODES, normalize_upload
+from storage import DriveAgent, md5_checksum
 from ui.layout import card, error_banner, page_header
 from ui.media_gallery import render_media_gallery
 from ui.state_keys import UIKeys, ensure_defaults, ss_get, ss_set
@@ -22,6 +42,10 @@ _VIDEO_EXTENSIONS = {
     ".webm": "video/webm",
     ".m4v": "video/x-m4v",
 }
+LOGGER = logging.getLogger(__name__)
+ORIGINALS_FOLDER_NAME = ".originals"
+MEDIA_STATUS_PAGE_SIZE = 50
+THUMBNAIL_POLL_SECONDS = 1.5
 DEFAULT_ONEDRIVE_SHARED_FOLDER_URL = (
     "https://1drv.ms/f/c/497745699E449E1E/"
     "IgC_uwMf-CvWTZZYgmWwxgTVAX2YNBIlVHHu2jTvxO3xOmA?e=sYtDLw"
@@ -39,9 +63,51 @@ class MediaPageContext:
     trigger_rerun: Callable[[], None]
 
 
+@dataclass(slots=True)
+class PhotoUploadResult:
+    file_id: str
+    checksum: str = ""
+    reused_existing: bool = False
+    normalized: bool = False
+    original_file_id: str | None = None
+    content: bytes = field(default=b"", repr=False)
+
+
+def _originals_folder_id(drive_agent: DriveAgent, folder_id: str) -> str:
+    """Ordner für aufbewahrte Originale neben dem Medien-Ordner."""
+    if drive_agent.storage_mode != "google":
+        return f"{folder_id}{ORIGINALS_FOLDER_NAME}"
+    for folder in drive_agent.list_files(
+        folder_id, DRIVE_FOLDER_MIME_TYPE, incremental=True
+    ):
+        if folder.get("name") == ORIGINALS_FOLDER_NAME:
+            return str(folder["id"])
+    return str(drive_agent.create_folder(ORIGINALS_FOLDER_NAME, folder_id))
+
+
 class PhotoAgent:
-    def upload_photo(self, image_file: Any, folder_id: str) -> str:
-        """Speichert ein hochgeladenes Medium im zentralen Medien-Ordner."""
+    def upload_photo(
+        self,
+        image_file: Any,
+        folder_id: str,
+        *,
+        child_id: str | None = None,
+        status: str = DEFAULT_PARENT_VISIBILITY_STATUS,
+        settings: PhotoConfig | None = None,
+        keep_original: bool = False,
+    ) -> PhotoUploadResult:
+        """Speichert ein hochgeladenes Medium im zentralen Medien-Ordner.
+
+        Mit ``child_id`` werden ``child_id``/``status`` als Drive-appProperties
+        gesetzt, damit Listings serverseitig pro Kind gefiltert werden können.
+        Liegt derselbe Inhalt (MD5) bereits im Ordner, wird nichts übertragen:
+        Gehört die Datei demselben Kind, wird ihre ``file_id`` wiederverwendet,
+        sonst wird sie serverseitig für das Kind kopiert.
+
+        Ist ``settings.normalize_uploads`` aktiv, werden Bilder vor dem Upload
+        normalisiert (siehe ``normalize_upload``); mit ``keep_original`` wird
+        das unveränderte Original zusätzlich in ``.originals`` abgelegt.
+        """
         media_bytes = image_file.getvalue()
         file_name = image_file.name or "media.jpg"
         lower_name = file_name.lower()
@@ -55,11 +121,68 @@ class PhotoAgent:
                 mime_type = candidate_mime_type
                 break
 
+        original_bytes = media_bytes
+        normalized = False
+        if (
+            settings is not None
+            and settings.normalize_uploads
+            and mime_type.startswith("image/")
+        ):
+            normalized_upload = normalize_upload(media_bytes, settings)
+            media_bytes = normalized_upload.data
+            normalized = normalized_upload.changed
+
+        app_properties = _media_app_properties(child_id, status) if child_id else None
         drive_agent = DriveAgent()
-        file_id = drive_agent.upload_file(file_name, media_bytes, mime_type, folder_id)
+        checksum = md5_checksum(media_bytes)
+        existing = drive_agent.find_file_by_md5(folder_id, checksum)
+        if existing:
+            existing_id = str(existing.get("id", ""))
+            existing_child_id = str(
+                (existing.get("appProperties") or {}).get("child_id", "")
+            ).strip()
+            if not child_id or existing_child_id == child_id:
+                LOGGER.info(
+                    "Upload übersprungen, Inhalt bereits vorhanden [file_id=%s].",
+                    existing_id,
+                )
+                return PhotoUploadResult(
+                    existing_id,
+                    checksum=checksum,
+                    reused_existing=True,
+                    content=media_bytes,
+                )
+
+            file_id = drive_agent.copy_file(
+                existing_id, file_name, folder_id, app_properties=app_properties
+            )
+        else:
+            file_id = drive_agent.upload_file(
+                file_name,
+                media_bytes,
+                mime_type,
+                folder_id,
+                app_properties=app_properties,
+            )
         if not file_id:
             raise RuntimeError("Upload fehlgeschlagen: keine file_id erhalten.")
-        return str(file_id)
+
+        original_file_id = None
+        if normalized and keep_original:
+            original_file_id = drive_agent.upload_file(
+                file_name,
+                original_bytes,
+                mime_type,
+                _originals_folder_id(drive_agent, folder_id),
+                app_properties={"original_of": str(file_id)},
+            )
+        return PhotoUploadResult(
+            str(file_id),
+            checksum=checksum,
+            normalized=normalized,
+            original_file_id=original_file_id,
+            content=media_bytes,
+        )
 
     def face_detection_enabled(self) -> bool:
         """Face-Recognition ist im MVP deaktiviert."""
@@ -125,16 +248,53 @@ def _normalize_photo_status(value: str | None) -> str:
     return DEFAULT_PARENT_VISIBILITY_STATUS
 
 
-@st.cache_data(show_spinner=False, ttl=60)
+@st.cache_data(show_spinner=False, ttl=15)
 def _list_media(folder_id: str) -> list[dict[str, Any]]:
     drive_agent = DriveAgent()
-    return drive_agent.list_files(folder_id)
+    return drive_agent.list_files(folder_id, incremental=True)
 
 
-@st.cache_data(show_spinner=False, ttl=120)
-def _get_media_bytes(file_id: str) -> bytes:
-    drive_agent = DriveAgent()
-    return drive_agent.download_file(file_id)
+@st.cache_resource(show_spinner=False)
+def get_media_derivative_store(folder_id: str) -> MediaDerivativeStore:
+    """Prozessweiter Varianten-Speicher je Medien-Ordner."""
+    app_config = get_app_config()
+    if app_config.storage_mode == "google":
+        cache_dir = app_config.local.data_dir / "media_cache" / folder_id
+    else:
+        cache_dir = app_config.local.drive_root / folder_id / DERIVATIVES_FOLDER_NAME
+    return MediaDerivativeStore(DriveAgent(), folder_id, cache_dir)
+
+
+def _thumbnail_spec(media_item: MediaItem) -> DerivativeSpec:
+    return VIDEO_POSTER_SPEC if media_item.is_video else THUMBNAIL_SPEC
+
+
+def _media_thumbnail(folder_id: str, media_item: MediaItem) -> bytes | None:
+    """Thumbnail eines Bildes bzw. Poster-Frame eines Videos."""
+    try:
+        return get_media_derivative_store(folder_id).get(
+            media_item.id,
+            media_item.revision,
+            _thumbnail_spec(media_item),
+            lambda: DriveAgent().fetch_file(media_item.id),
+        )
+    except (DriveServiceError, ValueError) as exc:
+        LOGGER.warning("Thumbnail unavailable for %s: %s", media_item.id, exc)
+        return None
+
+
+def _media_preview(folder_id: str, media_item: MediaItem) -> bytes | None:
+    """Vorschau-Bild bzw. kurzer Vorschau-Clip; das Original nur beim Rendern."""
+    try:
+        return get_media_derivative_store(folder_id).get(
+            media_item.id,
+            media_item.revision,
+            VIDEO_PREVIEW_SPEC if media_item.is_video else PREVIEW_SPEC,
+            lambda: DriveAgent().fetch_file(media_item.id),
+        )
+    except (DriveServiceError, ValueError) as exc:
+        LOGGER.warning("Preview unavailable for %s: %s", media_item.id, exc)
+        return None
 
 
 def _to_media_items(
@@ -155,6 +315,7 @@ def _to_media_items(
                 source="local" if source == "local" else "google",
                 created_time=str(raw_item.get("createdTime", "")).strip() or None,
                 modified_time=str(raw_item.get("modifiedTime", "")).strip() or None,
+                checksum=str(raw_item.get("md5Checksum", "")).strip() or None,
             )
         )
     return media_items
@@ -164,46 +325,310 @@ def _get_media_folder_id(ctx: MediaPageContext) -> str:
     return str(ctx.photos_folder_id).strip()
 
 
-def _filter_media_items_for_child(
-    ctx: MediaPageContext,
-    media_items: list[MediaItem],
+def _media_app_properties(child_id: str, status: str) -> dict[str, str]:
+    return {
+        "child_id": child_id.strip(),
+        "status": _normalize_photo_status(status),
+    }
+
+
+def sync_media_app_properties(
+    drive_agent: Any, catalog: MediaCatalog
+) -> tuple[list[str], dict[str, DriveServiceError]]:
+    """Gleicht appProperties mit photo_meta ab (Altbestände und Abweichungen).
+
+    Schreibt nach Drive und wird deshalb nur ausdrücklich aus der
+    Admin-Statusansicht aufgerufen. Liefert aktualisierte IDs und Fehler je Datei.
+    """
+    updates: dict[str, dict[str, str]] = {}
+    for entries in catalog.files_by_child_status.values():
+        for entry in entries:
+            if entry["id"] not in catalog.meta_by_file_id:
+                continue
+            expected = _media_app_properties(entry["child_id"], entry["status"])
+            app_properties = entry.get("appProperties") or {}
+            if any(app_properties.get(key) != value for key, value in expected.items()):
+                updates[entry["id"]] = expected
+    if not updates:
+        return [], {}
+    updated_ids, errors = drive_agent.update_app_properties(updates)
+    for file_id, exc in errors.items():
+        LOGGER.warning("Drive appProperties sync failed for %s: %s", file_id, exc)
+    return updated_ids, errors
+
+
+def load_media_catalog(
+    stammdaten_manager: Any, drive_agent: Any, folder_id: str
+) -> MediaCatalog:
+    """Lädt Listing und photo_meta je einmal und verknüpft sie zum Katalog."""
+    return build_media_catalog(
+        _list_media(folder_id),
+        stammdaten_manager.get_photo_meta_records(),
+        normalize_status=_normalize_photo_status,
+    )
+
+
+def catalog_media_items(
+    catalog: MediaCatalog,
     child_id: str,
+    *,
+    status: str | None = None,
+    source: str = "google",
 ) -> list[MediaItem]:
-    normalized_child_id = child_id.strip()
-    if not normalized_child_id:
-        return []
-
-    filtered_media_items: list[MediaItem] = []
-    for media_item in media_items:
-        metadata = ctx.stammdaten_manager.get_photo_meta_by_file_id(media_item.id)
-        if not metadata:
-            continue
-        if str(metadata.get("child_id", "")).strip() != normalized_child_id:
-            continue
-        filtered_media_items.append(media_item)
-    return filtered_media_items
+    return _to_media_items(
+        catalog.media_for(child_id, status), child_id=child_id, source=source
+    )
 
 
-def _with_preview_payload(media_items: list[MediaItem]) -> list[MediaItem]:
-    enriched_items: list[MediaItem] = []
-    for media_item in media_items:
-        payload = _get_media_bytes(media_item.id)
-        enriched_items.append(
-            MediaItem(
-                id=media_item.id,
-                child_id=media_item.child_id,
-                name=media_item.name,
-                mime_type=media_item.mime_type,
-                kind=media_item.kind,
-                source=media_item.source,
-                created_time=media_item.created_time,
-                modified_time=media_item.modified_time,
-                thumb_bytes=payload if media_item.is_image else None,
-                preview_bytes=payload,
-                preview_url=media_item.preview_url,
+def _load_ctx_catalog(ctx: MediaPageContext, folder_id: str) -> MediaCatalog:
+    return load_media_catalog(ctx.stammdaten_manager, ctx.drive_agent, folder_id)
+
+
+def _ctx_source(ctx: MediaPageContext) -> str:
+    return str(getattr(ctx.app_config, "storage_mode", "google"))
+
+
+def set_media_statuses(
+    ctx: MediaPageContext,
+    child_id: str,
+    status_by_file_id: dict[str, str],
+    meta_by_file_id: dict[str, dict[str, Any]],
+) -> None:
+    """Setzt mehrere Status mit einem photo_meta- und einem Drive-Batch."""
+    if not status_by_file_id:
+        return
+    patches: dict[str, dict[str, Any]] = {}
+    app_properties: dict[str, dict[str, str]] = {}
+    for file_id, status in status_by_file_id.items():
+        normalized_status = _normalize_photo_status(status)
+        meta = meta_by_file_id.get(file_id, {})
+        patches[file_id] = {
+            "child_id": child_id,
+            "status": normalized_status,
+            "uploaded_by": str(meta.get("uploaded_by", "")) or ctx.user_email,
+            "uploaded_at": str(meta.get("uploaded_at", ""))
+            or datetime.now().isoformat(),
+            "album": str(meta.get("album", "")),
+            "retention_until": str(meta.get("retention_until", "")),
+        }
+        app_properties[file_id] = _media_app_properties(child_id, normalized_status)
+
+    ctx.stammdaten_manager.upsert_photo_meta_many(patches)
+    try:
+        _updated_ids, errors = ctx.drive_agent.update_app_properties(app_properties)
+    except DriveServiceError as exc:
+        LOGGER.warning(
+            "Drive appProperties update failed for %s files: %s",
+            len(app_properties),
+            exc,
+        )
+    else:
+        for file_id, exc in errors.items():
+            LOGGER.warning("Drive appProperties update failed for %s: %s", file_id, exc)
+    _list_media.clear()
+
+
+def schedule_pixelated_variant(folder_id: str, media_item: MediaItem) -> None:
+    """Rendert die verpixelte Download-Variante im Hintergrund vor."""
+    if not media_item.is_image:
+        return
+    get_media_derivative_store(folder_id).prefetch(
+        [(media_item.id, media_item.revision)],
+        pixelated_spec(get_app_config().photos),
+        DriveAgent().fetch_file,
+    )
+
+
+def load_photo_download_bytes(
+    folder_id: str, file_id: str, revision: str, consent_mode: str
+) -> bytes:
+    """Download-Bytes je Consent; die verpixelte Variante kommt aus dem Speicher."""
+    normalized_mode = consent_mode.strip().lower()
+    if normalized_mode not in VALID_CONSENT_MODES:
+        normalized_mode = "pixelated"
+    if normalized_mode == "denied":
+        raise PermissionError("Foto-Download ist für dieses Kind nicht erlaubt.")
+
+    drive_agent = DriveAgent()
+    if normalized_mode == "unpixelated":
+        return drive_agent.fetch_file(file_id)
+    return get_media_derivative_store(folder_id).get(
+        file_id,
+        revision,
+        pixelated_spec(get_app_config().photos),
+        lambda: drive_agent.fetch_file(file_id),
+    )
+
+
+def album_zip_builder(
+    folder_id: str, photos: list[dict[str, Any]], consent_mode: str
+) -> Callable[[], bytes]:
+    """Bereitet den ZIP-Export eines Albums vor; gebaut wird erst beim Aufruf.
+
+    Alle Streamlit-Zugriffe passieren hier, damit der zurückgegebene Callable
+    als ``data`` eines ``st.download_button`` in dessen Worker-Thread laufen kann.
+    """
+    settings = get_app_config().photos
+    spec = pixelated_spec(settings)
+    store = get_media_derivative_store(folder_id)
+    drive_agent = DriveAgent()
+    entries = [
+        AlbumEntry(
+            file_id=str(photo.get("id", "")),
+            name=str(photo.get("name", "photo")),
+            revision=str(photo.get("md5Checksum") or photo.get("modifiedTime") or ""),
+        )
+        for photo in photos
+        if photo.get("id")
+    ]
+
+    def _build() -> bytes:
+        # Verpixelte Ergebnisse direkt übernehmen; nur der Drive-Upload läuft
+        # im Hintergrund, damit der Download nicht darauf wartet.
+        export = write_album_zip(
+            entries,
+            consent_mode=consent_mode,
+            load_original=drive_agent.fetch_file,
+            find_pixelated=lambda entry: store.find(
+                entry.file_id, entry.revision, spec
+            ),
+            store_pixelated=lambda entry, payload: store.put_in_background(
+                entry.file_id, entry.revision, spec, payload
+            ),
+            settings=settings,
+        )
+        if export.skipped:
+            LOGGER.warning(
+                "Album export skipped %s of %s files.",
+                len(export.skipped),
+                len(entries),
             )
+        # Streamlit übernimmt nur Bytes; gelesen wird erst beim Klick.
+        with export.archive as archive:
+            return archive.read()
+
+    return _build
+
+
+def _prefetch_thumbnails(folder_id: str, media_items: list[MediaItem]) -> None:
+    drive_agent = DriveAgent()
+    store = get_media_derivative_store(folder_id)
+    for spec in (THUMBNAIL_SPEC, VIDEO_POSTER_SPEC):
+        store.prefetch(
+            (
+                (media_item.id, media_item.revision)
+                for media_item in media_items
+                if _thumbnail_spec(media_item) is spec
+            ),
+            spec,
+            drive_agent.fetch_file,
         )
-    return enriched_items
+
+
+def _stored_thumbnail(folder_id: str, media_item: MediaItem) -> bytes | None:
+    """Nur lokal vorliegende Thumbnails, ohne Drive-Zugriff im Skript-Thread.
+
+    Drive-Kopien und fehlende Varianten holt bzw. erzeugt der Prefetch im
+    Hintergrund.
+    """
+    try:
+        thumbnail = get_media_derivative_store(folder_id).find_cached(
+            media_item.id, media_item.revision, _thumbnail_spec(media_item)
+        )
+    except OSError as exc:
+        LOGGER.warning("Thumbnail lookup failed for %s: %s", media_item.id, exc)
+        thumbnail = None
+    if thumbnail is None:
+        _prefetch_thumbnails(folder_id, [media_item])
+    return thumbnail
+
+
+def _thumbnail_data_uri(folder_id: str, media_item: MediaItem) -> str | None:
+    thumbnail = _stored_thumbnail(folder_id, media_item)
+    if thumbnail is None:
+        return None
+    return f"data:image/webp;base64,{base64.b64encode(thumbnail).decode('ascii')}"
+
+
+def render_parent_photo_gallery(
+    folder_id: str,
+    child_id: str,
+    media_items: list[MediaItem],
+    consent_mode: str,
+    *,
+    page_size: int = 24,
+) -> None:
+    """Elternansicht: Thumbnail-Seiten, Download-Bytes erst beim Klick.
+
+    Die Seite lädt keine Originale. Solange Thumbnails der sichtbaren Seite
+    im Hintergrund entstehen, läuft das Raster als Fragment alle
+    ``THUMBNAIL_POLL_SECONDS`` erneut und zeigt sie ohne Zutun an. Endgültig
+    gescheiterte Thumbnails plant der Speicher nicht neu ein, damit endet
+    auch das Polling.
+    """
+    if child_id != ss_get(UIKeys.MEDIA_CHILD):
+        ss_set(UIKeys.MEDIA_CHILD, child_id)
+        ss_set(UIKeys.MEDIA_PAGE, 0)
+        ss_set(UIKeys.MEDIA_SELECTED, None)
+
+    run_every = (
+        THUMBNAIL_POLL_SECONDS if ss_get(UIKeys.MEDIA_THUMBNAILS_PENDING) else None
+    )
+    st.fragment(_render_parent_photo_grid, run_every=run_every)(
+        folder_id, media_items, consent_mode, page_size
+    )
+
+
+def _render_parent_photo_grid(
+    folder_id: str, media_items: list[MediaItem], consent_mode: str, page_size: int
+) -> None:
+    missing: list[MediaItem] = []
+
+    def _thumbnail(media_item: MediaItem) -> bytes | None:
+        thumbnail = _stored_thumbnail(folder_id, media_item)
+        if thumbnail is None:
+            missing.append(media_item)
+        return thumbnail
+
+    selected_item = render_media_gallery(
+        media_items,
+        page_size=page_size,
+        thumbnail_loader=_thumbnail,
+        preview_loader=lambda item: _media_preview(folder_id, item),
+        prefetch=lambda items: _prefetch_thumbnails(folder_id, items),
+        show_kind_filter=False,
+    )
+
+    store = get_media_derivative_store(folder_id)
+    pending = any(
+        store.is_pending(item.id, item.revision, _thumbnail_spec(item))
+        for item in missing
+    )
+    if pending != bool(ss_get(UIKeys.MEDIA_THUMBNAILS_PENDING)):
+        # Polling an- bzw. abschalten; ``run_every`` gilt erst ab dem nächsten Lauf.
+        ss_set(UIKeys.MEDIA_THUMBNAILS_PENDING, pending)
+        st.rerun()
+
+    if not selected_item:
+        return
+
+    normalized_mode = consent_mode.strip().lower()
+    if normalized_mode == "denied":
+        st.caption("Download nicht erlaubt / Download not allowed.")
+        return
+    st.download_button(
+        "Foto herunterladen / Download photo",
+        data=partial(
+            load_photo_download_bytes,
+            folder_id,
+            selected_item.id,
+            selected_item.revision,
+            normalized_mode,
+        ),
+        file_name=selected_item.name,
+        mime=selected_item.mime_type,
+        key=f"download_photo_{selected_item.id}_{normalized_mode}",
+    )
 
 
 def render_gallery(ctx: MediaPageContext) -> None:
@@ -234,16 +659,8 @@ def render_gallery(ctx: MediaPageContext) -> None:
             )
             return
 
-        raw_media_items = _list_media(folder_id)
-        media_items = _filter_media_items_for_child(
-            ctx,
-            _to_media_items(
-                raw_media_items,
-                child_id=child_id,
-                source=str(getattr(ctx.app_config, "storage_mode", "google")),
-            ),
-            child_id,
-        )
+        catalog = _load_ctx_catalog(ctx, folder_id)
+        media_items = catalog_media_items(catalog, child_id, source=_ctx_source(ctx))
     except DriveServiceError as exc:
         error_banner(
             "Medien konnten nicht geladen werden. Bitte Drive-Freigaben prüfen.",
@@ -257,7 +674,12 @@ def render_gallery(ctx: MediaPageContext) -> None:
         return
 
     selected_item = render_media_gallery(
-        _with_preview_payload(media_items), page_size=24
+        media_items,
+        page_size=24,
+        thumbnail_loader=lambda item: _media_thumbnail(folder_id, item),
+        preview_loader=lambda item: _media_preview(folder_id, item),
+        prefetch=lambda items: _prefetch_thumbnails(folder_id, items),
+        original_loader=lambda item: ctx.drive_agent.fetch_file(item.id),
     )
     if not selected_item:
         return
@@ -268,17 +690,34 @@ def render_gallery(ctx: MediaPageContext) -> None:
         st.caption(f"MIME: {selected_item.mime_type}")
         st.download_button(
             "Download / Download",
-            data=selected_item.preview_bytes or _get_media_bytes(selected_item.id),
+            data=partial(ctx.drive_agent.fetch_file, selected_item.id),
             file_name=selected_item.name,
             mime=selected_item.mime_type,
             key=f"gallery_download_{selected_item.id}",
         )
 
-        meta = ctx.stammdaten_manager.get_photo_meta_by_file_id(selected_item.id) or {}
+        meta = catalog.meta_for(selected_item.id)
         current_status = _normalize_photo_status(str(meta.get("status", "")))
         st.write(f"Status: **{current_status}**")
 
 
+def _create_upload_derivatives(
+    folder_id: str, upload_result: PhotoUploadResult, *, is_video: bool = False
+) -> None:
+    """Erzeugt Bild- bzw. Videovarianten aus den gespeicherten Bytes."""
+    try:
+        get_media_derivative_store(folder_id).create_all(
+            upload_result.file_id,
+            upload_result.checksum,
+            upload_result.content,
+            VIDEO_DERIVATIVE_SPECS if is_video else IMAGE_DERIVATIVE_SPECS,
+        )
+    except (DriveServiceError, ValueError) as exc:
+        LOGGER.warning(
+            "Derivatives could not be created for %s: %s", upload_result.file_id, exc
+        )
+
+
 def render_upload(ctx: MediaPageContext) -> None:
     page_header("Upload")
     render_onedrive_embed_panel()
@@ -289,11 +728,22 @@ def render_upload(ctx: MediaPageContext) -> None:
         key=UIKeys.MEDIA_UPLOAD_CHILD_SELECT,
     )
 
+    photo_settings = ctx.app_config.photos
     with st.form("photo_upload_form", border=True):
         upload_file = st.file_uploader(
             "Datei auswählen / Select media",
             type=["jpg", "jpeg", "png", "mp4", "mov", "webm"],
         )
+        keep_original = False
+        if photo_settings.normalize_uploads:
+            keep_original = st.checkbox(
+                "Original zusätzlich behalten / Also keep original",
+                value=photo_settings.keep_upload_originals,
+                help=(
+                    "Fotos werden gedreht, verkleinert und ohne GPS gespeichert. / "
+                    "Photos are rotated, downscaled and stored without GPS."
+                ),
+            )
         upload_submitted = st.form_submit_button("Upload / Upload")
 
     if not upload_submitted:
@@ -311,24 +761,50 @@ def render_upload(ctx: MediaPageContext) -> None:
                 "Kein zentraler Medien-Ordner vorhanden. / No central media folder configured."
             )
 
-        file_id = PhotoAgent().upload_photo(upload_file, folder_id)
-        ctx.stammdaten_manager.upsert_photo_meta(
-            file_id,
-            {
-                "child_id": child_id,
-                "album": "",
-                "status": "draft",
-                "uploaded_at": datetime.now().isoformat(),
-                "uploaded_by": ctx.user_email,
-                "retention_until": "",
-            },
+        upload_result = PhotoAgent().upload_photo(
+            upload_file,
+            folder_id,
+            child_id=child_id,
+            settings=photo_settings,
+            keep_original=keep_original,
         )
-
-        _list_media.clear()
-        _get_media_bytes.clear()
-        st.success(
-            "Upload erfolgreich (Status: draft). / Upload successful (status: draft)."
+        file_id = upload_result.file_id
+        existing_meta = (
+            ctx.stammdaten_manager.get_photo_meta_by_file_id(file_id)
+            if upload_result.reused_existing
+            else None
         )
+        if existing_meta:
+            st.info(
+                "Diese Datei ist bereits vorhanden, es wurde nichts erneut "
+                f"hochgeladen (Status: {existing_meta.get('status', 'draft')}). / "
+                "This file already exists, nothing was uploaded again "
+                f"(status: {existing_meta.get('status', 'draft')})."
+            )
+        else:
+            ctx.stammdaten_manager.upsert_photo_meta(
+                file_id,
+                {
+                    "child_id": child_id,
+                    "album": "",
+                    "status": "draft",
+                    "uploaded_at": datetime.now().isoformat(),
+                    "uploaded_by": ctx.user_email,
+                    "retention_until": "",
+                },
+            )
+            _list_media.clear()
+            upload_type = str(upload_file.type or "")
+            if upload_type.startswith(("image/", "video/")):
+                _create_upload_derivatives(
+                    folder_id,
+                    upload_result,
+                    is_video=upload_type.startswith("video/"),
+                )
+            st.success(
+                "Upload erfolgreich (Status: draft). / "
+                "Upload successful (status: draft)."
+            )
         if str(upload_file.type or "").startswith("video/"):
             st.video(upload_file)
         else:
@@ -374,16 +850,37 @@ def render_photo_status(ctx: MediaPageContext) -> None:
         f"[📂 Ordner auf Google Drive öffnen / Open folder on Google Drive]({drive_url})"
     )
 
-    raw_media_items = _list_media(folder_id)
-    media_items = _filter_media_items_for_child(
-        ctx,
-        _to_media_items(
-            raw_media_items,
-            child_id=child_id,
-            source=str(getattr(ctx.app_config, "storage_mode", "google")),
+    catalog = _load_ctx_catalog(ctx, folder_id)
+    if st.button(
+        "Drive-Metadaten mit photo_meta abgleichen / Sync Drive metadata",
+        help=(
+            "Setzt child_id/status als appProperties für Altbestände und "
+            "Abweichungen. / Writes child_id/status appProperties for legacy "
+            "or diverging files."
         ),
-        child_id,
-    )
+        key="media_status_sync_app_properties",
+    ):
+        try:
+            synced_ids, sync_errors = sync_media_app_properties(
+                ctx.drive_agent, catalog
+            )
+        except DriveServiceError as exc:
+            error_banner(
+                "Abgleich der Drive-Metadaten fehlgeschlagen.",
+                "Sync of Drive metadata failed.",
+                details=str(exc),
+            )
+        else:
+            st.success(
+                f"{len(synced_ids)} Dateien aktualisiert. / "
+                f"{len(synced_ids)} files updated."
+            )
+            if sync_errors:
+                st.warning(
+                    f"{len(sync_errors)} Dateien nicht aktualisiert. / "
+                    f"{len(sync_errors)} files not updated."
+                )
+    media_items = catalog_media_items(catalog, child_id, source=_ctx_source(ctx))
     if not media_items:
         st.caption(
             "Keine Medien für das ausgewählte Kind gefunden. / "
@@ -391,40 +888,110 @@ def render_photo_status(ctx: MediaPageContext) -> None:
         )
         return
 
-    for media_item in media_items:
-        meta = ctx.stammdaten_manager.get_photo_meta_by_file_id(media_item.id) or {}
-        current_status = _normalize_photo_status(meta.get("status"))
-        with st.expander(
-            f"{media_item.name} · Status verwalten / Manage status",
-            expanded=False,
-        ):
-            selected_status = st.selectbox(
-                "Status / Status",
-                options=list(PHOTO_STATUS_OPTIONS),
-                index=list(PHOTO_STATUS_OPTIONS).index(current_status),
-                key=f"admin_media_status_{media_item.id}",
+    page_count = -(-len(media_items) // MEDIA_STATUS_PAGE_SIZE)
+    page_index = 0
+    if page_count > 1:
+        page_index = (
+            int(
+                st.number_input(
+                    f"Seite (von {page_count}) / Page (of {page_count})",
+                    min_value=1,
+                    max_value=page_count,
+                    value=1,
+                    step=1,
+                    key=f"media_status_page_{child_id}",
+                )
             )
+            - 1
+        )
+    page_start = page_index * MEDIA_STATUS_PAGE_SIZE
+    # Nur die sichtbare Seite lädt Thumbnails (und plant fehlende vor).
+    media_items = media_items[page_start : page_start + MEDIA_STATUS_PAGE_SIZE]
 
-            media_bytes = _get_media_bytes(media_item.id)
-            if media_item.is_video:
-                st.video(media_bytes)
-            else:
-                st.image(media_bytes, width=320)
+    select_all = st.checkbox(
+        "Alle auf dieser Seite auswählen / Select all on this page",
+        key=f"media_status_select_all_{child_id}_{page_index}",
+    )
+    current_statuses = {
+        media_item.id: _normalize_photo_status(
+            catalog.meta_for(media_item.id).get("status")
+        )
+        for media_item in media_items
+    }
+    selection_df = st.data_editor(
+        pd.DataFrame(
+            [
+                {
+                    "Auswahl / Select": select_all,
+                    "Vorschau / Preview": _thumbnail_data_uri(folder_id, media_item),
+                    "Datei / File": media_item.name,
+                    "Typ / Type": "Video" if media_item.is_video else "Bild / Image",
+                    "Status / Status": current_statuses[media_item.id],
+                }
+                for media_item in media_items
+            ]
+        ),
+        hide_index=True,
+        width="stretch",
+        key=f"media_status_editor_{child_id}_{page_index}_{select_all}",
+        column_config={
+            "Auswahl / Select": st.column_config.CheckboxColumn("Auswahl / Select"),
+            "Vorschau / Preview": st.column_config.ImageColumn("Vorschau / Preview"),
+        },
+        disabled=[
+            "Vorschau / Preview",
+            "Datei / File",
+            "Typ / Type",
+            "Status / Status",
+        ],
+    )
+    selected_items = [
+        media_item
+        for media_item, selected in zip(
+            media_items, selection_df["Auswahl / Select"].tolist(), strict=True
+        )
+        if bool(selected)
+    ]
+
+    target_column, apply_column = st.columns([2, 1])
+    with target_column:
+        target_status = st.selectbox(
+            "Neuer Status / New status",
+            options=list(PHOTO_STATUS_OPTIONS),
+            key=f"media_status_target_{child_id}",
+        )
+    with apply_column:
+        apply_clicked = st.button(
+            f"Status setzen ({len(selected_items)}) / Apply status",
+            disabled=not selected_items,
+            use_container_width=True,
+        )
+    if not apply_clicked:
+        return
 
-            if selected_status == current_status:
-                continue
+    changed_items = [
+        media_item
+        for media_item in selected_items
+        if current_statuses[media_item.id] != target_status
+    ]
+    if not changed_items:
+        st.info("Keine Änderungen. / No changes.")
+        return
 
-            ctx.stammdaten_manager.upsert_photo_meta(
-                media_item.id,
-                {
-                    "child_id": child_id,
-                    "status": selected_status,
-                    "uploaded_by": str(meta.get("uploaded_by", "")) or ctx.user_email,
-                    "uploaded_at": str(meta.get("uploaded_at", ""))
-                    or datetime.now().isoformat(),
-                    "album": str(meta.get("album", "")),
-                    "retention_until": str(meta.get("retention_until", "")),
-                },
-            )
-            st.success("Status aktualisiert. / Status updated.")
-            ctx.trigger_rerun()
+    set_media_statuses(
+        ctx,
+        child_id,
+        {media_item.id: target_status for media_item in changed_items},
+        {
+            media_item.id: catalog.meta_for(media_item.id)
+            for media_item in changed_items
+        },
+    )
+    if target_status == "published":
+        for media_item in changed_items:
+            schedule_pixelated_variant(folder_id, media_item)
+    st.success(
+        f"Status für {len(changed_items)} Medien aktualisiert. / "
+        f"Status updated for {len(changed_items)} media items."
+    )
+    ctx.trigger_rerun()
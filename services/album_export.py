@@ -0,0 +1,131 @@
+"""Album-Export als ZIP mit Consent-abhängiger Verpixelung."""
+
+from __future__ import annotations
+
+import logging
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from tempfile import SpooledTemporaryFile
+
+from config import PhotoConfig
+from services.drive_service import DriveServiceError
+from services.photos_service import VALID_CONSENT_MODES, pixelate_batch
+
+LOGGER = logging.getLogger(__name__)
+ALBUM_SPOOL_MAX_MEMORY = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class AlbumEntry:
+    file_id: str
+    name: str
+    revision: str = ""
+
+
+@dataclass(slots=True)
+class AlbumExport:
+    archive: SpooledTemporaryFile
+    file_count: int = 0
+    skipped: dict[str, str] = field(default_factory=dict)
+
+
+def unique_arcname(name: str, used_names: set[str]) -> str:
+    path = PurePosixPath(name.replace("\\", "_").replace("/", "_") or "photo")
+    candidate = path.name
+    counter = 1
+    while candidate in used_names:
+        candidate = f"{path.stem}_{counter}{path.suffix}"
+        counter += 1
+    used_names.add(candidate)
+    return candidate
+
+
+def write_album_zip(
+    entries: Iterable[AlbumEntry],
+    *,
+    consent_mode: str,
+    load_original: Callable[[str], bytes],
+    find_pixelated: Callable[[AlbumEntry], bytes | None] | None = None,
+    store_pixelated: Callable[[AlbumEntry, bytes], None] | None = None,
+    settings: PhotoConfig | None = None,
+    max_in_flight: int | None = None,
+) -> AlbumExport:
+    """Schreibt ein Album als ZIP in eine gespoolte Temp-Datei.
+
+    ``unpixelated`` übernimmt die Originale, ``pixelated`` nutzt vorhandene
+    Varianten und verpixelt den Rest parallel im Speicher (neu erzeugte
+    Varianten gehen an ``store_pixelated``), ``denied`` ist nicht erlaubt.
+    Dateien, die nicht geladen werden können (``DriveServiceError``,
+    ``OSError``), werden übersprungen und in ``skipped`` gemeldet. Der
+    Aufrufer übernimmt ``archive`` (auf den Anfang gesetzt) und schließt es.
+    """
+    normalized_mode = consent_mode.strip().lower()
+    if normalized_mode not in VALID_CONSENT_MODES:
+        normalized_mode = "pixelated"
+    if normalized_mode == "denied":
+        raise PermissionError("Foto-Download ist für dieses Kind nicht erlaubt.")
+
+    used_names: set[str] = set()
+    entries_by_id: dict[str, AlbumEntry] = {}
+    find_existing = find_pixelated if normalized_mode == "pixelated" else None
+
+    with ExitStack() as cleanup:
+        export = AlbumExport(
+            archive=cleanup.enter_context(
+                SpooledTemporaryFile(max_size=ALBUM_SPOOL_MAX_MEMORY, mode="w+b")
+            )
+        )
+        # JPEG/PNG/Video sind bereits komprimiert; ZIP_STORED spart nur CPU.
+        with zipfile.ZipFile(export.archive, "w", compression=zipfile.ZIP_STORED) as zf:
+
+            def _add(entry: AlbumEntry, payload: bytes) -> None:
+                zf.writestr(unique_arcname(entry.name, used_names), payload)
+                export.file_count += 1
+
+            def _to_pixelate() -> Iterator[tuple[str, bytes]]:
+                for entry in entries:
+                    try:
+                        cached = find_existing(entry) if find_existing else None
+                        if cached is None:
+                            original = load_original(entry.file_id)
+                    except (DriveServiceError, OSError) as exc:
+                        LOGGER.warning(
+                            "Album entry skipped [%s]: %s", entry.file_id, exc
+                        )
+                        export.skipped[entry.file_id] = str(exc)
+                        continue
+                    if cached is not None:
+                        _add(entry, cached)
+                        continue
+                    entries_by_id[entry.file_id] = entry
+                    yield entry.file_id, original
+
+            if normalized_mode == "unpixelated":
+                for file_id, original in _to_pixelate():
+                    _add(entries_by_id.pop(file_id), original)
+            else:
+                for result in pixelate_batch(
+                    _to_pixelate(), settings, max_in_flight=max_in_flight
+                ):
+                    entry = entries_by_id.pop(result.key)
+                    if not result.ok or result.data is None:
+                        export.skipped[entry.file_id] = str(result.error)
+                        continue
+                    _add(entry, result.data)
+                    if store_pixelated is not None:
+                        try:
+                            store_pixelated(entry, result.data)
+                        except OSError as exc:
+                            LOGGER.warning(
+                                "Pixelated variant not stored [%s]: %s",
+                                entry.file_id,
+                                exc,
+                            )
+
+        export.archive.seek(0)
+        # Erfolgreich geschrieben: Der Spool gehört jetzt dem Aufrufer.
+        cleanup.pop_all()
+    return export
@@ -0,0 +1,165 @@
+"""Hintergrund-Jobs für die Dokumentenerstellung (OpenAI + DOCX)."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import partial
+from tempfile import SpooledTemporaryFile
+from typing import Literal
+
+import streamlit as st
+
+LOGGER = logging.getLogger(__name__)
+DOCUMENT_JOB_WORKERS = 3
+MAX_FINISHED_JOBS = 50
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentJobResult:
+    """Ergebnis eines Jobs; große ZIPs bleiben als ``archive`` im Spool.
+
+    ``archive`` wird erst beim Download gelesen und beim Verwerfen des Jobs
+    geschlossen.
+    """
+
+    doc_bytes: bytes
+    file_name: str
+    notice: str = ""
+    archive: SpooledTemporaryFile | None = None
+
+    def download_data(self) -> bytes | Callable[[], bytes]:
+        """``data`` für ``st.download_button``: Spool-Inhalte erst beim Klick."""
+        if self.archive is None:
+            return self.doc_bytes
+        return self._read_archive
+
+    def _read_archive(self) -> bytes:
+        if self.archive is None:
+            return self.doc_bytes
+        self.archive.seek(0)
+        return self.archive.read()
+
+    def close(self) -> None:
+        if self.archive is not None:
+            self.archive.close()
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentJob:
+    job_id: str
+    label: str
+    status: JobStatus = "queued"
+    submitted_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: DocumentJobResult | None = None
+    error: str = ""
+    preview: str = ""
+
+    @property
+    def pending(self) -> bool:
+        return self.status in {"queued", "running"}
+
+
+class DocumentJobQueue:
+    """Führt Dokument-Jobs in einem Thread-Pool aus; Abruf per ``job_id``.
+
+    Jobs sind unveränderliche Snapshots, der Zustand wird unter einer Sperre
+    ersetzt. Fertige Jobs werden bis ``max_finished`` vorgehalten, die ältesten
+    fallen zuerst heraus. Mit ``with_progress`` erhält der Task einen
+    ``on_progress``-Callback, dessen Text als ``preview`` am Job erscheint.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DOCUMENT_JOB_WORKERS,
+        max_finished: int = MAX_FINISHED_JOBS,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="document-job"
+        )
+        self._jobs: dict[str, DocumentJob] = {}
+        self._lock = threading.Lock()
+        self._max_finished = max_finished
+
+    def submit(
+        self,
+        label: str,
+        task: Callable[..., DocumentJobResult],
+        *,
+        with_progress: bool = False,
+    ) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = DocumentJob(
+                job_id=job_id, label=label, submitted_at=datetime.now()
+            )
+        if with_progress:
+            task = partial(task, on_progress=partial(self._set_preview, job_id))
+        self._executor.submit(self._run, job_id, task)
+        return job_id
+
+    def _update(self, job_id: str, **changes: object) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs[job_id] = replace(job, **changes)
+
+    def _set_preview(self, job_id: str, preview: str) -> None:
+        self._update(job_id, preview=preview)
+
+    def _run(self, job_id: str, task: Callable[[], DocumentJobResult]) -> None:
+        self._update(job_id, status="running")
+        try:
+            result = task()
+        # Grenze des Worker-Threads: Jeder Fehler muss den Job als ``failed``
+        # markieren, sonst bliebe er für die Session dauerhaft ``running``.
+        except Exception as exc:
+            LOGGER.warning("Document job failed [%s]: %s", job_id, exc, exc_info=True)
+            self._update(
+                job_id, status="failed", error=str(exc), finished_at=datetime.now()
+            )
+        else:
+            self._update(
+                job_id, status="done", result=result, finished_at=datetime.now()
+            )
+        self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if not job.pending),
+                key=lambda job: job.finished_at or datetime.min,
+            )
+            for job in finished[: max(0, len(finished) - self._max_finished)]:
+                del self._jobs[job.job_id]
+                if job.result is not None:
+                    job.result.close()
+
+    def get(self, job_id: str) -> DocumentJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, job_ids: list[str]) -> list[DocumentJob]:
+        """Jobs in der Reihenfolge von ``job_ids``; unbekannte IDs entfallen."""
+        with self._lock:
+            return [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs]
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None and job.result is not None:
+            job.result.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_document_job_queue() -> DocumentJobQueue:
+    """Prozessweite Job-Queue; Sessions merken sich nur ihre ``job_id``s."""
+    return DocumentJobQueue()
@@ -0,0 +1,92 @@
+"""Vorkompilierte DOCX-Vorlagen mit ``{{platzhalter}}``-Feldern."""
+
+from __future__ import annotations
+
+import re
+import zipfile
+from collections.abc import Mapping
+from dataclasses import dataclass
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from docx.document import Document as DocumentObject
+
+DOCUMENT_PART = "word/document.xml"
+_PARAGRAPH_PATTERN = re.compile(r"<w:p(?:\s[^>]*?)?(?:/>|>.*?</w:p>)", re.DOTALL)
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([a-z_]+)\}\}")
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_LINE_BREAK_XML = '</w:t><w:br/><w:t xml:space="preserve">'
+# In XML 1.0 unzulässig (z. B. \x0b aus Word-Zeilenumbrüchen); Word verweigert
+# sonst das Öffnen des Dokuments.
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _escape_value(value: str) -> str:
+    cleaned = _INVALID_XML_CHARS.sub("", value)
+    return escape(cleaned).replace("\n", _LINE_BREAK_XML)
+
+
+@dataclass(frozen=True, slots=True)
+class DocxTemplate:
+    """Einmal gebaute Vorlage; beim Füllen wird nur ``document.xml`` ersetzt.
+
+    Alle übrigen Teile (Styles, Logo, Einstellungen) werden unverändert in
+    das neue Archiv kopiert. Absätze, die nur aus einem Platzhalter mit
+    leerem Wert bestehen, entfallen (z. B. der Entwurfsvermerk).
+    """
+
+    parts: tuple[tuple[str, bytes], ...]
+    document_xml: str
+
+    @classmethod
+    def from_document(cls, document: DocumentObject) -> DocxTemplate:
+        buffer = BytesIO()
+        document.save(buffer)
+        with zipfile.ZipFile(buffer) as archive:
+            parts = tuple(
+                (name, archive.read(name))
+                for name in archive.namelist()
+                if name != DOCUMENT_PART
+            )
+            document_xml = archive.read(DOCUMENT_PART).decode("utf-8")
+        return cls(parts=parts, document_xml=document_xml)
+
+    def placeholders(self) -> set[str]:
+        return set(_PLACEHOLDER_PATTERN.findall(self.document_xml))
+
+    def _fill_xml(self, values: Mapping[str, str]) -> str:
+        missing = self.placeholders() - set(values)
+        if missing:
+            raise ValueError(
+                f"Vorlage: fehlende Werte für {', '.join(sorted(missing))}."
+            )
+
+        def _fill_paragraph(match: re.Match[str]) -> str:
+            paragraph_xml = match.group(0)
+            if "{{" not in paragraph_xml:
+                return paragraph_xml
+            text = _TAG_PATTERN.sub("", paragraph_xml)
+            only_placeholder = _PLACEHOLDER_PATTERN.fullmatch(text)
+            if only_placeholder and not values[only_placeholder.group(1)]:
+                return ""
+            return _PLACEHOLDER_PATTERN.sub(
+                lambda field: _escape_value(str(values[field.group(1)])),
+                paragraph_xml,
+            )
+
+        return _PARAGRAPH_PATTERN.sub(_fill_paragraph, self.document_xml)
+
+    def render(self, values: Mapping[str, str]) -> bytes:
+        """Erzeugt ein DOCX mit gefüllten Platzhaltern."""
+        output = BytesIO()
+        with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(DOCUMENT_PART, self._fill_xml(values))
+            for name, payload in self.parts:
+                # Bilder sind bereits komprimiert; erneutes Deflate kostet nur CPU.
+                compression = (
+                    zipfile.ZIP_STORED
+                    if name.startswith("word/media/")
+                    else zipfile.ZIP_DEFLATED
+                )
+                archive.writestr(name, payload, compress_type=compression)
+        return output.getvalue()
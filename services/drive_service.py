@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from io import BytesIO
 from typing import Any
 
@@ -10,6 +12,17 @@ from googleapiclient.http import MediaIoBaseUpload
 from config import get_app_config
 from services.google_clients import get_drive_client
 
+DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+DRIVE_BATCH_MAX_REQUESTS = 100
+DEFAULT_METADATA_FIELDS = "id, name, mimeType, modifiedTime, parents, trashed"
+LIST_FILE_FIELDS = "id, name, mimeType, modifiedTime, md5Checksum, appProperties"
+PAGED_LIST_FIELDS = (
+    "id, name, mimeType, modifiedTime, thumbnailLink, md5Checksum, appProperties"
+)
+FOLDER_ACCESS_FIELDS = (
+    "id, name, mimeType, capabilities(canListChildren, canAddChildren)"
+)
+
 
 class DriveServiceError(RuntimeError):
     """Domänenspezifischer Fehler für Drive-Zugriffe."""
@@ -49,14 +62,145 @@ def translate_http_error(exc: HttpError) -> DriveServiceError:
     )
 
 
-def create_folder(name: str, parent_id: str | None = None) -> str:
+@dataclass(slots=True)
+class DriveBatchResult:
+    """Ergebnis eines gebündelten Drive-Aufrufs, je Request-Schlüssel."""
+
+    responses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[str, DriveServiceError] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _execute_batch(requests: Mapping[str, Any]) -> DriveBatchResult:
+    """Führt Drive-Requests über ``BatchHttpRequest`` in Blöcken zu 100 aus."""
+    result = DriveBatchResult()
+    if not requests:
+        return result
+
+    def _collect(request_id: str, response: Any, exception: Exception | None) -> None:
+        if exception is None:
+            result.responses[request_id] = (
+                response if isinstance(response, dict) else {}
+            )
+        elif isinstance(exception, HttpError):
+            result.errors[request_id] = translate_http_error(exception)
+        else:
+            result.errors[request_id] = DriveServiceError(
+                f"Drive API Fehler: {exception}",
+                cause="api_error",
+            )
+
     drive = get_drive_client()
-    metadata: dict[str, Any] = {
-        "name": name,
-        "mimeType": "application/vnd.google-apps.folder",
-    }
+    request_items = list(requests.items())
+    for start in range(0, len(request_items), DRIVE_BATCH_MAX_REQUESTS):
+        batch = drive.new_batch_http_request(callback=_collect)
+        for request_id, request in request_items[
+            start : start + DRIVE_BATCH_MAX_REQUESTS
+        ]:
+            batch.add(request, request_id=request_id)
+        try:
+            batch.execute()
+        except HttpError as exc:
+            raise translate_http_error(exc) from exc
+    return result
+
+
+def _folder_metadata(name: str, parent_id: str | None) -> dict[str, Any]:
+    metadata: dict[str, Any] = {"name": name, "mimeType": DRIVE_FOLDER_MIME_TYPE}
     if parent_id:
         metadata["parents"] = [parent_id]
+    return metadata
+
+
+def _unique_ids(file_ids: Iterable[str]) -> list[str]:
+    return list(
+        dict.fromkeys(
+            str(file_id).strip() for file_id in file_ids if str(file_id).strip()
+        )
+    )
+
+
+def batch_create_folders(
+    names_by_key: Mapping[str, str],
+    parent_id: str | None = None,
+) -> DriveBatchResult:
+    """Legt mehrere Ordner in einem Batch an (Schlüssel -> ``{"id": ...}``)."""
+    drive = get_drive_client()
+    return _execute_batch(
+        {
+            key: drive.files().create(
+                body=_folder_metadata(name, parent_id),
+                fields="id",
+                supportsAllDrives=True,
+            )
+            for key, name in names_by_key.items()
+        }
+    )
+
+
+def batch_get_metadata(
+    file_ids: Iterable[str],
+    fields: str = DEFAULT_METADATA_FIELDS,
+) -> DriveBatchResult:
+    """Lädt Metadaten mehrerer Dateien gebündelt (Schlüssel = File-ID)."""
+    drive = get_drive_client()
+    return _execute_batch(
+        {
+            file_id: drive.files().get(
+                fileId=file_id,
+                fields=fields,
+                supportsAllDrives=True,
+            )
+            for file_id in _unique_ids(file_ids)
+        }
+    )
+
+
+def batch_trash_files(file_ids: Iterable[str]) -> DriveBatchResult:
+    """Verschiebt mehrere Dateien gebündelt in den Papierkorb."""
+    drive = get_drive_client()
+    return _execute_batch(
+        {
+            file_id: drive.files().update(
+                fileId=file_id,
+                body={"trashed": True},
+                fields="id, trashed",
+                supportsAllDrives=True,
+            )
+            for file_id in _unique_ids(file_ids)
+        }
+    )
+
+
+def batch_check_folder_access(folder_ids: Iterable[str]) -> DriveBatchResult:
+    """Prüft Lese-/Schreibrechte mehrerer Ordner mit einem Batch-Aufruf."""
+    result = batch_get_metadata(folder_ids, fields=FOLDER_ACCESS_FIELDS)
+    for folder_id, metadata in list(result.responses.items()):
+        capabilities = metadata.get("capabilities") or {}
+        if metadata.get("mimeType") != DRIVE_FOLDER_MIME_TYPE:
+            result.errors[folder_id] = DriveServiceError(
+                "Die konfigurierte ID verweist nicht auf einen Drive-Ordner.",
+                cause="not_a_folder",
+            )
+        elif not capabilities.get("canListChildren", False):
+            result.errors[folder_id] = DriveServiceError(
+                "Kein Lesezugriff auf den Drive-Ordner. Bitte den Zielordner mit "
+                "dem Service-Account teilen.",
+                status_code=403,
+                cause="forbidden",
+            )
+        else:
+            continue
+        del result.responses[folder_id]
+    return result
+
+
+def create_folder(name: str, parent_id: str | None = None) -> str:
+    drive = get_drive_client()
+    metadata = _folder_metadata(name, parent_id)
 
     try:
         created = (
@@ -84,6 +228,7 @@ def upload_bytes_to_folder(
     filename: str,
     file_bytes: bytes,
     mime_type: str,
+    app_properties: Mapping[str, str] | None = None,
 ) -> str:
     drive = get_drive_client()
     media = MediaIoBaseUpload(BytesIO(file_bytes), mimetype=mime_type, resumable=False)
@@ -91,6 +236,8 @@ def upload_bytes_to_folder(
     metadata: dict[str, Any] = {"name": filename}
     if folder_id:
         metadata["parents"] = [folder_id]
+    if app_properties:
+        metadata["appProperties"] = dict(app_properties)
 
     try:
         created = (
@@ -109,44 +256,110 @@ def upload_bytes_to_folder(
     return created["id"]
 
 
-def list_files_in_folder(
-    folder_id: str,
-    mime_type_filter: str | None = None,
-) -> list[dict[str, Any]]:
+def copy_file(
+    file_id: str,
+    folder_id: str | None,
+    filename: str,
+    app_properties: Mapping[str, str] | None = None,
+) -> str:
+    """Kopiert eine Datei serverseitig (ohne erneute Übertragung der Inhalte)."""
     drive = get_drive_client()
+    metadata: dict[str, Any] = {"name": filename}
+    if folder_id:
+        metadata["parents"] = [folder_id]
+    if app_properties:
+        metadata["appProperties"] = dict(app_properties)
+
+    try:
+        copied = (
+            drive.files()
+            .copy(
+                fileId=file_id,
+                body=metadata,
+                fields="id, name",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+    except HttpError as exc:
+        raise translate_http_error(exc) from exc
+
+    return copied["id"]
+
+
+def _escape_query_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _folder_query(folder_id: str, mime_type_filter: str | None) -> str:
     q = f"'{folder_id}' in parents and trashed = false"
 
-    normalized_filter = (mime_type_filter or "").strip().lower()
-    query_filter = normalized_filter.rstrip("/")
+    query_filter = (mime_type_filter or "").strip().lower().rstrip("/")
     if query_filter:
         q += f" and mimeType contains '{query_filter}'"
+    return q
 
-    files: list[dict[str, Any]] = []
-    page_token: str | None = None
 
+def list_files_page(
+    folder_id: str,
+    *,
+    page_size: int = 24,
+    page_token: str | None = None,
+    mime_type_filter: str | None = None,
+    fields: str = PAGED_LIST_FIELDS,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Lädt genau eine Listing-Seite und liefert Dateien plus nächsten Page-Token."""
+    drive = get_drive_client()
     try:
-        while True:
-            res = (
-                drive.files()
-                .list(
-                    q=q,
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime)",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
-                    corpora="allDrives",
-                    pageSize=1000,
-                    orderBy="modifiedTime desc",
-                    pageToken=page_token,
-                )
-                .execute()
+        res = (
+            drive.files()
+            .list(
+                q=_folder_query(folder_id, mime_type_filter),
+                fields=f"nextPageToken, files({fields})",
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True,
+                corpora="allDrives",
+                pageSize=page_size,
+                orderBy="modifiedTime desc",
+                pageToken=page_token,
             )
-            files.extend(res.get("files", []))
-            page_token = res.get("nextPageToken")
-            if not page_token:
-                break
+            .execute()
+        )
     except HttpError as exc:
         raise translate_http_error(exc) from exc
 
+    files = filter_files_by_mime_type(res.get("files", []), mime_type_filter)
+    return files, res.get("nextPageToken")
+
+
+def list_files_in_folder(
+    folder_id: str,
+    mime_type_filter: str | None = None,
+) -> list[dict[str, Any]]:
+    """Listet alle Dateien eines Ordners seitenweise (1000 Einträge je Request)."""
+    files: list[dict[str, Any]] = []
+    page_token: str | None = None
+
+    while True:
+        page_files, page_token = list_files_page(
+            folder_id,
+            page_size=1000,
+            page_token=page_token,
+            mime_type_filter=mime_type_filter,
+            fields=LIST_FILE_FIELDS,
+        )
+        files.extend(page_files)
+        if not page_token:
+            break
+    return files
+
+
+def filter_files_by_mime_type(
+    files: list[dict[str, Any]],
+    mime_type_filter: str | None,
+) -> list[dict[str, Any]]:
+    """Filtert Drive-Listeneinträge nach MIME-Präfix (``image/``) oder Teilstring."""
+    normalized_filter = (mime_type_filter or "").strip().lower()
     if not normalized_filter:
         return files
 
@@ -164,8 +377,51 @@ def list_files_in_folder(
     ]
 
 
+def update_app_properties(
+    file_id: str,
+    app_properties: Mapping[str, str],
+) -> dict[str, Any]:
+    drive = get_drive_client()
+    try:
+        return (
+            drive.files()
+            .update(
+                fileId=file_id,
+                body={"appProperties": dict(app_properties)},
+                fields="id, appProperties",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+    except HttpError as exc:
+        raise translate_http_error(exc) from exc
+
+
+def batch_update_app_properties(
+    app_properties_by_file_id: Mapping[str, Mapping[str, str]],
+) -> DriveBatchResult:
+    """Setzt appProperties mehrerer Dateien gebündelt (vorhandene Keys bleiben)."""
+    drive = get_drive_client()
+    return _execute_batch(
+        {
+            file_id: drive.files().update(
+                fileId=file_id,
+                body={"appProperties": dict(app_properties)},
+                fields="id, appProperties",
+                supportsAllDrives=True,
+            )
+            for file_id, app_properties in app_properties_by_file_id.items()
+        }
+    )
+
+
 @st.cache_data(show_spinner=False)
 def download_file(file_id: str) -> bytes:
+    return fetch_file_bytes(file_id)
+
+
+def fetch_file_bytes(file_id: str) -> bytes:
+    """Lädt Dateiinhalte ohne Streamlit-Cache (auch aus Hintergrund-Threads)."""
     drive = get_drive_client()
     try:
         request = drive.files().get_media(fileId=file_id, supportsAllDrives=True)
@@ -0,0 +1,146 @@
+"""Inkrementelle Spiegelung eines Drive-Ordners über den Changes-Feed."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+import streamlit as st
+from googleapiclient.errors import HttpError
+
+from services.drive_service import (
+    LIST_FILE_FIELDS,
+    filter_files_by_mime_type,
+    list_files_in_folder,
+    translate_http_error,
+)
+from services.google_clients import get_drive_client
+
+LOGGER = logging.getLogger(__name__)
+CHANGES_PAGE_SIZE = 1000
+CHANGE_FIELDS = (
+    "nextPageToken, newStartPageToken, "
+    f"changes(fileId, removed, file({LIST_FILE_FIELDS}, parents, trashed))"
+)
+
+
+class DriveFolderMirror:
+    """Hält das Listing eines Ordners lokal vor und wendet nur Deltas an.
+
+    Der erste Zugriff liest den Ordner einmal vollständig; danach werden über
+    ``changes.list`` nur geänderte Dateien übertragen. Ungültige Tokens führen
+    zu einem vollständigen Neuaufbau.
+    """
+
+    def __init__(self, folder_id: str) -> None:
+        self.folder_id = folder_id
+        self._files: dict[str, dict[str, Any]] = {}
+        self._page_token: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._page_token is not None
+
+    def _resync(self) -> None:
+        drive = get_drive_client()
+        try:
+            start_token = (
+                drive.changes()
+                .getStartPageToken(supportsAllDrives=True)
+                .execute()
+                .get("startPageToken")
+            )
+        except HttpError as exc:
+            raise translate_http_error(exc) from exc
+
+        self._files = {
+            str(item.get("id", "")): item
+            for item in list_files_in_folder(self.folder_id)
+            if item.get("id")
+        }
+        self._page_token = start_token
+
+    def _apply_change(self, change: dict[str, Any]) -> None:
+        file_id = str(change.get("fileId", "")).strip()
+        if not file_id:
+            return
+
+        file_metadata = change.get("file") or {}
+        in_folder = self.folder_id in (file_metadata.get("parents") or [])
+        if change.get("removed") or file_metadata.get("trashed") or not in_folder:
+            self._files.pop(file_id, None)
+            return
+
+        self._files[file_id] = {
+            key: value
+            for key, value in file_metadata.items()
+            if key not in {"parents", "trashed"}
+        }
+
+    def _pull_changes(self) -> int:
+        drive = get_drive_client()
+        page_token = self._page_token
+        applied_changes = 0
+        while page_token:
+            try:
+                response = (
+                    drive.changes()
+                    .list(
+                        pageToken=page_token,
+                        fields=CHANGE_FIELDS,
+                        pageSize=CHANGES_PAGE_SIZE,
+                        spaces="drive",
+                        supportsAllDrives=True,
+                        includeItemsFromAllDrives=True,
+                        includeRemoved=True,
+                    )
+                    .execute()
+                )
+            except HttpError as exc:
+                status = int(getattr(exc.resp, "status", 0) or 0)
+                if status in {400, 404, 410}:
+                    LOGGER.info(
+                        "Drive changes token invalid [status=%s], resyncing folder.",
+                        status,
+                    )
+                    self._resync()
+                    return len(self._files)
+                raise translate_http_error(exc) from exc
+
+            for change in response.get("changes", []):
+                self._apply_change(change)
+                applied_changes += 1
+
+            new_start_token = response.get("newStartPageToken")
+            if new_start_token:
+                self._page_token = new_start_token
+                break
+            page_token = response.get("nextPageToken")
+        return applied_changes
+
+    def refresh(self) -> int:
+        """Aktualisiert den Spiegel und liefert die Anzahl verarbeiteter Änderungen."""
+        with self._lock:
+            if not self.is_initialized:
+                self._resync()
+                return len(self._files)
+            return self._pull_changes()
+
+    def list_files(
+        self,
+        mime_type_filter: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Liefert das Ordner-Listing wie ``list_files_in_folder`` (neueste zuerst)."""
+        self.refresh()
+        with self._lock:
+            files = [dict(item) for item in self._files.values()]
+        files.sort(key=lambda item: str(item.get("modifiedTime", "")), reverse=True)
+        return filter_files_by_mime_type(files, mime_type_filter)
+
+
+@st.cache_resource(show_spinner=False)
+def get_folder_mirror(folder_id: str) -> DriveFolderMirror:
+    """Prozessweiter Spiegel je Ordner-ID (geteilt zwischen Sessions)."""
+    return DriveFolderMirror(folder_id)
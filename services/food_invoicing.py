@@ -0,0 +1,174 @@
+"""Monatliche Sammelabrechnung der Lebensmittelpauschale."""
+
+from __future__ import annotations
+
+import logging
+import zipfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from io import BytesIO
+from typing import Any
+
+import pandas as pd
+
+from services.album_export import unique_arcname
+from services.drive_service import DriveServiceError
+
+LOGGER = logging.getLogger(__name__)
+DAYS_PER_MONTH = 30.0
+INVOICE_UPLOAD_WORKERS = 4
+BILLABLE_STATUSES = frozenset({"", "active"})
+LEDGER_COLUMNS = [
+    "child_id",
+    "child_name",
+    "parent_email",
+    "folder_id",
+    "billable_from",
+    "billable_to",
+    "days",
+    "daily_amount_eur",
+    "total_amount_eur",
+]
+
+InvoiceRenderer = Callable[[dict[str, Any]], tuple[bytes, str]]
+InvoiceUploader = Callable[[str, bytes, str], str | None]
+
+
+@dataclass(slots=True)
+class InvoiceBatch:
+    ledger: pd.DataFrame
+    archive: bytes
+    upload_errors: list[str] = field(default_factory=list)
+
+    @property
+    def invoice_count(self) -> int:
+        return len(self.ledger)
+
+
+def compute_invoice_ledger(
+    children: Iterable[dict[str, Any]],
+    period_start: date,
+    period_end: date,
+    monthly_amount_eur: float,
+) -> pd.DataFrame:
+    """Berechnet Tage und Beträge aller abrechenbaren Kinder in einem Durchlauf.
+
+    Abgerechnet werden Kinder mit Status ``active`` (oder ohne Status). Liegt
+    ``start_date`` im Zeitraum, beginnt die Abrechnung an diesem Tag; Kinder
+    mit späterem Betreuungsbeginn entfallen.
+    """
+    if period_end < period_start:
+        raise ValueError(
+            "Das Enddatum muss nach dem Startdatum liegen. / "
+            "End date must be after start date."
+        )
+    frame = pd.DataFrame(list(children)).reindex(
+        columns=["id", "name", "parent_email", "folder_id", "start_date", "status"]
+    )
+    frame = frame.fillna("").astype(str).apply(lambda column: column.str.strip())
+
+    period_start_ts = pd.Timestamp(period_start)
+    start_dates = pd.to_datetime(
+        frame["start_date"], format="%Y-%m-%d", errors="coerce"
+    )
+    billable_from = start_dates.where(start_dates > period_start_ts, period_start_ts)
+    days = (pd.Timestamp(period_end) - billable_from).dt.days + 1
+    daily_amount_eur = monthly_amount_eur / DAYS_PER_MONTH
+
+    billable = frame["status"].str.lower().isin(BILLABLE_STATUSES) & (days > 0)
+    ledger = pd.DataFrame(
+        {
+            "child_id": frame["id"],
+            "child_name": frame["name"].replace("", "Kind"),
+            "parent_email": frame["parent_email"],
+            "folder_id": frame["folder_id"],
+            "billable_from": billable_from.dt.strftime("%Y-%m-%d"),
+            "billable_to": period_end.isoformat(),
+            "days": days.astype("int64"),
+            "daily_amount_eur": round(daily_amount_eur, 2),
+            "total_amount_eur": (days * daily_amount_eur).round(2),
+        },
+        columns=LEDGER_COLUMNS,
+    )
+    return ledger[billable].reset_index(drop=True)
+
+
+def _upload_invoices(
+    ledger: pd.DataFrame,
+    documents: list[bytes],
+    upload: InvoiceUploader,
+    max_workers: int,
+) -> tuple[list[str], list[str]]:
+    file_ids = [""] * len(documents)
+    errors: list[str] = []
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="invoice-upload"
+    ) as executor:
+        futures: dict[Future[str | None], tuple[int, str]] = {}
+        for index, row in enumerate(ledger.itertuples(index=False)):
+            if not row.folder_id:
+                errors.append(f"{row.child_name}: kein Drive-Ordner")
+                continue
+            future = executor.submit(
+                upload, row.file_name, documents[index], row.folder_id
+            )
+            futures[future] = (index, row.child_name)
+        for future, (index, child_name) in futures.items():
+            try:
+                file_ids[index] = future.result() or ""
+            except (DriveServiceError, OSError) as exc:
+                LOGGER.warning("Invoice upload failed [%s]: %s", child_name, exc)
+                errors.append(f"{child_name}: {exc}")
+    return file_ids, errors
+
+
+def run_invoice_batch(
+    ledger: pd.DataFrame,
+    render: InvoiceRenderer,
+    *,
+    upload: InvoiceUploader | None = None,
+    max_upload_workers: int = INVOICE_UPLOAD_WORKERS,
+    ledger_name: str = "Abrechnung",
+) -> InvoiceBatch:
+    """Erstellt alle Rechnungen und bündelt sie mit CSV-/JSON-Ledger als ZIP.
+
+    ``render`` erhält je Ledger-Zeile ein Dict und liefert ``(bytes, name)``;
+    ``upload(name, bytes, folder_id)`` wird parallel ausgeführt; dabei
+    auftretende ``DriveServiceError``/``OSError`` landen in ``upload_errors``.
+    """
+    ledger = ledger.copy()
+    documents: list[bytes] = []
+    file_names: list[str] = []
+    for row in ledger.to_dict("records"):
+        doc_bytes, file_name = render(row)
+        documents.append(doc_bytes)
+        file_names.append(file_name)
+    ledger["file_name"] = file_names
+
+    upload_errors: list[str] = []
+    if upload is not None:
+        file_ids, upload_errors = _upload_invoices(
+            ledger, documents, upload, max_upload_workers
+        )
+        ledger["drive_file_id"] = file_ids
+
+    output = BytesIO()
+    used_names: set[str] = set()
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as zf:
+        for doc_bytes, file_name in zip(documents, file_names, strict=True):
+            zf.writestr(unique_arcname(file_name, used_names), doc_bytes)
+        zf.writestr(
+            f"{ledger_name}.csv",
+            ledger.to_csv(index=False).encode("utf-8-sig"),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        zf.writestr(
+            f"{ledger_name}.json",
+            ledger.to_json(orient="records", force_ascii=False, indent=2),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+    return InvoiceBatch(
+        ledger=ledger, archive=output.getvalue(), upload_errors=upload_errors
+    )
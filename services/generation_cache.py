@@ -0,0 +1,97 @@
+"""Persistenter Cache für KI-Antworten, adressiert über einen Prompt-Fingerprint."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+def generation_cache_key(
+    *,
+    model: str,
+    reasoning_effort: str,
+    tools: list[dict[str, Any]],
+    system_prompt: str,
+    user_prompt: str,
+) -> str:
+    """SHA-256 über alle Eingaben, die die Antwort beeinflussen."""
+    fingerprint = json.dumps(
+        {
+            "model": model,
+            "reasoning_effort": reasoning_effort,
+            "tools": tools,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """Speichert Antworten als JSON-Dateien mit Ablaufzeit und Obergrenze.
+
+    Abgelaufene Einträge werden beim Lesen entfernt; wird ``max_entries``
+    überschritten, fallen die ältesten Dateien heraus.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, str] | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Generation cache entry unreadable [%s]: %s", key, exc)
+            path.unlink(missing_ok=True)
+            return None
+        if self._clock() - float(entry.get("created_at", 0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        value = entry.get("value")
+        return dict(value) if isinstance(value, dict) else None
+
+    def put(self, key: str, value: dict[str, str]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        temp_path.write_text(
+            json.dumps({"created_at": self._clock(), "value": value}),
+            encoding="utf-8",
+        )
+        temp_path.replace(path)
+        self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            entries = sorted(
+                self.cache_dir.glob("*.json"), key=lambda item: item.stat().st_mtime
+            )
+            for stale_path in entries[: max(0, len(entries) - self.max_entries)]:
+                stale_path.unlink(missing_ok=True)
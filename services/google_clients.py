@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
+import weakref
+from dataclasses import dataclass
 from typing import Any
 
+import google_auth_httplib2
+import httplib2
 import streamlit as st
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -10,25 +15,167 @@ from config import get_app_config
 
 DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
 SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+DEFAULT_POOL_MAX_IDLE = 8
+HTTP_TIMEOUT_SECONDS = 60
 
 
 def _sa_info() -> dict[str, Any]:
     return get_app_config().google.service_account
 
 
+class _SharedCredentials:
+    """Teilt ein Service-Account-Credential zwischen allen Transports eines Pools.
+
+    Refresh und Token-Zugriff sind serialisiert, sodass parallel laufende
+    Transports nicht gleichzeitig neue Tokens anfordern.
+    """
+
+    def __init__(self, credentials: service_account.Credentials) -> None:
+        self._credentials = credentials
+        self._lock = threading.Lock()
+
+    def before_request(
+        self, request: Any, method: str, url: str, headers: dict[str, str]
+    ) -> None:
+        with self._lock:
+            self._credentials.before_request(request, method, url, headers)
+
+    def refresh(self, request: Any) -> None:
+        with self._lock:
+            self._credentials.refresh(request)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._credentials, name)
+
+
+@dataclass(slots=True, frozen=True)
+class ClientPoolStats:
+    service: str
+    created: int
+    idle: int
+    in_use: int
+    checkouts: int
+    reused: int
+
+
+class GoogleClientPool:
+    """Pool von API-Clients mit jeweils eigenem ``AuthorizedHttp``-Transport.
+
+    httplib2 ist nicht thread-sicher; jeder ausgegebene Client besitzt daher
+    seinen eigenen Transport, während die Credentials (und damit der
+    Token-Refresh) geteilt werden. Clients werden per :meth:`thread_client`
+    für die Dauer eines Threads gebunden (auch in Worker-Pools) und wandern
+    danach in den Leerlauf-Pool zurück.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        version: str,
+        scopes: list[str],
+        *,
+        max_idle: int = DEFAULT_POOL_MAX_IDLE,
+    ) -> None:
+        self.service_name = service_name
+        self.version = version
+        self.max_idle = max_idle
+        self._credentials = _SharedCredentials(
+            service_account.Credentials.from_service_account_info(
+                _sa_info(),
+                scopes=scopes,
+            )
+        )
+        self._idle: list[Any] = []
+        self._lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._created = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._reused = 0
+
+    def _build_client(self) -> Any:
+        authorized_http = google_auth_httplib2.AuthorizedHttp(
+            self._credentials,
+            http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS),
+        )
+        return build(
+            self.service_name,
+            self.version,
+            http=authorized_http,
+            cache_discovery=False,
+        )
+
+    def _acquire(self) -> Any:
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            if self._idle:
+                self._reused += 1
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self._build_client()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._created -= 1
+            raise
+
+    def _release(self, client: Any) -> None:
+        with self._lock:
+            self._in_use -= 1
+            if len(self._idle) < self.max_idle:
+                self._idle.append(client)
+
+    def thread_client(self) -> Any:
+        """Liefert den an den aktuellen Thread gebundenen Client.
+
+        Endet der Thread, gibt ein Finalizer den Client an den Pool zurück.
+        """
+        lease = getattr(self._thread_local, "lease", None)
+        if lease is None:
+            lease = _ThreadLease(self._acquire())
+            weakref.finalize(lease, self._release, lease.client)
+            self._thread_local.lease = lease
+        return lease.client
+
+    def stats(self) -> ClientPoolStats:
+        with self._lock:
+            return ClientPoolStats(
+                service=f"{self.service_name} {self.version}",
+                created=self._created,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                checkouts=self._checkouts,
+                reused=self._reused,
+            )
+
+
+@dataclass(slots=True, weakref_slot=True)
+class _ThreadLease:
+    client: Any
+
+
 @st.cache_resource
-def get_drive_client():
-    creds = service_account.Credentials.from_service_account_info(
-        _sa_info(),
-        scopes=DRIVE_SCOPES,
-    )
-    return build("drive", "v3", credentials=creds)
+def get_drive_client_pool() -> GoogleClientPool:
+    return GoogleClientPool("drive", "v3", DRIVE_SCOPES)
 
 
 @st.cache_resource
+def get_sheets_client_pool() -> GoogleClientPool:
+    return GoogleClientPool("sheets", "v4", SHEETS_SCOPES)
+
+
+def get_drive_client():
+    """Drive-Client des aktuellen Threads (eigener Transport, geteilte Credentials)."""
+    return get_drive_client_pool().thread_client()
+
+
 def get_sheets_client():
-    creds = service_account.Credentials.from_service_account_info(
-        _sa_info(),
-        scopes=SHEETS_SCOPES,
-    )
-    return build("sheets", "v4", credentials=creds)
+    """Sheets-Client des aktuellen Threads (eigener Transport, geteilte Credentials)."""
+    return get_sheets_client_pool().thread_client()
+
+
+def get_client_pool_stats() -> list[ClientPoolStats]:
+    """Kennzahlen der Drive- und Sheets-Client-Pools."""
+    return [get_drive_client_pool().stats(), get_sheets_client_pool().stats()]
@@ -0,0 +1,367 @@
+"""Abgeleitete Bild- und Videovarianten mit Platten- und Drive-Ablage."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from config import PhotoConfig
+from services.drive_service import DRIVE_FOLDER_MIME_TYPE, DriveServiceError
+from services.photos_service import (
+    PIXELATION_BLOCKS,
+    pixelate_faces,
+    render_image_derivative,
+    render_video_poster,
+    render_video_preview,
+)
+
+LOGGER = logging.getLogger(__name__)
+DERIVATIVES_FOLDER_NAME = ".derivatives"
+PREFETCH_WORKERS = 4
+PREFETCH_MAX_ATTEMPTS = 3
+DRIVE_INDEX_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class DerivativeSpec:
+    kind: str
+    max_edge: int = 0
+    quality: int = 0
+    extension: str = ".webp"
+    mime_type: str = "image/webp"
+    renderer: Callable[[bytes], bytes] | None = None
+
+    def render(self, original: bytes) -> bytes:
+        if self.renderer is not None:
+            return self.renderer(original)
+        return render_image_derivative(original, self.max_edge, self.quality)
+
+
+THUMBNAIL_SPEC = DerivativeSpec(kind="thumb", max_edge=320, quality=75)
+PREVIEW_SPEC = DerivativeSpec(kind="preview", max_edge=1280, quality=82)
+IMAGE_DERIVATIVE_SPECS: tuple[DerivativeSpec, ...] = (THUMBNAIL_SPEC, PREVIEW_SPEC)
+VIDEO_POSTER_SPEC = DerivativeSpec(
+    kind="poster",
+    max_edge=320,
+    quality=75,
+    renderer=partial(render_video_poster, max_edge=320, quality=75),
+)
+VIDEO_PREVIEW_SPEC = DerivativeSpec(
+    kind="clip",
+    max_edge=480,
+    extension=".webm",
+    mime_type="video/webm",
+    renderer=partial(render_video_preview, max_edge=480),
+)
+VIDEO_DERIVATIVE_SPECS: tuple[DerivativeSpec, ...] = (
+    VIDEO_POSTER_SPEC,
+    VIDEO_PREVIEW_SPEC,
+)
+
+
+def pixelated_spec(settings: PhotoConfig) -> DerivativeSpec:
+    """Verpixelte Download-Variante in voller Auflösung und im Quellformat.
+
+    Nur die Parameter, die das Ergebnis beeinflussen (Gesichtserkennung,
+    Blockgröße, Kodierung), fließen in ``kind`` ein. So treffen geänderte
+    Einstellungen nicht auf alte Varianten, Upload-Optionen aber verwerfen
+    den Bestand nicht.
+    """
+    output_settings = (
+        settings.face_detection_max_edge,
+        settings.face_scale_factor,
+        settings.face_min_neighbors,
+        settings.face_min_size,
+        PIXELATION_BLOCKS,
+        settings.jpeg_quality,
+        settings.webp_quality,
+        settings.webp_lossless,
+        settings.webp_method,
+    )
+    settings_key = hashlib.sha1(
+        repr(output_settings).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()[:8]
+    return DerivativeSpec(
+        kind=f"pixelated-{settings_key}",
+        extension="",
+        mime_type="application/octet-stream",
+        renderer=partial(pixelate_faces, settings=settings),
+    )
+
+
+def derivative_name(file_id: str, revision: str, spec: DerivativeSpec) -> str:
+    """Dateiname einer Variante; ``revision`` (z. B. MD5) macht ihn inhaltsstabil."""
+    revision_key = hashlib.sha1(
+        str(revision).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()[:12]
+    return f"{file_id}.{spec.kind}.{revision_key}{spec.extension}"
+
+
+class MediaDerivativeStore:
+    """Erzeugt Varianten einmalig und hält sie lokal sowie neben dem Original vor.
+
+    Lokal liegen die Varianten in ``cache_dir``. Im Google-Modus werden sie
+    zusätzlich im Unterordner ``.derivatives`` des Medien-Ordners abgelegt,
+    damit sie Neustarts und neue Instanzen überdauern. Nachgeschlagen wird dort
+    über einen Namensindex, der höchstens alle ``DRIVE_INDEX_TTL_SECONDS``
+    neu gelistet wird.
+    """
+
+    def __init__(
+        self,
+        drive_agent: Any,
+        media_folder_id: str,
+        cache_dir: Path,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.drive_agent = drive_agent
+        self.media_folder_id = media_folder_id
+        self.cache_dir = cache_dir
+        self._clock = clock
+        self._drive_folder_id: str | None = None
+        self._lock = threading.Lock()
+        self._drive_index: dict[str, str] | None = None
+        self._drive_index_loaded_at = 0.0
+        self._index_lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._failed_attempts: dict[str, int] = {}
+        self._pending_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def _uses_drive(self) -> bool:
+        return self.drive_agent.storage_mode == "google"
+
+    def _cache_path(self, name: str) -> Path:
+        return self.cache_dir / name
+
+    def _write_cache(self, name: str, payload: bytes) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(name)
+        temp_path = path.with_suffix(f"{path.suffix}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(payload)
+        temp_path.replace(path)
+
+    def _derivatives_folder_id(self) -> str:
+        with self._lock:
+            if self._drive_folder_id:
+                return self._drive_folder_id
+            for folder in self.drive_agent.list_files(
+                self.media_folder_id, DRIVE_FOLDER_MIME_TYPE, incremental=True
+            ):
+                if folder.get("name") == DERIVATIVES_FOLDER_NAME:
+                    self._drive_folder_id = str(folder["id"])
+                    break
+            else:
+                self._drive_folder_id = str(
+                    self.drive_agent.create_folder(
+                        DERIVATIVES_FOLDER_NAME, self.media_folder_id
+                    )
+                )
+            return self._drive_folder_id
+
+    def _drive_name_index(self) -> dict[str, str]:
+        """Name → Drive-ID aller gespeicherten Varianten (ein Listing je TTL)."""
+        with self._index_lock:
+            now = self._clock()
+            if (
+                self._drive_index is None
+                or now - self._drive_index_loaded_at > DRIVE_INDEX_TTL_SECONDS
+            ):
+                self._drive_index = {
+                    str(item["name"]): str(item["id"])
+                    for item in self.drive_agent.list_files(
+                        self._derivatives_folder_id(), incremental=True
+                    )
+                    if item.get("name") and item.get("id")
+                }
+                self._drive_index_loaded_at = now
+            return self._drive_index
+
+    def _find_in_drive(self, name: str) -> str | None:
+        return self._drive_name_index().get(name)
+
+    def _upload_to_drive(
+        self, file_id: str, name: str, spec: DerivativeSpec, payload: bytes
+    ) -> None:
+        try:
+            drive_file_id = self.drive_agent.upload_file(
+                name,
+                payload,
+                spec.mime_type,
+                self._derivatives_folder_id(),
+                app_properties={"derivative_of": file_id, "derivative": spec.kind},
+            )
+        except DriveServiceError as exc:
+            LOGGER.warning("Derivative upload failed for %s: %s", name, exc)
+            return
+        if drive_file_id:
+            with self._index_lock:
+                if self._drive_index is not None:
+                    self._drive_index[name] = str(drive_file_id)
+
+    def find_cached(
+        self, file_id: str, revision: str, spec: DerivativeSpec
+    ) -> bytes | None:
+        """Nur der lokale Cache; Drive-Varianten holt ``prefetch`` im Hintergrund."""
+        cache_path = self._cache_path(derivative_name(file_id, revision, spec))
+        if cache_path.is_file():
+            return cache_path.read_bytes()
+        return None
+
+    def find(self, file_id: str, revision: str, spec: DerivativeSpec) -> bytes | None:
+        """Liefert eine bereits gespeicherte Variante, ohne sie zu erzeugen."""
+        cached = self.find_cached(file_id, revision, spec)
+        if cached is not None:
+            return cached
+
+        name = derivative_name(file_id, revision, spec)
+
+        if self._uses_drive:
+            try:
+                drive_file_id = self._find_in_drive(name)
+                if drive_file_id:
+                    payload = self.drive_agent.fetch_file(drive_file_id)
+                    self._write_cache(name, payload)
+                    return payload
+            except DriveServiceError as exc:
+                LOGGER.warning("Derivative lookup failed for %s: %s", name, exc)
+        return None
+
+    def put(
+        self, file_id: str, revision: str, spec: DerivativeSpec, payload: bytes
+    ) -> None:
+        """Speichert eine anderweitig erzeugte Variante (lokal und ggf. in Drive)."""
+        name = derivative_name(file_id, revision, spec)
+        self._write_cache(name, payload)
+        if self._uses_drive:
+            self._upload_to_drive(file_id, name, spec, payload)
+
+    def put_in_background(
+        self, file_id: str, revision: str, spec: DerivativeSpec, payload: bytes
+    ) -> None:
+        """Wie ``put``, aber der Drive-Upload läuft im Prefetch-Pool.
+
+        Für bereits erzeugte Varianten auf dem Download-Pfad: Der lokale Cache
+        ist sofort aktuell, Drive-Uploads verzögern die Antwort nicht.
+        """
+        name = derivative_name(file_id, revision, spec)
+        self._write_cache(name, payload)
+        if self._uses_drive:
+            self._prefetch_executor().submit(
+                self._upload_to_drive, file_id, name, spec, payload
+            )
+
+    def get(
+        self,
+        file_id: str,
+        revision: str,
+        spec: DerivativeSpec,
+        load_original: Callable[[], bytes],
+    ) -> bytes:
+        """Liefert eine Variante; das Original wird nur bei Bedarf geladen."""
+        payload = self.find(file_id, revision, spec)
+        if payload is not None:
+            return payload
+
+        payload = spec.render(load_original())
+        self.put(file_id, revision, spec, payload)
+        return payload
+
+    def create_all(
+        self,
+        file_id: str,
+        revision: str,
+        original: bytes,
+        specs: tuple[DerivativeSpec, ...] = IMAGE_DERIVATIVE_SPECS,
+    ) -> None:
+        """Erzeugt alle Varianten (Bild- oder Videovarianten) direkt beim Upload."""
+        for spec in specs:
+            self.get(file_id, revision, spec, lambda: original)
+
+    def _prefetch_executor(self) -> ThreadPoolExecutor:
+        with self._pending_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=PREFETCH_WORKERS,
+                    thread_name_prefix="media-prefetch",
+                )
+            return self._executor
+
+    def _prefetch_one(
+        self,
+        name: str,
+        file_id: str,
+        revision: str,
+        spec: DerivativeSpec,
+        load_original: Callable[[str], bytes],
+    ) -> None:
+        attempts = 1
+        try:
+            self.get(file_id, revision, spec, lambda: load_original(file_id))
+        except (DriveServiceError, OSError) as exc:
+            LOGGER.info("Prefetch skipped for %s: %s", name, exc)
+        except ValueError as exc:
+            # Nicht dekodierbar: ein neuer Versuch würde genauso scheitern.
+            LOGGER.info("Prefetch failed permanently for %s: %s", name, exc)
+            attempts = PREFETCH_MAX_ATTEMPTS
+        else:
+            attempts = 0
+        finally:
+            with self._pending_lock:
+                self._pending.discard(name)
+                if attempts:
+                    self._failed_attempts[name] = (
+                        self._failed_attempts.get(name, 0) + attempts
+                    )
+
+    def is_pending(self, file_id: str, revision: str, spec: DerivativeSpec) -> bool:
+        """``True``, solange die Variante im Hintergrund erzeugt wird."""
+        with self._pending_lock:
+            return derivative_name(file_id, revision, spec) in self._pending
+
+    def has_failed(self, file_id: str, revision: str, spec: DerivativeSpec) -> bool:
+        """``True``, wenn ``prefetch`` die Variante nicht mehr neu versucht."""
+        name = derivative_name(file_id, revision, spec)
+        with self._pending_lock:
+            return self._failed_attempts.get(name, 0) >= PREFETCH_MAX_ATTEMPTS
+
+    def prefetch(
+        self,
+        entries: Iterable[tuple[str, str]],
+        spec: DerivativeSpec,
+        load_original: Callable[[str], bytes],
+    ) -> int:
+        """Erzeugt fehlende Varianten für ``(file_id, revision)`` im Hintergrund.
+
+        ``load_original`` läuft in Worker-Threads und darf daher keine
+        Streamlit-Caches nutzen. Nach ``PREFETCH_MAX_ATTEMPTS`` Fehlschlägen
+        (bzw. sofort bei nicht dekodierbaren Originalen) wird eine Variante
+        nicht mehr eingeplant. Liefert die Anzahl neu eingeplanter Jobs.
+        """
+        scheduled = 0
+        for file_id, revision in entries:
+            name = derivative_name(file_id, revision, spec)
+            if self._cache_path(name).is_file():
+                continue
+            with self._pending_lock:
+                if (
+                    name in self._pending
+                    or self._failed_attempts.get(name, 0) >= PREFETCH_MAX_ATTEMPTS
+                ):
+                    continue
+                self._pending.add(name)
+            self._prefetch_executor().submit(
+                self._prefetch_one, name, file_id, revision, spec, load_original
+            )
+            scheduled += 1
+        return scheduled
@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+import math
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
 import cv2
 import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+from config import PhotoConfig
 
 VALID_CONSENT_MODES = {"pixelated", "unpixelated", "denied"}
+FACE_CASCADE_PATH = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+# Kleinstes Suchfenster der Frontalface-Cascade.
+HAAR_WINDOW_SIZE = 24
+_DETECTOR_STATE = threading.local()
+_EXIF_ORIENTATION_TAG = 0x0112
+_EXIF_GPS_IFD_TAG = 0x8825
+_PRESERVED_FORMATS = {"JPEG", "PNG", "WEBP"}
+_POOL_LOCK = threading.Lock()
+# Prozessweiter Pool; wird beim ersten Batch unter "pool" angelegt.
+_PIXELATION_POOL: dict[str, ProcessPoolExecutor] = {}
+PIXELATION_BLOCKS = 12
 
 
 def _decode_image(image_bytes: bytes) -> np.ndarray:
@@ -14,35 +40,294 @@ def _decode_image(image_bytes: bytes) -> np.ndarray:
     return image
 
 
-def _encode_image(image: np.ndarray) -> bytes:
-    success, encoded = cv2.imencode(".png", image)
+def _encode_image(
+    image: np.ndarray,
+    source_bytes: bytes | None = None,
+    settings: PhotoConfig | None = None,
+) -> bytes:
+    """Kodiert im Format der Quelle (JPEG/PNG/WebP, sonst PNG).
+
+    Die EXIF-Daten der Quelle bleiben erhalten, GPS-Angaben werden entfernt.
+    Da ``cv2.imdecode`` die EXIF-Orientierung bereits auf die Pixel anwendet,
+    wird das Orientation-Tag auf 1 gesetzt, damit die Darstellung gleich bleibt.
+    """
+    settings = settings or PhotoConfig()
+    source_format = "PNG"
+    exif_bytes = b""
+    icc_profile = None
+    if source_bytes:
+        try:
+            with Image.open(BytesIO(source_bytes)) as source:
+                if source.format in _PRESERVED_FORMATS:
+                    source_format = source.format
+                exif = source.getexif()
+                icc_profile = source.info.get("icc_profile")
+        except UnidentifiedImageError:
+            exif = None
+        if exif:
+            exif.pop(_EXIF_GPS_IFD_TAG, None)
+            if _EXIF_ORIENTATION_TAG in exif:
+                exif[_EXIF_ORIENTATION_TAG] = 1
+            exif_bytes = exif.tobytes()
+
+    output_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    save_options: dict[str, object] = {}
+    if exif_bytes:
+        save_options["exif"] = exif_bytes
+    if icc_profile:
+        save_options["icc_profile"] = icc_profile
+    if source_format == "JPEG":
+        save_options.update(
+            quality=settings.jpeg_quality, optimize=True, progressive=True
+        )
+    elif source_format == "WEBP":
+        save_options.update(
+            quality=settings.webp_quality,
+            lossless=settings.webp_lossless,
+            method=settings.webp_method,
+        )
+    else:
+        save_options["optimize"] = True
+
+    buffer = BytesIO()
+    try:
+        output_image.save(buffer, format=source_format, **save_options)
+    except (OSError, ValueError) as exc:
+        raise ValueError("Bild konnte nicht kodiert werden.") from exc
+    return buffer.getvalue()
+
+
+def resize_to_max_edge(image: np.ndarray, max_edge: int) -> np.ndarray:
+    """Verkleinert ein Bild proportional auf die angegebene Kantenlänge."""
+    height, width = image.shape[:2]
+    longest_edge = max(height, width)
+    if max_edge <= 0 or longest_edge <= max_edge:
+        return image
+    scale = max_edge / longest_edge
+    return cv2.resize(
+        image,
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def render_image_derivative(image_bytes: bytes, max_edge: int, quality: int) -> bytes:
+    """Erzeugt eine verkleinerte WebP-Variante (Thumbnail/Vorschau) eines Bildes."""
+    image = resize_to_max_edge(_decode_image(image_bytes), max_edge)
+    success, encoded = cv2.imencode(".webp", image, [cv2.IMWRITE_WEBP_QUALITY, quality])
     if not success:
         raise ValueError("Bild konnte nicht kodiert werden.")
     return encoded.tobytes()
 
 
-def pixelate_faces(image_bytes: bytes) -> bytes:
-    """Erzeugt ein Bild mit verpixelten Gesichtern via Haar Cascade."""
+@contextmanager
+def _video_capture(video_bytes: bytes) -> Generator[cv2.VideoCapture]:
+    # OpenCV liest Videos nur aus Dateien; FFmpeg erkennt das Format am Inhalt.
+    with TemporaryDirectory(prefix="video-") as temp_dir:
+        source_path = Path(temp_dir) / "source"
+        source_path.write_bytes(video_bytes)
+        capture = cv2.VideoCapture(str(source_path))
+        try:
+            if not capture.isOpened():
+                raise ValueError("Video konnte nicht geöffnet werden.")
+            yield capture
+        finally:
+            capture.release()
+
+
+def _even_size(width: int, height: int) -> tuple[int, int]:
+    return max(2, width - width % 2), max(2, height - height % 2)
+
+
+def render_video_poster(video_bytes: bytes, max_edge: int, quality: int) -> bytes:
+    """Standbild eines Videos als WebP (nach ca. 1 s, um Schwarzbilder zu meiden)."""
+    with _video_capture(video_bytes) as capture:
+        fps = capture.get(cv2.CAP_PROP_FPS) or 25.0
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        target_frame = min(round(fps), max(0, frame_count // 10))
+        capture.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+        success, frame = capture.read()
+        if not success and target_frame:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = capture.read()
+    if not success:
+        raise ValueError("Video enthält kein lesbares Bild.")
+    frame = resize_to_max_edge(frame, max_edge)
+    success, encoded = cv2.imencode(".webp", frame, [cv2.IMWRITE_WEBP_QUALITY, quality])
+    if not success:
+        raise ValueError("Bild konnte nicht kodiert werden.")
+    return encoded.tobytes()
+
+
+def render_video_preview(
+    video_bytes: bytes,
+    max_edge: int = 480,
+    max_seconds: float = 6.0,
+    fps: float = 12.0,
+) -> bytes:
+    """Kurzer, verkleinerter Vorschau-Clip (WebM/VP8) vom Anfang eines Videos.
+
+    Auflösung, Bildrate und Länge werden reduziert; Ton entfällt.
+    """
+    with (
+        _video_capture(video_bytes) as capture,
+        TemporaryDirectory(prefix="clip-") as temp_dir,
+    ):
+        source_fps = capture.get(cv2.CAP_PROP_FPS) or fps
+        output_fps = min(fps, source_fps)
+        frame_step = source_fps / output_fps
+        max_frames = max(1, int(max_seconds * output_fps))
+        clip_path = Path(temp_dir) / "clip.webm"
+        writer: cv2.VideoWriter | None = None
+        written = 0
+        source_index = 0
+        next_index = 0.0
+        try:
+            while written < max_frames:
+                success, frame = capture.read()
+                if not success:
+                    break
+                if source_index >= next_index:
+                    frame = resize_to_max_edge(frame, max_edge)
+                    height, width = frame.shape[:2]
+                    size = _even_size(width, height)
+                    if writer is None:
+                        writer = cv2.VideoWriter(
+                            str(clip_path),
+                            cv2.VideoWriter_fourcc(*"VP80"),
+                            output_fps,
+                            size,
+                        )
+                        if not writer.isOpened():
+                            raise ValueError(
+                                "Vorschau-Clip konnte nicht kodiert werden."
+                            )
+                    writer.write(
+                        cv2.resize(frame, size) if size != (width, height) else frame
+                    )
+                    written += 1
+                    next_index += frame_step
+                source_index += 1
+        finally:
+            if writer is not None:
+                writer.release()
+        if not written:
+            raise ValueError("Video enthält kein lesbares Bild.")
+        return clip_path.read_bytes()
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedUpload:
+    data: bytes
+    changed: bool = False
+
+
+def normalize_upload(
+    image_bytes: bytes, settings: PhotoConfig | None = None
+) -> NormalizedUpload:
+    """Dreht nach EXIF, begrenzt die Kantenlänge und kodiert ohne GPS neu.
+
+    Das Format der Quelle bleibt erhalten. Bilder mit Transparenz oder in
+    anderen Formaten bleiben unverändert. Ohne Drehung, Verkleinerung oder
+    GPS-Angaben wird die Neukodierung nur übernommen, wenn sie kleiner ist.
+    """
+    settings = settings or PhotoConfig()
+    try:
+        with Image.open(BytesIO(image_bytes)) as source:
+            source_format = source.format
+            has_alpha = "A" in source.getbands() or "transparency" in source.info
+            exif = source.getexif()
+    except UnidentifiedImageError as exc:
+        raise ValueError("Bilddaten konnten nicht dekodiert werden.") from exc
+    if source_format not in _PRESERVED_FORMATS or has_alpha:
+        return NormalizedUpload(data=image_bytes)
+
     image = _decode_image(image_bytes)
+    resized = resize_to_max_edge(image, settings.upload_max_edge)
+    encoded = _encode_image(
+        resized,
+        image_bytes,
+        replace(
+            settings,
+            jpeg_quality=settings.upload_quality,
+            webp_quality=settings.upload_quality,
+        ),
+    )
+    must_rewrite = (
+        resized is not image
+        or _EXIF_GPS_IFD_TAG in exif
+        or exif.get(_EXIF_ORIENTATION_TAG, 1) != 1
+    )
+    if not must_rewrite and len(encoded) >= len(image_bytes):
+        return NormalizedUpload(data=image_bytes)
+    return NormalizedUpload(data=encoded, changed=True)
+
+
+def _face_detector() -> cv2.CascadeClassifier:
+    """Haar-Cascade je Thread; ``detectMultiScale`` ist nicht thread-sicher."""
+    detector = getattr(_DETECTOR_STATE, "face_cascade", None)
+    if detector is None:
+        detector = cv2.CascadeClassifier(FACE_CASCADE_PATH)
+        if detector.empty():
+            raise RuntimeError(
+                "Haar-Cascade für Gesichter konnte nicht geladen werden."
+            )
+        _DETECTOR_STATE.face_cascade = detector
+    return detector
+
+
+def detect_faces(
+    image: np.ndarray, settings: PhotoConfig | None = None
+) -> list[tuple[int, int, int, int]]:
+    """Findet Gesichter auf einer verkleinerten Kopie; Boxen in Originalauflösung.
+
+    Mit ``face_min_size = 0`` (Standard) ergibt sich die Mindestgröße aus
+    ``face_detection_max_edge``: Erkannt wird alles, was auf der Kopie das
+    24-px-Fenster der Haar-Cascade füllt. Ein fester Wert begrenzt dagegen die
+    Verkleinerung, damit Gesichter dieser Größe nicht übersehen werden.
+    """
+    settings = settings or PhotoConfig()
     grayscale = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    height, width = grayscale.shape[:2]
+    detection_max_edge = settings.face_detection_max_edge
+    if detection_max_edge > 0 and settings.face_min_size > 0:
+        min_scale = min(1.0, HAAR_WINDOW_SIZE / settings.face_min_size)
+        detection_max_edge = max(
+            detection_max_edge, math.ceil(max(height, width) * min_scale)
+        )
+    detection_image = resize_to_max_edge(grayscale, detection_max_edge)
+    scale = detection_image.shape[1] / width
 
-    face_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-    )
-    faces = face_cascade.detectMultiScale(
-        grayscale,
-        scaleFactor=1.1,
-        minNeighbors=5,
-        minSize=(24, 24),
+    min_size = max(HAAR_WINDOW_SIZE, round(settings.face_min_size * scale))
+    faces = _face_detector().detectMultiScale(
+        detection_image,
+        scaleFactor=settings.face_scale_factor,
+        minNeighbors=settings.face_min_neighbors,
+        minSize=(min_size, min_size),
     )
 
-    for x, y, width, height in faces:
+    boxes: list[tuple[int, int, int, int]] = []
+    for x, y, box_width, box_height in faces:
+        left = max(0, math.floor(x / scale))
+        top = max(0, math.floor(y / scale))
+        right = min(width, math.ceil((x + box_width) / scale))
+        bottom = min(height, math.ceil((y + box_height) / scale))
+        if right > left and bottom > top:
+            boxes.append((left, top, right - left, bottom - top))
+    return boxes
+
+
+def pixelate_faces(image_bytes: bytes, settings: PhotoConfig | None = None) -> bytes:
+    """Erzeugt ein Bild mit verpixelten Gesichtern via Haar Cascade."""
+    image = _decode_image(image_bytes)
+
+    for x, y, width, height in detect_faces(image, settings):
         roi = image[y : y + height, x : x + width]
         if roi.size == 0:
             continue
 
-        mosaic_w = max(1, width // 12)
-        mosaic_h = max(1, height // 12)
+        mosaic_w = max(1, width // PIXELATION_BLOCKS)
+        mosaic_h = max(1, height // PIXELATION_BLOCKS)
         small = cv2.resize(roi, (mosaic_w, mosaic_h), interpolation=cv2.INTER_LINEAR)
         pixelated = cv2.resize(
             small,
@@ -51,18 +336,87 @@ def pixelate_faces(image_bytes: bytes) -> bytes:
         )
         image[y : y + height, x : x + width] = pixelated
 
-    return _encode_image(image)
+    return _encode_image(image, image_bytes, settings)
+
+
+@dataclass(slots=True)
+class PixelationResult:
+    key: str
+    data: bytes | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def available_cpu_count() -> int:
+    """Für diesen Prozess nutzbare Kerne (berücksichtigt CPU-Affinität)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def _pixelation_pool() -> ProcessPoolExecutor:
+    with _POOL_LOCK:
+        if "pool" not in _PIXELATION_POOL:
+            # "spawn" statt fork: der Streamlit-Prozess hält Threads und Sockets.
+            _PIXELATION_POOL["pool"] = ProcessPoolExecutor(
+                max_workers=available_cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _PIXELATION_POOL["pool"]
+
+
+def shutdown_pixelation_pool() -> None:
+    with _POOL_LOCK:
+        pool = _PIXELATION_POOL.pop("pool", None)
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
 
+def pixelate_batch(
+    images: Iterable[tuple[str, bytes]],
+    settings: PhotoConfig | None = None,
+    *,
+    max_in_flight: int | None = None,
+    worker: Callable[[bytes, PhotoConfig | None], bytes] = pixelate_faces,
+) -> Iterator[PixelationResult]:
+    """Verpixelt viele Bilder parallel in einem Prozess-Pool.
 
-def get_download_bytes(image_bytes: bytes, consent_mode: str) -> bytes:
-    """Liefert Download-Bytes entsprechend Consent-Modus."""
-    normalized_mode = consent_mode.strip().lower()
-    if normalized_mode not in VALID_CONSENT_MODES:
-        normalized_mode = "pixelated"
+    Ergebnisse werden in Fertigstellungsreihenfolge geliefert. ``images`` wird
+    erst weitergelesen, wenn weniger als ``max_in_flight`` Bilder (Standard:
+    zwei je Kern) in Arbeit sind; so bleibt der Speicherbedarf begrenzt, auch
+    wenn die Quelle Bilder erst beim Iterieren lädt.
+    """
+    limit = max(1, max_in_flight or 2 * available_cpu_count())
+    pool = _pixelation_pool()
+    pending: dict[Future[bytes], str] = {}
+    source = iter(images)
+    exhausted = False
 
-    if normalized_mode == "unpixelated":
-        return image_bytes
-    if normalized_mode == "denied":
-        raise PermissionError("Foto-Download ist für dieses Kind nicht erlaubt.")
+    try:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < limit:
+                try:
+                    key, image_bytes = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[pool.submit(worker, image_bytes, settings)] = key
 
-    return pixelate_faces(image_bytes)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    result = PixelationResult(key, data=future.result())
+                except (ValueError, cv2.error) as exc:
+                    # Nicht dekodier- bzw. verarbeitbare Bilder; andere Fehler
+                    # (z. B. ein abgebrochener Pool) brechen den Batch ab.
+                    result = PixelationResult(key, error=exc)
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
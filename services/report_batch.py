@@ -0,0 +1,212 @@
+"""Sammelerstellung von Berichten mit adaptiver Parallelität."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+from typing import Any
+
+from openai import RateLimitError
+
+from services.album_export import unique_arcname
+
+LOGGER = logging.getLogger(__name__)
+REPORT_SPOOL_MAX_MEMORY = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ReportRequest:
+    child: dict[str, Any]
+    notes: str
+
+
+@dataclass(frozen=True, slots=True)
+class ReportOutcome:
+    request: ReportRequest
+    file_name: str = ""
+    doc_bytes: bytes | None = None
+    error: str = ""
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.doc_bytes is not None and not self.error
+
+
+@dataclass(slots=True)
+class ReportArchive:
+    archive: SpooledTemporaryFile
+    file_count: int = 0
+    failed: list[ReportOutcome] = field(default_factory=list)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Erkennt ``RateLimitError`` auch hinter ``DocumentGenerationError``."""
+    current: BaseException | None = exc
+    while current is not None:
+        if isinstance(current, RateLimitError):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """Begrenzt parallele Aufrufe und passt das Limit an (AIMD).
+
+    Ein Ratenlimit halbiert das Limit und pausiert neue Aufrufe für
+    ``cooldown_seconds``; nach ``increase_after`` Erfolgen in Folge steigt
+    das Limit wieder um eins bis ``max_concurrency``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        increase_after: int = 3,
+        cooldown_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.increase_after = max(1, increase_after)
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._limit = self.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return self._limit
+
+    def acquire(self) -> None:
+        with self._condition:
+            while True:
+                remaining_pause = self._paused_until - self._clock()
+                if remaining_pause <= 0 and self._active < self._limit:
+                    self._active += 1
+                    return
+                self._condition.wait(
+                    timeout=remaining_pause if remaining_pause > 0 else None
+                )
+
+    def release(self, *, rate_limited: bool = False) -> None:
+        with self._condition:
+            self._active -= 1
+            if rate_limited:
+                self._limit = max(1, self._limit // 2)
+                self._successes = 0
+                self._paused_until = self._clock() + self.cooldown_seconds
+                LOGGER.info("Rate limit hit, concurrency reduced to %s.", self._limit)
+            else:
+                self._successes += 1
+                if (
+                    self._successes >= self.increase_after
+                    and self._limit < self.max_concurrency
+                ):
+                    self._limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+def generate_reports(
+    requests: Iterable[ReportRequest],
+    generate: Callable[[ReportRequest], tuple[bytes, str]],
+    *,
+    max_concurrency: int,
+    max_attempts: int = 3,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+) -> Iterator[ReportOutcome]:
+    """Erstellt Berichte parallel und liefert sie in Fertigstellungsreihenfolge.
+
+    Schlägt ein Bericht wegen eines Ratenlimits fehl, wird er bis zu
+    ``max_attempts``-mal erneut eingeplant; andere Fehler landen direkt im
+    Ergebnis.
+    """
+    limiter = limiter or AdaptiveConcurrencyLimiter(max_concurrency)
+
+    def _attempt(request: ReportRequest) -> tuple[bytes, str]:
+        limiter.acquire()
+        rate_limited = False
+        try:
+            return generate(request)
+        except Exception as exc:
+            rate_limited = is_rate_limit_error(exc)
+            raise
+        finally:
+            limiter.release(rate_limited=rate_limited)
+
+    with ThreadPoolExecutor(
+        max_workers=limiter.max_concurrency, thread_name_prefix="report-batch"
+    ) as executor:
+        in_flight: dict[Future[tuple[bytes, str]], tuple[ReportRequest, int]] = {
+            executor.submit(_attempt, request): (request, 1) for request in requests
+        }
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                request, attempt = in_flight.pop(future)
+                try:
+                    doc_bytes, file_name = future.result()
+                # ``generate`` ist ein beliebiger Callback: Jeder Fehler gehört zu
+                # genau einem Bericht und darf den Stapel nicht abbrechen.
+                except Exception as exc:
+                    if is_rate_limit_error(exc) and attempt < max_attempts:
+                        in_flight[executor.submit(_attempt, request)] = (
+                            request,
+                            attempt + 1,
+                        )
+                        continue
+                    LOGGER.warning(
+                        "Report failed after %s attempt(s): %s",
+                        attempt,
+                        exc,
+                        exc_info=True,
+                    )
+                    yield ReportOutcome(request, error=str(exc), attempts=attempt)
+                else:
+                    yield ReportOutcome(
+                        request,
+                        file_name=file_name,
+                        doc_bytes=doc_bytes,
+                        attempts=attempt,
+                    )
+
+
+def write_reports_zip(outcomes: Iterable[ReportOutcome]) -> ReportArchive:
+    """Schreibt fertige Berichte nacheinander in ein gespooltes ZIP.
+
+    Der Aufrufer übernimmt ``archive`` (auf den Anfang gesetzt) und schließt es.
+    """
+    used_names: set[str] = set()
+    with ExitStack() as cleanup:
+        report_archive = ReportArchive(
+            archive=cleanup.enter_context(
+                SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_MEMORY, mode="w+b")
+            )
+        )
+        # DOCX ist bereits ZIP-komprimiert; ZIP_STORED spart nur CPU.
+        with zipfile.ZipFile(
+            report_archive.archive, "w", compression=zipfile.ZIP_STORED
+        ) as zf:
+            for outcome in outcomes:
+                if not outcome.ok or outcome.doc_bytes is None:
+                    report_archive.failed.append(outcome)
+                    continue
+                zf.writestr(
+                    unique_arcname(outcome.file_name, used_names), outcome.doc_bytes
+                )
+                report_archive.file_count += 1
+        report_archive.archive.seek(0)
+        # Erfolgreich geschrieben: Der Spool gehört jetzt dem Aufrufer.
+        cleanup.pop_all()
+    return report_archive
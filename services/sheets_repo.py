@@ -257,6 +257,30 @@ def _values_update(range_name: str, values: list[list[str]]) -> None:
         raise _translate_http_error(exc) from exc
 
 
+def _values_batch_update(data: list[tuple[str, list[list[str]]]]) -> None:
+    if not data:
+        return
+    service = get_sheets_client()
+    try:
+        (
+            service.spreadsheets()
+            .values()
+            .batchUpdate(
+                spreadsheetId=_sheet_id(),
+                body={
+                    "valueInputOption": "RAW",
+                    "data": [
+                        {"range": range_name, "values": values}
+                        for range_name, values in data
+                    ],
+                },
+            )
+            .execute()
+        )
+    except HttpError as exc:
+        raise _translate_http_error(exc) from exc
+
+
 def _values_append(range_name: str, values: list[list[str]]) -> None:
     service = get_sheets_client()
     try:
@@ -820,13 +844,9 @@ def add_child(child_dict: dict[str, Any]) -> str:
     return child_id
 
 
-def update_child(child_id: str, patch_dict: dict[str, Any]) -> None:
-    _ensure_children_header_columns(CHILDREN_REQUIRED_COLUMNS)
-    row_index, header = _get_row_index_by_id(_children_tab(), "child_id", child_id)
-
-    existing_rows = _values_get(f"{_children_tab()}!A{row_index}:ZZ{row_index}")
-    existing_row = existing_rows[0] if existing_rows else []
-
+def _patched_child_row(
+    header: list[str], existing_row: list[Any], patch_dict: dict[str, Any]
+) -> list[str]:
     current_payload = {
         column: str(existing_row[index]).strip() if index < len(existing_row) else ""
         for index, column in enumerate(header)
@@ -839,8 +859,17 @@ def update_child(child_id: str, patch_dict: dict[str, Any]) -> None:
     current_payload["status"] = str(current_payload.get("status") or "active").strip()
     if not current_payload["status"]:
         current_payload["status"] = "active"
+    return [current_payload.get(column, "") for column in header]
 
-    row_values = [current_payload.get(column, "") for column in header]
+
+def update_child(child_id: str, patch_dict: dict[str, Any]) -> None:
+    _ensure_children_header_columns(CHILDREN_REQUIRED_COLUMNS)
+    row_index, header = _get_row_index_by_id(_children_tab(), "child_id", child_id)
+
+    existing_rows = _values_get(f"{_children_tab()}!A{row_index}:ZZ{row_index}")
+    existing_row = existing_rows[0] if existing_rows else []
+
+    row_values = _patched_child_row(header, existing_row, patch_dict)
     _values_update(f"{_children_tab()}!A{row_index}:ZZ{row_index}", [row_values])
 
     get_children.clear()
@@ -848,6 +877,40 @@ def update_child(child_id: str, patch_dict: dict[str, Any]) -> None:
     get_child_by_id.clear()
 
 
+def update_children_many(patches_by_child_id: dict[str, dict[str, Any]]) -> None:
+    """Aktualisiert mehrere Kinder-Zeilen mit einem gebündelten Schreibzugriff."""
+    patches = {
+        child_id.strip(): patch
+        for child_id, patch in patches_by_child_id.items()
+        if child_id.strip()
+    }
+    if not patches:
+        return
+
+    header = _ensure_children_header_columns(CHILDREN_REQUIRED_COLUMNS)
+    rows = _values_get(f"{_children_tab()}!A:ZZ")
+    id_col_index = header.index("child_id")
+    updates: list[tuple[str, list[list[str]]]] = []
+    for row_index, row in enumerate(rows[1:], start=2):
+        child_id = str(row[id_col_index]).strip() if id_col_index < len(row) else ""
+        patch = patches.pop(child_id, None)
+        if patch is None:
+            continue
+        updates.append(
+            (
+                f"{_children_tab()}!A{row_index}:ZZ{row_index}",
+                [_patched_child_row(header, row, patch)],
+            )
+        )
+    _values_batch_update(updates)
+
+    get_children.clear()
+    get_child_by_parent_email.clear()
+    get_child_by_id.clear()
+    if patches:
+        raise KeyError(f"Kinder nicht gefunden: {', '.join(sorted(patches))}")
+
+
 def delete_child(child_id: str) -> None:
     _ensure_children_header_columns(CHILDREN_REQUIRED_COLUMNS)
     row_index, _ = _get_row_index_by_id(_children_tab(), "child_id", child_id)
@@ -1085,3 +1148,49 @@ def upsert_photo_meta(file_id: str, patch_dict: dict[str, Any]) -> None:
 
     get_photo_meta_records.clear()
     get_photo_meta_by_file_id.clear()
+
+
+def upsert_photo_meta_many(patches_by_file_id: dict[str, dict[str, Any]]) -> None:
+    """Aktualisiert mehrere photo_meta-Zeilen mit einem gebündelten Schreibzugriff."""
+    patches = {
+        file_id.strip(): patch
+        for file_id, patch in patches_by_file_id.items()
+        if file_id.strip()
+    }
+    if not patches:
+        return
+
+    header = _ensure_photo_meta_header_columns(PHOTO_META_REQUIRED_COLUMNS)
+    rows = _values_get(f"{_photo_meta_tab()}!A:ZZ")
+    id_col_index = header.index("file_id")
+    updates: list[tuple[str, list[list[str]]]] = []
+    for row_index, row in enumerate(rows[1:], start=2):
+        file_id = str(row[id_col_index]).strip() if id_col_index < len(row) else ""
+        patch = patches.pop(file_id, None)
+        if patch is None:
+            continue
+        current_payload = {
+            column: str(row[index]).strip() if index < len(row) else ""
+            for index, column in enumerate(header)
+        }
+        current_payload.update(
+            {key: str(value).strip() for key, value in patch.items()}
+        )
+        updates.append(
+            (
+                f"{_photo_meta_tab()}!A{row_index}:ZZ{row_index}",
+                [[current_payload.get(column, "") for column in header]],
+            )
+        )
+    _values_batch_update(updates)
+
+    if patches:
+        new_rows = []
+        for file_id, patch in patches.items():
+            payload = {"file_id": file_id}
+            payload.update({key: str(value).strip() for key, value in patch.items()})
+            new_rows.append([str(payload.get(column, "")).strip() for column in header])
+        _values_append(f"{_photo_meta_tab()}!A:ZZ", new_rows)
+
+    get_photo_meta_records.clear()
+    get_photo_meta_by_file_id.clear()
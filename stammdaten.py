@@ -135,6 +135,42 @@ class StammdatenManager:
         children.sort(key=lambda item: item.get("name", ""))
         return children
 
+    def _child_folders_parent_id(self) -> str | None:
+        if self.storage_mode == "google" and self.config.google:
+            return self.config.google.drive_photos_root_folder_id
+        return None
+
+    def create_missing_child_folders(self) -> dict[str, str]:
+        """Legt fehlende Drive-Ordner für alle Kinder in einem Batch an."""
+        children_without_folder = {
+            str(child.get("id", "")).strip(): str(child.get("name", "")).strip()
+            for child in self.get_children()
+            if str(child.get("id", "")).strip()
+            and not str(child.get("folder_id", "")).strip()
+        }
+        if not children_without_folder:
+            return {}
+
+        folder_ids, errors = DriveAgent().create_folders(
+            children_without_folder,
+            parent_folder_id=self._child_folders_parent_id(),
+        )
+        self.update_children(
+            {
+                child_id: {"folder_id": folder_id, "photo_folder_id": folder_id}
+                for child_id, folder_id in folder_ids.items()
+            }
+        )
+        if errors:
+            first_error = next(iter(errors.values()))
+            raise DriveServiceError(
+                f"{len(errors)} Drive-Ordner konnten nicht erstellt werden: "
+                f"{first_error}",
+                status_code=first_error.status_code,
+                cause=first_error.cause,
+            )
+        return folder_ids
+
     def add_child(
         self,
         name: str,
@@ -146,13 +182,8 @@ class StammdatenManager:
         folder_id: str | None = None
         try:
             drive_agent = DriveAgent()
-            parent_folder_id = (
-                self.config.google.drive_photos_root_folder_id
-                if self.storage_mode == "google" and self.config.google
-                else None
-            )
             folder_id = drive_agent.create_folder(
-                name, parent_folder_id=parent_folder_id
+                name, parent_folder_id=self._child_folders_parent_id()
             )
         except DriveServiceError as exc:
             st.error(
@@ -311,6 +342,29 @@ class StammdatenManager:
                 return
         raise KeyError(f"Kind mit ID '{child_id}' wurde nicht gefunden.")
 
+    def update_children(self, patches_by_child_id: dict[str, dict[str, Any]]) -> None:
+        """Aktualisiert mehrere Kinder mit einem Schreibzugriff."""
+        if not patches_by_child_id:
+            return
+        if self.storage_mode == "google":
+            sheets_repo.update_children_many(patches_by_child_id)
+            return
+
+        patches = dict(patches_by_child_id)
+        children = self._read_local_children()
+        for index, child in enumerate(children):
+            new_data = patches.pop(str(child.get("id", "")), None)
+            if new_data is None:
+                continue
+            merged_data = _sync_child_parent_email({**child, **new_data})
+            merged_data["download_consent"] = _normalize_download_consent(
+                merged_data.get("download_consent")
+            )
+            children[index] = merged_data
+        self._write_local_children(children)
+        if patches:
+            raise KeyError(f"Kinder nicht gefunden: {', '.join(sorted(patches))}")
+
     def delete_child(self, child_id: str) -> None:
         """Löscht den Kind-Datensatz."""
         if self.storage_mode == "google":
@@ -491,6 +545,34 @@ class StammdatenManager:
         records.append({"file_id": normalized_file_id, **normalized_patch})
         self._write_local_photo_meta(records)
 
+    def upsert_photo_meta_many(
+        self, patches_by_file_id: dict[str, dict[str, Any]]
+    ) -> None:
+        """Legt mehrere Foto-Metadaten gebündelt an bzw. aktualisiert sie."""
+        normalized_patches = {
+            file_id.strip(): {
+                key: str(value).strip() for key, value in patch_data.items()
+            }
+            for file_id, patch_data in patches_by_file_id.items()
+            if file_id.strip()
+        }
+        if not normalized_patches:
+            return
+
+        if self.storage_mode == "google":
+            sheets_repo.upsert_photo_meta_many(normalized_patches)
+            return
+
+        records = self._read_local_photo_meta()
+        for index, record in enumerate(records):
+            file_id = str(record.get("file_id", "")).strip()
+            patch_data = normalized_patches.pop(file_id, None)
+            if patch_data is not None:
+                records[index] = {**record, **patch_data, "file_id": file_id}
+        for file_id, patch_data in normalized_patches.items():
+            records.append({"file_id": file_id, **patch_data})
+        self._write_local_photo_meta(records)
+
     def add_medication(
         self,
         child_id: str,
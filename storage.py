@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
+from collections.abc import Iterator, MutableMapping
 from pathlib import Path
 from typing import Any
 
@@ -10,18 +12,31 @@ from googleapiclient.errors import HttpError
 
 from config import get_app_config
 from services.drive_service import (
+    DriveServiceError,
+    batch_create_folders,
+    batch_trash_files,
+    batch_update_app_properties,
+    copy_file as copy_google_file,
     create_folder as create_google_folder,
-    download_file as download_google_file,
+    fetch_file_bytes as fetch_google_file_bytes,
+    list_files_page as list_google_files_page,
     list_files_in_folder,
     translate_http_error,
+    update_app_properties as update_google_app_properties,
     upload_bytes_to_folder,
 )
+from services.drive_sync import get_folder_mirror
 
 
 def _safe_name(name: str) -> str:
     return "".join(char if char.isalnum() or char in "-_" else "_" for char in name)
 
 
+def md5_checksum(content_bytes: bytes) -> str:
+    """Hex-MD5 wie Drive es als ``md5Checksum`` liefert."""
+    return hashlib.md5(content_bytes, usedforsecurity=False).hexdigest()
+
+
 class DriveAgent:
     def __init__(self) -> None:
         app_config = get_app_config()
@@ -32,23 +47,33 @@ class DriveAgent:
         if self.storage_mode != "google":
             self.local_drive_root.mkdir(parents=True, exist_ok=True)
 
-    def _read_index(self) -> dict[str, dict[str, str]]:
+    def _read_index(self) -> dict[str, dict[str, Any]]:
         if not self.index_file.exists():
             return {}
         return json.loads(self.index_file.read_text(encoding="utf-8"))
 
-    def _write_index(self, index: dict[str, dict[str, str]]) -> None:
+    def _write_index(self, index: dict[str, dict[str, Any]]) -> None:
         self.index_file.write_text(
             json.dumps(index, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
 
     def list_files(
-        self, folder_id: str, mime_type_filter: str | None = None
+        self,
+        folder_id: str,
+        mime_type_filter: str | None = None,
+        *,
+        incremental: bool = False,
     ) -> list[dict[str, Any]]:
-        """Gibt eine Liste der Dateien in einem Ordner zurück."""
+        """Gibt eine Liste der Dateien in einem Ordner zurück.
+
+        Mit ``incremental=True`` wird im Google-Modus ein prozessweiter
+        Ordner-Spiegel genutzt, der nur Änderungen über den Changes-Feed lädt.
+        """
         if self.storage_mode == "google":
             try:
+                if incremental:
+                    return get_folder_mirror(folder_id).list_files(mime_type_filter)
                 return list_files_in_folder(folder_id, mime_type_filter)
             except HttpError as exc:
                 raise translate_http_error(exc) from exc
@@ -61,17 +86,51 @@ class DriveAgent:
             mime_type = metadata.get("mimeType", "")
             if mime_type_filter and mime_type_filter not in mime_type:
                 continue
-            files.append(
-                {"id": file_id, "name": metadata.get("name"), "mimeType": mime_type}
-            )
+            file_entry: dict[str, Any] = {
+                "id": file_id,
+                "name": metadata.get("name"),
+                "mimeType": mime_type,
+            }
+            if metadata.get("md5Checksum"):
+                file_entry["md5Checksum"] = metadata["md5Checksum"]
+            if metadata.get("appProperties"):
+                file_entry["appProperties"] = dict(metadata["appProperties"])
+            files.append(file_entry)
         files.sort(key=lambda item: str(item.get("name", "")))
         return files
 
+    def list_files_page(
+        self,
+        folder_id: str,
+        *,
+        page_size: int = 24,
+        page_token: str | None = None,
+        mime_type_filter: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Lädt eine einzelne Listing-Seite (lokal: Offset als Page-Token)."""
+        if self.storage_mode == "google":
+            return list_google_files_page(
+                folder_id,
+                page_size=page_size,
+                page_token=page_token,
+                mime_type_filter=mime_type_filter,
+            )
+
+        files = self.list_files(folder_id, mime_type_filter)
+        offset = int(page_token or 0)
+        next_offset = offset + page_size
+        next_token = str(next_offset) if next_offset < len(files) else None
+        return files[offset:next_offset], next_token
+
     @st.cache_data(show_spinner=False)
     def download_file(self, file_id: str) -> bytes:
         """Lädt eine Datei herunter."""
+        return self.fetch_file(file_id)
+
+    def fetch_file(self, file_id: str) -> bytes:
+        """Lädt eine Datei ohne Streamlit-Cache (z. B. für Hintergrund-Threads)."""
         if self.storage_mode == "google":
-            return download_google_file(file_id)
+            return fetch_google_file_bytes(file_id)
 
         index = self._read_index()
         metadata = index.get(file_id)
@@ -86,6 +145,7 @@ class DriveAgent:
         content_bytes: bytes,
         mime_type: str,
         parent_folder_id: str | None,
+        app_properties: dict[str, str] | None = None,
     ) -> str | None:
         """Lädt eine Datei hoch und gibt die File-ID zurück."""
         if self.storage_mode == "google":
@@ -95,6 +155,7 @@ class DriveAgent:
                     name,
                     content_bytes,
                     mime_type,
+                    app_properties,
                 )
             except HttpError as exc:
                 raise translate_http_error(exc) from exc
@@ -114,11 +175,78 @@ class DriveAgent:
             "mimeType": mime_type,
             "folder_id": folder_id,
             "path": str(path),
+            "md5Checksum": md5_checksum(content_bytes),
         }
+        if app_properties:
+            index[file_id]["appProperties"] = dict(app_properties)
         self._write_index(index)
         self.download_file.clear()
         return file_id
 
+    def find_file_by_md5(self, folder_id: str, checksum: str) -> dict[str, Any] | None:
+        """Sucht eine Datei mit identischem Inhalt (``md5Checksum``) im Ordner.
+
+        Im Google-Modus dient der inkrementelle Ordner-Spiegel als Prüfsummen-
+        Index; lokal werden fehlende Prüfsummen einmalig berechnet und im Index
+        gespeichert.
+        """
+        if not checksum:
+            return None
+
+        if self.storage_mode == "google":
+            for item in self.list_files(folder_id, incremental=True):
+                if item.get("md5Checksum") == checksum:
+                    return item
+            return None
+
+        index = self._read_index()
+        index_changed = False
+        match: dict[str, Any] | None = None
+        for file_id, metadata in index.items():
+            if metadata.get("folder_id") != folder_id:
+                continue
+            if not metadata.get("md5Checksum"):
+                path = Path(metadata.get("path", ""))
+                if not path.is_file():
+                    continue
+                metadata["md5Checksum"] = md5_checksum(path.read_bytes())
+                index_changed = True
+            if metadata["md5Checksum"] == checksum:
+                match = {
+                    "id": file_id,
+                    "name": metadata.get("name"),
+                    "mimeType": metadata.get("mimeType", ""),
+                    "md5Checksum": checksum,
+                    "appProperties": dict(metadata.get("appProperties") or {}),
+                }
+                break
+        if index_changed:
+            self._write_index(index)
+        return match
+
+    def copy_file(
+        self,
+        file_id: str,
+        name: str,
+        parent_folder_id: str | None,
+        app_properties: dict[str, str] | None = None,
+    ) -> str | None:
+        """Legt eine Kopie einer vorhandenen Datei an (Google: serverseitig)."""
+        if self.storage_mode == "google":
+            return copy_google_file(file_id, parent_folder_id, name, app_properties)
+
+        index = self._read_index()
+        metadata = index.get(file_id)
+        if not metadata:
+            raise FileNotFoundError(f"Datei mit ID '{file_id}' nicht gefunden.")
+        return self.upload_file(
+            name,
+            Path(metadata["path"]).read_bytes(),
+            metadata.get("mimeType", "application/octet-stream"),
+            parent_folder_id,
+            app_properties=app_properties,
+        )
+
     def create_folder(
         self, name: str, parent_folder_id: str | None = None
     ) -> str | None:
@@ -130,3 +258,180 @@ class DriveAgent:
         folder_path = self.local_drive_root / folder_id
         folder_path.mkdir(parents=True, exist_ok=True)
         return folder_id
+
+    def create_folders(
+        self,
+        names_by_key: dict[str, str],
+        parent_folder_id: str | None = None,
+    ) -> tuple[dict[str, str], dict[str, DriveServiceError]]:
+        """Erstellt mehrere Ordner gebündelt und liefert IDs und Fehler je Schlüssel."""
+        if self.storage_mode == "google":
+            result = batch_create_folders(names_by_key, parent_id=parent_folder_id)
+            folder_ids = {
+                key: str(response.get("id", ""))
+                for key, response in result.responses.items()
+                if response.get("id")
+            }
+            return folder_ids, result.errors
+
+        folder_ids = {}
+        for key, name in names_by_key.items():
+            folder_id = self.create_folder(name, parent_folder_id=parent_folder_id)
+            if folder_id:
+                folder_ids[key] = folder_id
+        return folder_ids, {}
+
+    def trash_files(
+        self, file_ids: list[str]
+    ) -> tuple[list[str], dict[str, DriveServiceError]]:
+        """Verschiebt Dateien in den Papierkorb; liefert IDs und Fehler je Datei."""
+        if self.storage_mode == "google":
+            result = batch_trash_files(file_ids)
+            return list(result.responses), result.errors
+
+        index = self._read_index()
+        trashed_ids: list[str] = []
+        for file_id in file_ids:
+            metadata = index.pop(file_id, None)
+            if not metadata:
+                continue
+            Path(metadata["path"]).unlink(missing_ok=True)
+            trashed_ids.append(file_id)
+        if trashed_ids:
+            self._write_index(index)
+            self.download_file.clear()
+        return trashed_ids, {}
+
+    def update_app_properties(
+        self,
+        app_properties_by_file_id: dict[str, dict[str, str]],
+    ) -> tuple[list[str], dict[str, DriveServiceError]]:
+        """Setzt appProperties für eine oder mehrere Dateien (Batch ab zwei Dateien).
+
+        Liefert die aktualisierten IDs und die Fehler je Datei.
+        """
+        if not app_properties_by_file_id:
+            return [], {}
+
+        if self.storage_mode == "google":
+            if len(app_properties_by_file_id) == 1:
+                file_id, app_properties = next(iter(app_properties_by_file_id.items()))
+                try:
+                    update_google_app_properties(file_id, app_properties)
+                except DriveServiceError as exc:
+                    return [], {file_id: exc}
+                return [file_id], {}
+            result = batch_update_app_properties(app_properties_by_file_id)
+            return list(result.responses), result.errors
+
+        index = self._read_index()
+        updated_ids: list[str] = []
+        for file_id, app_properties in app_properties_by_file_id.items():
+            if file_id not in index:
+                continue
+            index[file_id]["appProperties"] = {
+                **(index[file_id].get("appProperties") or {}),
+                **app_properties,
+            }
+            updated_ids.append(file_id)
+        if updated_ids:
+            self._write_index(index)
+        return updated_ids, {}
+
+
+class LazyFileListing:
+    """Seitenweises, fortsetzbares Ordner-Listing mit Page-Tokens im Session State.
+
+    Seiten werden erst beim Zugriff geladen; bereits geladene Seiten und die
+    Tokens für Folgeseiten bleiben unter ``state_key`` erhalten, solange sich
+    Ordner, Filter und Seitengröße nicht ändern.
+    """
+
+    def __init__(
+        self,
+        drive_agent: DriveAgent,
+        folder_id: str,
+        *,
+        state: MutableMapping[str, Any],
+        state_key: str,
+        page_size: int = 24,
+        mime_type_filter: str | None = None,
+    ) -> None:
+        self.drive_agent = drive_agent
+        self.folder_id = folder_id
+        self.page_size = page_size
+        self.mime_type_filter = mime_type_filter
+        self._state = state
+        self._state_key = state_key
+
+    @property
+    def _signature(self) -> tuple[Any, ...]:
+        return (
+            self.folder_id,
+            self.page_size,
+            self.mime_type_filter,
+        )
+
+    def _listing_state(self) -> dict[str, Any]:
+        listing_state = self._state.get(self._state_key)
+        if (
+            not isinstance(listing_state, dict)
+            or listing_state.get("signature") != self._signature
+        ):
+            listing_state = {
+                "signature": self._signature,
+                "pages": [],
+                "next_token": None,
+                "exhausted": False,
+            }
+            self._state[self._state_key] = listing_state
+        return listing_state
+
+    @property
+    def loaded_page_count(self) -> int:
+        return len(self._listing_state()["pages"])
+
+    @property
+    def has_more(self) -> bool:
+        return not self._listing_state()["exhausted"]
+
+    def load_next_page(self) -> list[dict[str, Any]]:
+        """Lädt die nächste Seite mit genau einem Request (leer, wenn erschöpft)."""
+        listing_state = self._listing_state()
+        if listing_state["exhausted"]:
+            return []
+
+        files, next_token = self.drive_agent.list_files_page(
+            self.folder_id,
+            page_size=self.page_size,
+            page_token=listing_state["next_token"],
+            mime_type_filter=self.mime_type_filter,
+        )
+        listing_state["pages"].append(files)
+        listing_state["next_token"] = next_token
+        listing_state["exhausted"] = not next_token
+        return files
+
+    def page(self, index: int) -> list[dict[str, Any]]:
+        """Liefert Seite ``index`` und lädt fehlende Seiten bis dorthin nach."""
+        listing_state = self._listing_state()
+        while len(listing_state["pages"]) <= index and not listing_state["exhausted"]:
+            self.load_next_page()
+        if index < len(listing_state["pages"]):
+            return listing_state["pages"][index]
+        return []
+
+    def loaded_items(self) -> list[dict[str, Any]]:
+        return [item for page in self._listing_state()["pages"] for item in page]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        index = 0
+        while True:
+            page_items = self.page(index)
+            if not page_items and not self.has_more:
+                return
+            yield from page_items
+            index += 1
+
+    def reset(self) -> None:
+        self._state.pop(self._state_key, None)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from services.media_derivatives import MediaDerivativeStore
+
+
+@pytest.fixture
+def make_jpeg() -> Callable[[int, int], bytes]:
+    """Fabrik für einfarbige Test-JPEGs in ``width`` x ``height``."""
+    import cv2
+    import numpy as np
+
+    def _jpeg(width: int, height: int) -> bytes:
+        image = np.full((height, width, 3), 127, dtype=np.uint8)
+        return cv2.imencode(".jpg", image)[1].tobytes()
+
+    return _jpeg
+
+
+@pytest.fixture
+def local_derivative_store(tmp_path) -> MediaDerivativeStore:
+    """Varianten-Speicher im lokalen Modus unter ``tmp_path / "derivatives"``."""
+    from services.media_derivatives import MediaDerivativeStore
+
+    return MediaDerivativeStore(
+        SimpleNamespace(storage_mode="local"), "photos", tmp_path / "derivatives"
+    )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import zipfile
+
+import pytest
+
+from services import album_export
+from services.album_export import AlbumEntry, write_album_zip
+from services.photos_service import PixelationResult
+
+
+def _names(export) -> dict[str, bytes]:
+    with zipfile.ZipFile(export.archive) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def test_unpixelated_album_contains_originals_with_unique_names() -> None:
+    export = write_album_zip(
+        [AlbumEntry("a", "photo.jpg"), AlbumEntry("b", "photo.jpg")],
+        consent_mode="unpixelated",
+        load_original=lambda file_id: file_id.encode(),
+        find_pixelated=lambda entry: b"must-not-be-used",
+    )
+
+    assert _names(export) == {"photo.jpg": b"a", "photo_1.jpg": b"b"}
+    assert export.file_count == 2
+
+
+def test_pixelated_album_reuses_stored_variants_and_pixelates_the_rest(
+    monkeypatch,
+) -> None:
+    def _fake_batch(images, settings, *, max_in_flight=None):
+        for key, payload in images:
+            if key == "broken":
+                yield PixelationResult(key, error=ValueError("kaputt"))
+            else:
+                yield PixelationResult(key, data=b"pixelated-" + payload)
+
+    monkeypatch.setattr(album_export, "pixelate_batch", _fake_batch)
+
+    export = write_album_zip(
+        [
+            AlbumEntry("cached", "a.jpg"),
+            AlbumEntry("fresh", "b.jpg"),
+            AlbumEntry("broken", "c.jpg"),
+        ],
+        consent_mode="pixelated",
+        load_original=lambda file_id: file_id.encode(),
+        find_pixelated=lambda entry: b"stored" if entry.file_id == "cached" else None,
+    )
+
+    assert _names(export) == {"a.jpg": b"stored", "b.jpg": b"pixelated-fresh"}
+    assert list(export.skipped) == ["broken"]
+
+
+def test_denied_consent_rejects_album_export() -> None:
+    with pytest.raises(PermissionError):
+        write_album_zip([], consent_mode="denied", load_original=lambda _: b"")
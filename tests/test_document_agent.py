@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
 from docx import Document
+from openai import RateLimitError
 
 from config import AppConfig, LocalConfig, OpenAIConfig
-from documents import DocumentAgent
+from documents import DocumentAgent, DocumentGenerationError
+from services.generation_cache import GenerationCache
+from services.report_batch import is_rate_limit_error
 
 
 def _doc_text(doc_bytes: bytes) -> str:
@@ -73,7 +79,9 @@ def test_generate_care_contract_in_english_and_draft(monkeypatch) -> None:
 def test_generate_document_supports_language_and_draft(monkeypatch) -> None:
     agent = _agent(monkeypatch)
 
-    def _fake_generate_with_retry(prompt: str) -> dict[str, str]:
+    def _fake_generate_with_retry(
+        prompt: str, on_progress=None, *, retry_rate_limits=True
+    ) -> dict[str, str]:
         assert "Write the report fully in English." in prompt
         return {"title": "Weekly report", "body": "Everything went well."}
 
@@ -92,3 +100,127 @@ def test_generate_document_supports_language_and_draft(monkeypatch) -> None:
     assert "Weekly report" in text
     assert filename.startswith("Report_Luca_")
     assert filename.endswith("_Entwurf.docx")
+
+
+def test_generate_document_reuses_cached_response(monkeypatch, tmp_path) -> None:
+    agent = _agent(monkeypatch)
+    agent.client = object()
+    agent.generation_cache = GenerationCache(tmp_path, ttl_seconds=3600, max_entries=10)
+    calls: list[str] = []
+
+    def _fake_generate_with_retry(
+        prompt: str, on_progress=None, *, retry_rate_limits=True
+    ) -> dict[str, str]:
+        calls.append(prompt)
+        return {"title": "Bericht", "body": f"Version {len(calls)}"}
+
+    monkeypatch.setattr(agent, "_generate_with_retry", _fake_generate_with_retry)
+
+    draft_bytes, _ = agent.generate_document({"name": "Mia"}, "Notiz", is_draft=True)
+    final_bytes, _ = agent.generate_document({"name": "Mia"}, "Notiz")
+    regenerated_bytes, _ = agent.generate_document(
+        {"name": "Mia"}, "Notiz", regenerate=True
+    )
+
+    assert len(calls) == 2
+    assert "Version 1" in _doc_text(draft_bytes)
+    assert "Version 1" in _doc_text(final_bytes)
+    assert "Version 2" in _doc_text(regenerated_bytes)
+
+
+def test_generation_cache_expires_and_caps_entries(tmp_path) -> None:
+    now = [1000.0]
+    cache = GenerationCache(
+        tmp_path, ttl_seconds=60, max_entries=2, clock=lambda: now[0]
+    )
+    cache.put("a", {"title": "A", "body": "a"})
+    assert cache.get("a") == {"title": "A", "body": "a"}
+
+    now[0] += 61
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.json").exists()
+
+    for key in ("b", "c", "d"):
+        cache.put(key, {"title": key, "body": key})
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_generate_care_contracts_for_group_share_template(monkeypatch) -> None:
+    agent = _agent(monkeypatch)
+
+    documents = agent.generate_care_contracts(
+        [{"name": "Mia", "group": "Sonne"}, {"name": "Ben", "allergies": "Nüsse"}]
+    )
+
+    assert [name.split("_")[1] for _, name in documents] == ["Mia", "Ben"]
+    assert "Gruppe: Sonne" in _doc_text(documents[0][0])
+    assert "Allergien: Nüsse" in _doc_text(documents[1][0])
+    assert "ENTWURF / DRAFT" not in _doc_text(documents[1][0])
+
+
+class _FakeStreamingResponses:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.kwargs: dict[str, object] = {}
+
+    def create(self, **kwargs):
+        self.kwargs = kwargs
+        for chunk in self.chunks:
+            yield SimpleNamespace(type="response.output_text.delta", delta=chunk)
+        yield SimpleNamespace(
+            type="response.completed",
+            response=SimpleNamespace(output_text="".join(self.chunks)),
+        )
+
+
+def test_streaming_reports_partial_body_and_validates_result(monkeypatch) -> None:
+    agent = _agent(monkeypatch)
+    responses = _FakeStreamingResponses(
+        ['{"title": "Woche', '", "body": "Mia hat ', "gemalt.\\nSch", 'ön!"}']
+    )
+    agent.client = SimpleNamespace(responses=responses)
+    agent.generation_cache = None
+    previews: list[str] = []
+
+    doc_bytes, _ = agent.generate_document(
+        {"name": "Mia"}, "Notiz", on_progress=previews.append
+    )
+
+    assert responses.kwargs["stream"] is True
+    assert previews == ["Mia hat ", "Mia hat gemalt.\nSch", "Mia hat gemalt.\nSchön!"]
+    assert "Mia hat gemalt." in _doc_text(doc_bytes)
+
+
+def test_streaming_rejects_payload_outside_schema(monkeypatch) -> None:
+    agent = _agent(monkeypatch)
+    agent.client = SimpleNamespace(
+        responses=_FakeStreamingResponses(['{"title": "T", "body": "B", "x": 1}'])
+    )
+    agent.generation_cache = None
+
+    with pytest.raises(DocumentGenerationError):
+        agent.generate_document({"name": "Mia"}, "Notiz", on_progress=lambda _: None)
+
+
+class _FakeRateLimitError(RateLimitError):
+    def __init__(self) -> None:
+        Exception.__init__(self, "rate limited")
+
+
+def test_rate_limits_pass_through_without_inner_retries(monkeypatch) -> None:
+    agent = _agent(monkeypatch)
+    agent.generation_cache = None
+    agent.openai_config = replace(agent.openai_config, max_retries=3)
+    calls: list[dict[str, object]] = []
+
+    def _create(**kwargs):
+        calls.append(kwargs)
+        raise _FakeRateLimitError()
+
+    agent.client = SimpleNamespace(responses=SimpleNamespace(create=_create))
+
+    with pytest.raises(DocumentGenerationError) as excinfo:
+        agent.generate_document({"name": "Mia"}, "Notiz", retry_rate_limits=False)
+
+    assert len(calls) == 1
+    assert is_rate_limit_error(excinfo.value)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from tempfile import SpooledTemporaryFile
+
+from services.document_jobs import DocumentJobQueue, DocumentJobResult
+
+
+def test_jobs_run_concurrently_and_are_retrievable_by_id() -> None:
+    queue = DocumentJobQueue(max_workers=2)
+    release = threading.Event()
+    started = threading.Barrier(3)
+
+    def _task(name: str) -> DocumentJobResult:
+        started.wait(timeout=5)
+        release.wait(timeout=5)
+        return DocumentJobResult(doc_bytes=name.encode(), file_name=f"{name}.docx")
+
+    first = queue.submit("A", lambda: _task("a"))
+    second = queue.submit("B", lambda: _task("b"))
+    started.wait(timeout=5)
+
+    assert [job.status for job in queue.jobs([first, second])] == [
+        "running",
+        "running",
+    ]
+    release.set()
+    queue._executor.shutdown(wait=True)
+
+    done = queue.get(second)
+    assert done is not None
+    assert done.status == "done"
+    assert done.result == DocumentJobResult(doc_bytes=b"b", file_name="b.docx")
+
+
+def test_failed_job_keeps_message_and_old_jobs_are_pruned() -> None:
+    queue = DocumentJobQueue(max_workers=1, max_finished=1)
+
+    def _fail() -> DocumentJobResult:
+        raise RuntimeError("Ratenlimit")
+
+    failed = queue.submit("A", _fail)
+    queue._executor.shutdown(wait=True)
+    job = queue.get(failed)
+    assert job is not None
+    assert job.status == "failed"
+    assert job.error == "Ratenlimit"
+
+    queue = DocumentJobQueue(max_workers=1, max_finished=1)
+    older = queue.submit("old", lambda: DocumentJobResult(b"", "old.docx"))
+    newer = queue.submit("new", lambda: DocumentJobResult(b"", "new.docx"))
+    queue._executor.shutdown(wait=True)
+    assert queue.get(older) is None
+    assert queue.get(newer) is not None
+
+
+def test_progress_callback_updates_job_preview() -> None:
+    queue = DocumentJobQueue(max_workers=1)
+    reported = threading.Event()
+    release = threading.Event()
+
+    def _task(*, on_progress) -> DocumentJobResult:
+        on_progress("Zwischenstand")
+        reported.set()
+        release.wait(timeout=5)
+        return DocumentJobResult(b"", "a.docx")
+
+    job_id = queue.submit("A", _task, with_progress=True)
+    reported.wait(timeout=5)
+    job = queue.get(job_id)
+    assert job is not None
+    assert job.pending
+    assert job.preview == "Zwischenstand"
+
+    release.set()
+    queue._executor.shutdown(wait=True)
+    assert queue.get(job_id).status == "done"
+
+
+def test_spooled_result_is_read_on_download_and_closed_on_discard() -> None:
+    with SpooledTemporaryFile() as archive:
+        archive.write(b"PK-Inhalt")
+        result = DocumentJobResult(b"", "Berichte.zip", archive=archive)
+        queue = DocumentJobQueue(max_workers=1)
+        job_id = queue.submit("Berichte", lambda: result)
+        queue._executor.shutdown(wait=True)
+
+        data = queue.get(job_id).result.download_data()
+        assert callable(data)
+        assert data() == b"PK-Inhalt"
+
+        queue.discard(job_id)
+        assert archive.closed
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from ui import document_list
+from ui.document_list import document_revision, render_document_list
+
+FILES = [
+    {"id": "doc-1", "name": "Bericht.docx", "modifiedTime": "2026-03-01T08:30:00Z"},
+    {"id": "doc-2", "name": "Vertrag.docx", "md5Checksum": "md5-2"},
+]
+
+
+class _FakeStreamlit:
+    def __init__(self, open_keys: set[str]) -> None:
+        self.open_keys = open_keys
+        self.downloads: list[dict[str, object]] = []
+        self.markdown_calls: list[str] = []
+
+    def expander(self, label: str, *, key: str, on_change: str):
+        return _FakeExpander(open=key in self.open_keys)
+
+    def caption(self, _text: str) -> None:
+        return None
+
+    def markdown(self, text: str) -> None:
+        self.markdown_calls.append(text)
+
+    def download_button(self, label: str, **kwargs) -> None:
+        self.downloads.append(kwargs)
+
+
+class _FakeExpander(SimpleNamespace):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+
+def test_document_revision_prefers_modified_time() -> None:
+    assert document_revision(FILES[0]) == "2026-03-01T08:30:00Z"
+    assert document_revision(FILES[1]) == "md5-2"
+    assert not document_revision({"id": "x"})
+
+
+def test_listing_loads_content_only_for_open_previews(monkeypatch) -> None:
+    fake_st = _FakeStreamlit(open_keys={"admin_preview_doc-2"})
+    monkeypatch.setattr(document_list, "st", fake_st)
+    loaded: list[tuple[str, str]] = []
+    previews: list[tuple[str, str]] = []
+
+    def _load_bytes(file_id: str, revision: str) -> bytes:
+        loaded.append((file_id, revision))
+        return b"docx"
+
+    def _load_preview(file_id: str, revision: str) -> str:
+        previews.append((file_id, revision))
+        return "Vorschau"
+
+    render_document_list(
+        FILES,
+        key_prefix="admin",
+        load_bytes=_load_bytes,
+        load_preview=_load_preview,
+    )
+
+    assert previews == [("doc-2", "md5-2")]
+    assert loaded == []
+    assert [download["key"] for download in fake_st.downloads] == [
+        "admin_download_doc-1",
+        "admin_download_doc-2",
+    ]
+    assert fake_st.downloads[0]["data"]() == b"docx"
+    assert loaded == [("doc-1", "2026-03-01T08:30:00Z")]
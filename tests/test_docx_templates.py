@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from docx import Document
+
+from services.docx_templates import DocxTemplate
+
+
+def _template() -> DocxTemplate:
+    doc = Document()
+    doc.add_paragraph("{{draft_marker}}")
+    doc.add_paragraph("")
+    doc.add_paragraph("Kind: {{child_name}}")
+    doc.add_paragraph("{{notes}}")
+    return DocxTemplate.from_document(doc)
+
+
+def _paragraphs(doc_bytes: bytes) -> list[str]:
+    return [paragraph.text for paragraph in Document(BytesIO(doc_bytes)).paragraphs]
+
+
+def test_render_escapes_values_and_drops_empty_placeholder_paragraphs() -> None:
+    template = _template()
+
+    doc_bytes = template.render(
+        {"draft_marker": "", "child_name": "Mia <&> Ben", "notes": "Zeile 1\nZeile 2"}
+    )
+
+    assert _paragraphs(doc_bytes) == ["", "Kind: Mia <&> Ben", "Zeile 1\nZeile 2"]
+
+
+def test_render_strips_xml_invalid_control_characters() -> None:
+    doc_bytes = _template().render(
+        {"draft_marker": "", "child_name": "Mia\x0b Ben\x00", "notes": "a\x1fb"}
+    )
+
+    assert _paragraphs(doc_bytes) == ["", "Kind: Mia Ben", "ab"]
+
+
+def test_render_keeps_template_reusable() -> None:
+    template = _template()
+
+    first = template.render(
+        {"draft_marker": "ENTWURF", "child_name": "A", "notes": "x"}
+    )
+    second = template.render({"draft_marker": "", "child_name": "B", "notes": "y"})
+
+    assert _paragraphs(first)[0] == "ENTWURF"
+    assert "Kind: B" in _paragraphs(second)
+    assert "{{child_name}}" in template.document_xml
+
+
+def test_render_rejects_missing_values() -> None:
+    with pytest.raises(ValueError, match="child_name"):
+        _template().render({"draft_marker": "", "notes": ""})
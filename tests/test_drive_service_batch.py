@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+import storage
+from services import drive_service
+from services.drive_service import DriveBatchResult, DriveServiceError
+
+
+class _FakeRequest:
+    def __init__(self, method: str, **kwargs: Any) -> None:
+        self.method = method
+        self.kwargs = kwargs
+
+
+class _FakeFiles:
+    def get(self, **kwargs: Any) -> _FakeRequest:
+        return _FakeRequest("get", **kwargs)
+
+    def create(self, **kwargs: Any) -> _FakeRequest:
+        return _FakeRequest("create", **kwargs)
+
+
+class _FakeBatch:
+    def __init__(self, drive: _FakeDrive, callback: Any) -> None:
+        self.drive = drive
+        self.callback = callback
+        self.requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self.drive.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, *self.drive.respond(request))
+
+
+class _FakeDrive:
+    def __init__(self, responses: dict[str, Any] | None = None) -> None:
+        self.responses = responses or {}
+        self.batch_sizes: list[int] = []
+
+    def files(self) -> _FakeFiles:
+        return _FakeFiles()
+
+    def new_batch_http_request(self, callback: Any) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+    def respond(self, request: _FakeRequest) -> tuple[Any, Exception | None]:
+        key = request.kwargs.get("fileId") or request.kwargs["body"]["name"]
+        response = self.responses.get(key, {"id": f"id-{key}"})
+        if isinstance(response, Exception):
+            return None, response
+        return response, None
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"error")
+
+
+def test_batch_create_folders_chunks_requests_by_batch_limit(monkeypatch) -> None:
+    fake_drive = _FakeDrive()
+    monkeypatch.setattr(drive_service, "get_drive_client", lambda: fake_drive)
+    names = {f"child-{index}": f"Kind {index}" for index in range(150)}
+
+    result = drive_service.batch_create_folders(names, parent_id="root-folder")
+
+    assert fake_drive.batch_sizes == [100, 50]
+    assert result.ok
+    assert result.responses["child-7"] == {"id": "id-Kind 7"}
+
+
+def test_batch_get_metadata_translates_errors_per_file(monkeypatch) -> None:
+    fake_drive = _FakeDrive({"missing": _http_error(404)})
+    monkeypatch.setattr(drive_service, "get_drive_client", lambda: fake_drive)
+
+    result = drive_service.batch_get_metadata(["file-1", "missing", "file-1", " "])
+
+    assert fake_drive.batch_sizes == [2]
+    assert set(result.responses) == {"file-1"}
+    assert result.errors["missing"].cause == "not_found"
+
+
+def test_batch_check_folder_access_flags_unreadable_folders(monkeypatch) -> None:
+    fake_drive = _FakeDrive(
+        {
+            "readable": {
+                "id": "readable",
+                "mimeType": drive_service.DRIVE_FOLDER_MIME_TYPE,
+                "capabilities": {"canListChildren": True},
+            },
+            "locked": {
+                "id": "locked",
+                "mimeType": drive_service.DRIVE_FOLDER_MIME_TYPE,
+                "capabilities": {"canListChildren": False},
+            },
+            "document": {"id": "document", "mimeType": "application/pdf"},
+        }
+    )
+    monkeypatch.setattr(drive_service, "get_drive_client", lambda: fake_drive)
+
+    result = drive_service.batch_check_folder_access(["readable", "locked", "document"])
+
+    assert fake_drive.batch_sizes == [3]
+    assert set(result.responses) == {"readable"}
+    assert result.errors["locked"].cause == "forbidden"
+    assert result.errors["document"].cause == "not_a_folder"
+
+
+def test_drive_agent_batch_updates_report_errors_per_file(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(
+        storage,
+        "get_app_config",
+        lambda: SimpleNamespace(
+            storage_mode="google", local=SimpleNamespace(drive_root=tmp_path)
+        ),
+    )
+    failure = DriveServiceError("nope", cause="forbidden")
+    batch_result = DriveBatchResult(
+        responses={"ok": {"id": "ok"}}, errors={"locked": failure}
+    )
+    monkeypatch.setattr(storage, "batch_trash_files", lambda _ids: batch_result)
+    monkeypatch.setattr(
+        storage, "batch_update_app_properties", lambda _updates: batch_result
+    )
+    drive_agent = storage.DriveAgent()
+
+    assert drive_agent.trash_files(["ok", "locked"]) == (["ok"], {"locked": failure})
+    assert drive_agent.update_app_properties(
+        {"ok": {"status": "draft"}, "locked": {"status": "draft"}}
+    ) == (["ok"], {"locked": failure})
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any
+
+from services import drive_service
+
+
+class _FakeListRequest:
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        self.kwargs = kwargs
+
+    def execute(self) -> dict[str, Any]:
+        return {"files": [{"id": "a", "mimeType": "image/jpeg"}]}
+
+
+class _FakeFiles:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def list(self, **kwargs: Any) -> _FakeListRequest:
+        self.queries.append(kwargs["q"])
+        return _FakeListRequest(kwargs)
+
+
+class _FakeDrive:
+    def __init__(self) -> None:
+        self._files = _FakeFiles()
+
+    def files(self) -> _FakeFiles:
+        return self._files
+
+
+def test_list_files_in_folder_queries_folder_and_mime_prefix(monkeypatch) -> None:
+    fake_drive = _FakeDrive()
+    monkeypatch.setattr(drive_service, "get_drive_client", lambda: fake_drive)
+
+    drive_service.list_files_in_folder("photos", "image/")
+
+    assert fake_drive.files().queries == [
+        "'photos' in parents and trashed = false and mimeType contains 'image'"
+    ]
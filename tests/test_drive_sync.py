@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Any
+
+from services import drive_sync
+
+
+class _Executable:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def execute(self) -> dict[str, Any]:
+        return self.payload
+
+
+class _FakeChanges:
+    def __init__(self, pages: list[dict[str, Any]]) -> None:
+        self.pages = pages
+        self.requested_tokens: list[str] = []
+
+    def getStartPageToken(self, **_: Any) -> _Executable:
+        return _Executable({"startPageToken": "token-1"})
+
+    def list(self, pageToken: str, **_: Any) -> _Executable:
+        self.requested_tokens.append(pageToken)
+        return _Executable(self.pages.pop(0))
+
+
+class _FakeDrive:
+    def __init__(self, pages: list[dict[str, Any]]) -> None:
+        self._changes = _FakeChanges(pages)
+
+    def changes(self) -> _FakeChanges:
+        return self._changes
+
+
+def test_folder_mirror_applies_only_changes_after_initial_listing(monkeypatch) -> None:
+    fake_drive = _FakeDrive(
+        [
+            {
+                "nextPageToken": "token-2",
+                "changes": [
+                    {
+                        "fileId": "new",
+                        "file": {
+                            "id": "new",
+                            "name": "new.jpg",
+                            "mimeType": "image/jpeg",
+                            "modifiedTime": "2026-02-01T00:00:00Z",
+                            "parents": ["photos"],
+                        },
+                    },
+                    {"fileId": "old", "removed": True},
+                ],
+            },
+            {
+                "newStartPageToken": "token-3",
+                "changes": [
+                    {
+                        "fileId": "moved",
+                        "file": {"id": "moved", "parents": ["elsewhere"]},
+                    },
+                    {
+                        "fileId": "other-folder",
+                        "file": {"id": "other-folder", "parents": ["elsewhere"]},
+                    },
+                ],
+            },
+            {"newStartPageToken": "token-3", "changes": []},
+        ]
+    )
+    full_listings: list[str] = []
+
+    def _fake_list_files_in_folder(folder_id: str) -> list[dict[str, Any]]:
+        full_listings.append(folder_id)
+        return [
+            {"id": "old", "mimeType": "image/png", "modifiedTime": "2026-01-01"},
+            {"id": "moved", "mimeType": "video/mp4", "modifiedTime": "2026-01-02"},
+            {"id": "clip", "mimeType": "video/mp4", "modifiedTime": "2026-01-03"},
+        ]
+
+    monkeypatch.setattr(drive_sync, "get_drive_client", lambda: fake_drive)
+    monkeypatch.setattr(drive_sync, "list_files_in_folder", _fake_list_files_in_folder)
+    mirror = drive_sync.DriveFolderMirror("photos")
+
+    initial = mirror.list_files()
+    refreshed = mirror.list_files()
+
+    assert [item["id"] for item in initial] == ["clip", "moved", "old"]
+    assert [item["id"] for item in refreshed] == ["new", "clip"]
+    assert "parents" not in refreshed[0]
+    assert full_listings == ["photos"]
+    assert fake_drive.changes().requested_tokens == ["token-1", "token-2"]
+    assert [item["id"] for item in mirror.list_files("image/")] == ["new"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import zipfile
+from datetime import date
+from io import BytesIO
+
+import pytest
+
+from services.drive_service import DriveServiceError
+from services.food_invoicing import compute_invoice_ledger, run_invoice_batch
+
+CHILDREN = [
+    {"id": "c1", "name": "Mia", "status": "active", "folder_id": "f1"},
+    {"id": "c2", "name": "Ben", "status": "inactive", "folder_id": "f2"},
+    {"id": "c3", "name": "Ida", "start_date": "2026-03-16", "folder_id": "f3"},
+    {"id": "c4", "name": "Leo", "start_date": "2026-04-01"},
+]
+
+
+def test_compute_invoice_ledger_honors_status_and_start_date() -> None:
+    ledger = compute_invoice_ledger(
+        CHILDREN, date(2026, 3, 1), date(2026, 3, 31), 120.0
+    )
+
+    assert ledger["child_id"].tolist() == ["c1", "c3"]
+    assert ledger["billable_from"].tolist() == ["2026-03-01", "2026-03-16"]
+    assert ledger["days"].tolist() == [31, 16]
+    assert ledger["total_amount_eur"].tolist() == [124.0, 64.0]
+
+
+def test_compute_invoice_ledger_rejects_inverted_period() -> None:
+    with pytest.raises(ValueError, match="Enddatum"):
+        compute_invoice_ledger(CHILDREN, date(2026, 3, 31), date(2026, 3, 1), 120.0)
+
+
+def test_run_invoice_batch_writes_zip_with_ledger_and_uploads() -> None:
+    ledger = compute_invoice_ledger(
+        CHILDREN, date(2026, 3, 1), date(2026, 3, 31), 120.0
+    )
+    uploads: list[tuple[str, str]] = []
+
+    def _upload(file_name: str, doc_bytes: bytes, folder_id: str) -> str:
+        uploads.append((file_name, folder_id))
+        if folder_id == "f3":
+            raise DriveServiceError("quota")
+        return f"id-{folder_id}"
+
+    batch = run_invoice_batch(
+        ledger,
+        lambda row: (row["child_name"].encode(), f"{row['child_name']}.docx"),
+        upload=_upload,
+        ledger_name="Abrechnung_202603",
+    )
+
+    assert sorted(uploads) == [("Ida.docx", "f3"), ("Mia.docx", "f1")]
+    assert batch.upload_errors == ["Ida: quota"]
+    with zipfile.ZipFile(BytesIO(batch.archive)) as archive:
+        assert sorted(archive.namelist()) == [
+            "Abrechnung_202603.csv",
+            "Abrechnung_202603.json",
+            "Ida.docx",
+            "Mia.docx",
+        ]
+        records = json.loads(archive.read("Abrechnung_202603.json"))
+    assert [record["drive_file_id"] for record in records] == ["id-f1", ""]
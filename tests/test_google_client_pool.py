@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import gc
+import threading
+from types import SimpleNamespace
+
+from services import google_clients
+
+
+def _pool(monkeypatch) -> google_clients.GoogleClientPool:
+    fake_credentials = SimpleNamespace(
+        from_service_account_info=lambda info, scopes: object()
+    )
+    monkeypatch.setattr(google_clients, "_sa_info", dict)
+    monkeypatch.setattr(google_clients.service_account, "Credentials", fake_credentials)
+    pool = google_clients.GoogleClientPool("drive", "v3", ["scope"])
+    monkeypatch.setattr(pool, "_build_client", object)
+    return pool
+
+
+def test_thread_clients_are_isolated_and_returned_to_pool(monkeypatch) -> None:
+    pool = _pool(monkeypatch)
+    main_client = pool.thread_client()
+    worker_clients: list[object] = []
+
+    worker = threading.Thread(
+        target=lambda: worker_clients.append(pool.thread_client())
+    )
+    worker.start()
+    worker.join()
+    gc.collect()
+
+    assert pool.thread_client() is main_client
+    assert worker_clients[0] is not main_client
+    stats = pool.stats()
+    assert (stats.created, stats.in_use, stats.idle) == (2, 1, 1)
+
+    next_worker = threading.Thread(
+        target=lambda: worker_clients.append(pool.thread_client())
+    )
+    next_worker.start()
+    next_worker.join()
+    assert worker_clients[1] is worker_clients[0]
+    assert pool.stats().reused == 1
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any
+
+from storage import LazyFileListing
+
+
+class _FakeDriveAgent:
+    def __init__(self, total: int) -> None:
+        self.files = [{"id": f"file-{index}"} for index in range(total)]
+        self.requested_tokens: list[str | None] = []
+
+    def list_files_page(
+        self,
+        folder_id: str,
+        *,
+        page_size: int,
+        page_token: str | None,
+        **_: Any,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        self.requested_tokens.append(page_token)
+        offset = int(page_token or 0)
+        next_offset = offset + page_size
+        next_token = str(next_offset) if next_offset < len(self.files) else None
+        return self.files[offset:next_offset], next_token
+
+
+def test_lazy_listing_fetches_pages_on_demand_and_resumes_from_state() -> None:
+    drive_agent = _FakeDriveAgent(total=5)
+    state: dict[str, Any] = {}
+
+    listing = LazyFileListing(
+        drive_agent, "photos", state=state, state_key="listing", page_size=2
+    )
+    first_page = listing.page(0)
+
+    assert [item["id"] for item in first_page] == ["file-0", "file-1"]
+    assert drive_agent.requested_tokens == [None]
+    assert listing.has_more
+
+    resumed = LazyFileListing(
+        drive_agent, "photos", state=state, state_key="listing", page_size=2
+    )
+    resumed.load_next_page()
+
+    assert drive_agent.requested_tokens == [None, "2"]
+    assert len(resumed.loaded_items()) == 4
+    assert [item["id"] for item in resumed] == [f"file-{i}" for i in range(5)]
+    assert not resumed.has_more
+
+
+def test_lazy_listing_resets_when_filters_change() -> None:
+    drive_agent = _FakeDriveAgent(total=3)
+    state: dict[str, Any] = {}
+    LazyFileListing(
+        drive_agent, "photos", state=state, state_key="listing", page_size=2
+    ).page(0)
+
+    other = LazyFileListing(
+        drive_agent,
+        "photos",
+        state=state,
+        state_key="listing",
+        page_size=2,
+        mime_type_filter="application/pdf",
+    )
+
+    assert other.loaded_page_count == 0
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from domain.media_catalog import build_media_catalog
+
+
+def test_catalog_prefers_photo_meta_and_groups_by_child_and_status() -> None:
+    files = [
+        {"id": "a", "mimeType": "image/jpeg", "appProperties": {"child_id": "c1"}},
+        {
+            "id": "b",
+            "mimeType": "image/png",
+            "appProperties": {"child_id": "c1", "status": "draft"},
+        },
+        {"id": "c", "mimeType": "video/mp4"},
+        {"id": "d", "mimeType": "application/pdf"},
+        {"id": "e", "mimeType": "image/jpeg"},
+    ]
+    photo_meta = [
+        {"file_id": "b", "child_id": "c1", "status": "published"},
+        {"file_id": "c", "child_id": "c2", "status": "archived"},
+    ]
+
+    catalog = build_media_catalog(files, photo_meta)
+
+    assert [item["id"] for item in catalog.media_for("c1")] == ["a", "b"]
+    assert [item["id"] for item in catalog.media_for("c1", "published")] == ["b"]
+    assert [item["id"] for item in catalog.media_for("c2", "archived")] == ["c"]
+    assert catalog.meta_for("b")["status"] == "published"
+    assert catalog.media_for("") == []
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from config import PhotoConfig
+from services.media_derivatives import (
+    THUMBNAIL_SPEC,
+    VIDEO_DERIVATIVE_SPECS,
+    VIDEO_POSTER_SPEC,
+    VIDEO_PREVIEW_SPEC,
+    DerivativeSpec,
+    MediaDerivativeStore,
+    derivative_name,
+    pixelated_spec,
+)
+
+
+def test_thumbnail_is_rendered_once_and_served_from_disk_cache(
+    local_derivative_store, make_jpeg
+) -> None:
+    store = local_derivative_store
+    original_loads: list[str] = []
+
+    def _load_original() -> bytes:
+        original_loads.append("photo-1")
+        return make_jpeg(1600, 900)
+
+    first = store.get("photo-1", "md5-a", THUMBNAIL_SPEC, _load_original)
+    second = store.get("photo-1", "md5-a", THUMBNAIL_SPEC, _load_original)
+
+    thumbnail = cv2.imdecode(np.frombuffer(first, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert thumbnail.shape[:2] == (180, 320)
+    assert second == first
+    assert original_loads == ["photo-1"]
+
+    store.get("photo-1", "md5-b", THUMBNAIL_SPEC, _load_original)
+    assert len(original_loads) == 2
+
+
+def test_prefetch_renders_missing_thumbnails_in_background(
+    local_derivative_store, make_jpeg
+) -> None:
+    store = local_derivative_store
+    store.get("cached", "r", THUMBNAIL_SPEC, lambda: make_jpeg(400, 400))
+    loaded: list[str] = []
+
+    def _load_original(file_id: str) -> bytes:
+        loaded.append(file_id)
+        return make_jpeg(640, 480)
+
+    scheduled = store.prefetch(
+        [("cached", "r"), ("next-1", "r"), ("next-2", "r")],
+        THUMBNAIL_SPEC,
+        _load_original,
+    )
+    assert not store.is_pending("cached", "r", THUMBNAIL_SPEC)
+    store._prefetch_executor().shutdown(wait=True)
+
+    assert scheduled == 2
+    assert not store.is_pending("next-1", "r", THUMBNAIL_SPEC)
+    assert sorted(loaded) == ["next-1", "next-2"]
+    assert len(list(store.cache_dir.glob("*.webp"))) == 3
+
+
+def test_custom_renderer_variant_is_persisted_per_revision(
+    local_derivative_store,
+) -> None:
+    store = local_derivative_store
+    renders: list[bytes] = []
+
+    def _render(original: bytes) -> bytes:
+        renders.append(original)
+        return original[::-1]
+
+    spec = DerivativeSpec(kind="pixelated", extension="", renderer=_render)
+
+    assert store.get("photo-1", "md5-a", spec, lambda: b"abc") == b"cba"
+    assert store.get("photo-1", "md5-a", spec, lambda: b"zzz") == b"cba"
+    assert renders == [b"abc"]
+    assert (
+        pixelated_spec(PhotoConfig(jpeg_quality=70)).kind
+        != pixelated_spec(PhotoConfig()).kind
+    )
+    assert (
+        pixelated_spec(PhotoConfig(upload_max_edge=1024, normalize_uploads=True)).kind
+        == pixelated_spec(PhotoConfig()).kind
+    )
+
+
+def test_video_poster_and_preview_clip_are_stored_as_derivatives(
+    tmp_path, local_derivative_store
+) -> None:
+    source_path = tmp_path / "source.mp4"
+    writer = cv2.VideoWriter(
+        str(source_path), cv2.VideoWriter_fourcc(*"mp4v"), 30, (641, 361)
+    )
+    for index in range(240):
+        writer.write(np.full((361, 641, 3), index, dtype=np.uint8))
+    writer.release()
+    video = source_path.read_bytes()
+    store = local_derivative_store
+
+    store.create_all("video-1", "md5-v", video, VIDEO_DERIVATIVE_SPECS)
+
+    poster = store.find("video-1", "md5-v", VIDEO_POSTER_SPEC)
+    clip = store.find("video-1", "md5-v", VIDEO_PREVIEW_SPEC)
+    assert poster is not None
+    assert clip is not None
+    frame = cv2.imdecode(np.frombuffer(poster, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert frame.shape[:2] == (180, 320)
+    clip_path = tmp_path / "clip.webm"
+    clip_path.write_bytes(clip)
+    capture = cv2.VideoCapture(str(clip_path))
+    assert capture.get(cv2.CAP_PROP_FRAME_WIDTH) <= 480
+    assert capture.get(cv2.CAP_PROP_FRAME_COUNT) <= 72
+    capture.release()
+    assert len(clip) < len(video)
+
+
+class _FakeDriveDerivatives:
+    storage_mode = "google"
+
+    def __init__(self) -> None:
+        self.files = {"drv-1": ("p1.thumb.old.webp", b"stored")}
+        self.list_calls = 0
+
+    def list_files(self, folder_id, mime_type_filter=None, *, incremental=False):
+        if mime_type_filter:
+            return [{"id": "derivatives", "name": ".derivatives"}]
+        self.list_calls += 1
+        return [
+            {"id": file_id, "name": name} for file_id, (name, _) in self.files.items()
+        ]
+
+    def fetch_file(self, file_id: str) -> bytes:
+        return self.files[file_id][1]
+
+    def upload_file(self, name, payload, mime_type, folder_id, app_properties=None):
+        file_id = f"drv-{len(self.files) + 1}"
+        self.files[file_id] = (name, payload)
+        return file_id
+
+
+def test_drive_lookups_share_one_listing_per_ttl(tmp_path) -> None:
+    drive = _FakeDriveDerivatives()
+    now = [0.0]
+    store = MediaDerivativeStore(
+        drive, "photos", tmp_path / "derivatives", clock=lambda: now[0]
+    )
+    spec = DerivativeSpec(kind="thumb")
+
+    for index in range(5):
+        assert store.find(f"missing-{index}", "r", spec) is None
+    store.put("p2", "r", spec, b"new")
+    (tmp_path / "derivatives").joinpath(
+        next(name for name, _ in drive.files.values() if name.startswith("p2."))
+    ).unlink()
+    assert store.find("p2", "r", spec) == b"new"
+    assert drive.list_calls == 1
+
+    now[0] += 61
+    assert store.find("missing-0", "r", spec) is None
+    assert drive.list_calls == 2
+
+
+def test_put_in_background_caches_locally_and_uploads_later(tmp_path) -> None:
+    drive = _FakeDriveDerivatives()
+    store = MediaDerivativeStore(drive, "photos", tmp_path / "derivatives")
+    spec = DerivativeSpec(kind="pixelated-test", extension="")
+
+    store.put_in_background("p1", "r", spec, b"pixelated")
+    assert store.find("p1", "r", spec) == b"pixelated"
+
+    store._prefetch_executor().shutdown(wait=True)
+    assert (derivative_name("p1", "r", spec), b"pixelated") in drive.files.values()
+
+
+def test_prefetch_does_not_resubmit_undecodable_originals(
+    local_derivative_store,
+) -> None:
+    store = local_derivative_store
+    loads: list[str] = []
+
+    def _load_original(file_id: str) -> bytes:
+        loads.append(file_id)
+        return b"not an image"
+
+    assert store.prefetch([("broken", "r")], THUMBNAIL_SPEC, _load_original) == 1
+    store._prefetch_executor().shutdown(wait=True)
+    store._executor = None
+
+    assert store.has_failed("broken", "r", THUMBNAIL_SPEC)
+    assert store.prefetch([("broken", "r")], THUMBNAIL_SPEC, _load_original) == 0
+    assert not store.is_pending("broken", "r", THUMBNAIL_SPEC)
+    assert loads == ["broken"]
+
+
+def test_drive_only_variant_is_fetched_by_prefetch_not_find_cached(tmp_path) -> None:
+    drive = _FakeDriveDerivatives()
+    store = MediaDerivativeStore(drive, "photos", tmp_path / "derivatives")
+    spec = DerivativeSpec(kind="thumb")
+    store.put("p2", "r", spec, b"new")
+    for cached in (tmp_path / "derivatives").iterdir():
+        cached.unlink()
+
+    assert store.find_cached("p2", "r", spec) is None
+
+    store.prefetch([("p2", "r")], spec, lambda file_id: b"never rendered")
+    store._prefetch_executor().shutdown(wait=True)
+    assert store.find_cached("p2", "r", spec) == b"new"
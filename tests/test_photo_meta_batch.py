@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import photo
+from services import sheets_repo
+
+
+def test_upsert_photo_meta_many_writes_once_and_appends_new_rows(
+    monkeypatch,
+) -> None:
+    header = ["file_id", "child_id", "album", "status"]
+    rows = [header, ["f1", "c1", "Sommer", "draft"], ["f2", "c1", "", "draft"]]
+    batch_writes: list[list[tuple[str, list[list[str]]]]] = []
+    appended: list[list[list[str]]] = []
+
+    monkeypatch.setattr(sheets_repo, "_photo_meta_tab", lambda: "photo_meta")
+    monkeypatch.setattr(
+        sheets_repo, "_ensure_photo_meta_header_columns", lambda _columns: header
+    )
+    monkeypatch.setattr(sheets_repo, "_values_get", lambda _range: rows)
+    monkeypatch.setattr(sheets_repo, "_values_batch_update", batch_writes.append)
+    monkeypatch.setattr(
+        sheets_repo, "_values_append", lambda _range, values: appended.append(values)
+    )
+
+    sheets_repo.upsert_photo_meta_many(
+        {
+            "f1": {"status": "published"},
+            "f2": {"status": "archived"},
+            "f9": {"child_id": "c2", "status": "draft"},
+        }
+    )
+
+    assert batch_writes == [
+        [
+            ("photo_meta!A2:ZZ2", [["f1", "c1", "Sommer", "published"]]),
+            ("photo_meta!A3:ZZ3", [["f2", "c1", "", "archived"]]),
+        ]
+    ]
+    assert appended == [[["f9", "c2", "", "draft"]]]
+
+
+def test_update_children_many_writes_all_rows_in_one_batch(monkeypatch) -> None:
+    header = ["child_id", "name", "folder_id", "photo_folder_id", "status"]
+    rows = [header, ["c1", "Lina", "", "", "active"], ["c2", "Ben", "", "", ""]]
+    batch_writes: list[list[tuple[str, list[list[str]]]]] = []
+
+    monkeypatch.setattr(sheets_repo, "_children_tab", lambda: "children")
+    monkeypatch.setattr(
+        sheets_repo, "_ensure_children_header_columns", lambda _columns: header
+    )
+    monkeypatch.setattr(sheets_repo, "_values_get", lambda _range: rows)
+    monkeypatch.setattr(sheets_repo, "_values_batch_update", batch_writes.append)
+
+    sheets_repo.update_children_many(
+        {
+            "c1": {"folder_id": "f1", "photo_folder_id": "f1"},
+            "c2": {"folder_id": "f2", "photo_folder_id": "f2"},
+        }
+    )
+
+    assert batch_writes == [
+        [
+            ("children!A2:ZZ2", [["c1", "Lina", "f1", "f1", "active"]]),
+            ("children!A3:ZZ3", [["c2", "Ben", "f2", "f2", "active"]]),
+        ]
+    ]
+
+
+def test_catalog_load_is_read_only_and_sync_is_explicit(monkeypatch) -> None:
+    files = [
+        {
+            "id": "a",
+            "mimeType": "image/jpeg",
+            "appProperties": {"child_id": "c1", "status": "published"},
+        },
+        {"id": "b", "mimeType": "image/jpeg"},
+    ]
+    meta = [
+        {"file_id": "a", "child_id": "c1", "status": "published"},
+        {"file_id": "b", "child_id": "c1", "status": "draft"},
+    ]
+    updates: list[dict[str, dict[str, str]]] = []
+
+    def _update_app_properties(batch: dict[str, dict[str, str]]):
+        updates.append(batch)
+        return list(batch), {}
+
+    drive_agent = SimpleNamespace(update_app_properties=_update_app_properties)
+    monkeypatch.setattr(photo, "_list_media", lambda _folder_id: files)
+
+    catalog = photo.load_media_catalog(
+        SimpleNamespace(get_photo_meta_records=lambda: meta), drive_agent, "photos"
+    )
+    assert updates == []
+
+    assert photo.sync_media_app_properties(drive_agent, catalog) == (["b"], {})
+    assert updates == [{"b": {"child_id": "c1", "status": "draft"}}]
+
+
+def test_parent_media_falls_back_to_photo_meta_status(monkeypatch) -> None:
+    files = [
+        {"id": "legacy", "name": "legacy.jpg", "mimeType": "image/jpeg"},
+        {
+            "id": "stale",
+            "name": "stale.jpg",
+            "mimeType": "image/jpeg",
+            "appProperties": {"child_id": "c1", "status": "draft"},
+        },
+        {
+            "id": "hidden",
+            "name": "hidden.jpg",
+            "mimeType": "image/jpeg",
+            "appProperties": {"child_id": "c1", "status": "published"},
+        },
+    ]
+    meta = [
+        {"file_id": "legacy", "child_id": "c1", "status": "published"},
+        {"file_id": "stale", "child_id": "c1", "status": "published"},
+        {"file_id": "hidden", "child_id": "c1", "status": "archived"},
+    ]
+    monkeypatch.setattr(photo, "_list_media", lambda _folder_id: files)
+
+    catalog = photo.load_media_catalog(
+        SimpleNamespace(get_photo_meta_records=lambda: meta), SimpleNamespace(), "root"
+    )
+    published = photo.catalog_media_items(catalog, "c1", status="published")
+
+    assert [item.id for item in published] == ["legacy", "stale"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import zipfile
+from io import BytesIO
+from types import SimpleNamespace
+
+import photo
+from config import PhotoConfig
+from domain.models import MediaItem
+from services import album_export
+from services.photos_service import PixelationResult
+
+
+def test_stored_thumbnail_never_renders_inline(
+    monkeypatch, local_derivative_store, make_jpeg
+) -> None:
+    store = local_derivative_store
+    fetched: list[str] = []
+
+    class _FakeDriveAgent:
+        def fetch_file(self, file_id: str) -> bytes:
+            fetched.append(file_id)
+            return make_jpeg(1200, 800)
+
+    monkeypatch.setattr(photo, "get_media_derivative_store", lambda _folder: store)
+    monkeypatch.setattr(photo, "DriveAgent", _FakeDriveAgent)
+    item = MediaItem(
+        id="photo-1",
+        child_id="child-1",
+        name="a.jpg",
+        mime_type="image/jpeg",
+        kind="image",
+        source="local",
+        checksum="md5-a",
+    )
+
+    assert photo._stored_thumbnail("photos", item) is None
+    store._prefetch_executor().shutdown(wait=True)
+    assert fetched == ["photo-1"]
+
+    thumbnail = photo._stored_thumbnail("photos", item)
+    assert thumbnail is not None
+    assert fetched == ["photo-1"]
+
+
+def test_album_zip_builder_defers_storing_new_variants(monkeypatch) -> None:
+    def _fake_batch(images, settings, *, max_in_flight=None):
+        for key, payload in images:
+            yield PixelationResult(key, data=b"pixelated-" + payload)
+
+    class _FakeStore:
+        def __init__(self) -> None:
+            self.stored: dict[str, bytes] = {}
+
+        def find(self, file_id: str, revision: str, spec) -> bytes | None:
+            return b"stored" if file_id == "cached" else None
+
+        def put(self, *args) -> None:
+            raise AssertionError("album export must not store variants inline")
+
+        def put_in_background(self, file_id, revision, spec, payload) -> None:
+            self.stored[f"{file_id}@{revision}"] = payload
+
+        def prefetch(self, *args) -> int:
+            raise AssertionError("album export must not render variants again")
+
+    store = _FakeStore()
+    monkeypatch.setattr(album_export, "pixelate_batch", _fake_batch)
+    monkeypatch.setattr(photo, "get_media_derivative_store", lambda _folder: store)
+    monkeypatch.setattr(
+        photo, "get_app_config", lambda: SimpleNamespace(photos=PhotoConfig())
+    )
+    monkeypatch.setattr(
+        photo,
+        "DriveAgent",
+        lambda: SimpleNamespace(fetch_file=lambda file_id: file_id.encode()),
+    )
+
+    build = photo.album_zip_builder(
+        "photos",
+        [
+            {"id": "cached", "name": "a.jpg", "md5Checksum": "m1"},
+            {"id": "fresh", "name": "b.jpg", "md5Checksum": "m2"},
+        ],
+        "pixelated",
+    )
+    with zipfile.ZipFile(BytesIO(build())) as archive:
+        assert archive.read("a.jpg") == b"stored"
+        assert archive.read("b.jpg") == b"pixelated-fresh"
+    assert store.stored == {"fresh@m2": b"pixelated-fresh"}
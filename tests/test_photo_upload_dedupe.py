@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from config import AppConfig, LocalConfig, PhotoConfig
+from photo import PhotoAgent
+
+
+class _Upload:
+    def __init__(self, name: str, content: bytes) -> None:
+        self.name = name
+        self._content = content
+
+    def getvalue(self) -> bytes:
+        return self._content
+
+
+def _use_local_drive(monkeypatch, tmp_path: Path) -> Path:
+    app_config = AppConfig(
+        storage_mode="local",
+        google=None,
+        local=LocalConfig(
+            data_dir=tmp_path,
+            stammdaten_file=tmp_path / "stammdaten.ods",
+            content_pages_file=tmp_path / "content_pages.json",
+            calendar_file=tmp_path / "calendar.json",
+            drive_root=tmp_path / "drive",
+        ),
+        openai=None,
+    )
+    monkeypatch.setattr("storage.get_app_config", lambda: app_config)
+    return app_config.local.drive_root
+
+
+def test_upload_photo_skips_transfer_for_identical_content(
+    monkeypatch, tmp_path
+) -> None:
+    drive_root = _use_local_drive(monkeypatch, tmp_path)
+    agent = PhotoAgent()
+
+    first = agent.upload_photo(_Upload("a.jpg", b"same"), "photos", child_id="c1")
+    again = agent.upload_photo(_Upload("b.jpg", b"same"), "photos", child_id="c1")
+    other_child = agent.upload_photo(_Upload("c.jpg", b"same"), "photos", child_id="c2")
+
+    assert not first.reused_existing
+    assert again.reused_existing
+    assert again.file_id == first.file_id
+    assert not other_child.reused_existing
+    assert other_child.file_id != first.file_id
+    assert len(list((drive_root / "photos").iterdir())) == 2
+
+
+def test_upload_photo_normalizes_and_keeps_original_on_request(
+    monkeypatch, tmp_path
+) -> None:
+    drive_root = _use_local_drive(monkeypatch, tmp_path)
+    buffer = BytesIO()
+    Image.new("RGB", (1200, 800), (20, 120, 200)).save(buffer, "JPEG", quality=95)
+    settings = PhotoConfig(normalize_uploads=True, upload_max_edge=600)
+
+    result = PhotoAgent().upload_photo(
+        _Upload("a.jpg", buffer.getvalue()),
+        "photos",
+        child_id="c1",
+        settings=settings,
+        keep_original=True,
+    )
+
+    assert result.normalized
+    assert result.original_file_id
+    with Image.open(BytesIO(result.content)) as stored:
+        assert stored.size == (600, 400)
+    (original_path,) = (drive_root / "photos.originals").iterdir()
+    assert original_path.read_bytes() == buffer.getvalue()
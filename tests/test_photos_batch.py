@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from services import photos_service
+
+
+def _reverse(image_bytes: bytes, settings) -> bytes:
+    if image_bytes == b"broken":
+        raise ValueError("Bilddaten konnten nicht dekodiert werden.")
+    return image_bytes[::-1]
+
+
+def test_pixelate_batch_limits_images_in_flight() -> None:
+    yielded: list[str] = []
+    max_ahead = 0
+
+    def _images():
+        nonlocal max_ahead
+        for index in range(8):
+            max_ahead = max(max_ahead, index - len(yielded))
+            yield f"img-{index}", f"data-{index}".encode()
+        yield "img-broken", b"broken"
+
+    try:
+        results = {}
+        for result in photos_service.pixelate_batch(
+            _images(), max_in_flight=2, worker=_reverse
+        ):
+            yielded.append(result.key)
+            results[result.key] = result
+    finally:
+        photos_service.shutdown_pixelation_pool()
+
+    assert results["img-3"].data == b"3-atad"
+    assert not results["img-broken"].ok
+    assert isinstance(results["img-broken"].error, ValueError)
+    assert len(results) == 9
+    assert max_ahead <= 2
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from config import PhotoConfig
+from services import photos_service
+
+_ORIENTATION = 0x0112
+_GPS_IFD = 0x8825
+_MAKE = 0x010F
+
+
+def _jpeg_with_exif() -> bytes:
+    pixels = np.random.default_rng(7).integers(0, 255, (300, 400, 3), np.uint8)
+    exif = Image.Exif()
+    exif[_ORIENTATION] = 6
+    exif[_MAKE] = "Camera"
+    exif.get_ifd(_GPS_IFD)[2] = (52.0, 31.0, 0.0)
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, "JPEG", quality=90, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def test_encode_keeps_jpeg_format_and_orientation_but_strips_gps() -> None:
+    source = _jpeg_with_exif()
+    decoded = photos_service._decode_image(source)
+
+    encoded = photos_service._encode_image(
+        decoded, source, PhotoConfig(jpeg_quality=80)
+    )
+
+    with Image.open(BytesIO(encoded)) as result:
+        exif = result.getexif()
+        assert result.format == "JPEG"
+        assert result.size == (300, 400)
+        assert exif[_ORIENTATION] == 1
+        assert exif[_MAKE] == "Camera"
+        assert _GPS_IFD not in exif
+        assert not exif.get_ifd(_GPS_IFD)
+    assert len(encoded) <= len(source)
+
+
+def test_encode_falls_back_to_png_without_source() -> None:
+    encoded = photos_service._encode_image(np.zeros((4, 4, 3), dtype=np.uint8))
+
+    with Image.open(BytesIO(encoded)) as result:
+        assert result.format == "PNG"
+
+
+def test_normalize_upload_rotates_downscales_and_strips_gps() -> None:
+    normalized = photos_service.normalize_upload(
+        _jpeg_with_exif(), PhotoConfig(upload_max_edge=200, upload_quality=70)
+    )
+
+    assert normalized.changed
+    with Image.open(BytesIO(normalized.data)) as result:
+        exif = result.getexif()
+        assert result.format == "JPEG"
+        assert result.size == (150, 200)
+        assert exif[_ORIENTATION] == 1
+        assert _GPS_IFD not in exif
+
+
+def test_normalize_upload_keeps_transparent_png_untouched() -> None:
+    buffer = BytesIO()
+    Image.new("RGBA", (800, 600), (255, 0, 0, 128)).save(buffer, "PNG")
+    source = buffer.getvalue()
+
+    normalized = photos_service.normalize_upload(
+        source, PhotoConfig(upload_max_edge=100)
+    )
+
+    assert not normalized.changed
+    assert normalized.data == source
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from config import PhotoConfig
+from services import photos_service
+
+
+class _FakeDetector:
+    def __init__(self) -> None:
+        self.shapes: list[tuple[int, ...]] = []
+        self.min_sizes: list[tuple[int, int]] = []
+
+    def detectMultiScale(self, image, **kwargs):
+        self.shapes.append(image.shape)
+        self.min_sizes.append(kwargs["minSize"])
+        return [(100, 50, 40, 40)]
+
+
+def test_detect_faces_runs_downscaled_and_maps_boxes_back(monkeypatch) -> None:
+    detector = _FakeDetector()
+    monkeypatch.setattr(photos_service, "_face_detector", lambda: detector)
+    image = np.zeros((1500, 4000, 3), dtype=np.uint8)
+
+    boxes = photos_service.detect_faces(
+        image, PhotoConfig(face_detection_max_edge=1000, face_min_size=96)
+    )
+
+    assert detector.shapes == [(375, 1000)]
+    assert detector.min_sizes == [(24, 24)]
+    assert boxes == [(400, 200, 160, 160)]
+
+
+def test_default_settings_detect_on_downscaled_copy(monkeypatch) -> None:
+    detector = _FakeDetector()
+    monkeypatch.setattr(photos_service, "_face_detector", lambda: detector)
+    image = np.zeros((3000, 4000, 3), dtype=np.uint8)
+
+    boxes = photos_service.detect_faces(image, PhotoConfig())
+
+    assert detector.shapes == [(1200, 1600)]
+    assert detector.min_sizes == [(24, 24)]
+    assert boxes == [(250, 125, 100, 100)]
+
+
+def test_detect_faces_never_shrinks_min_size_below_haar_window(monkeypatch) -> None:
+    detector = _FakeDetector()
+    monkeypatch.setattr(photos_service, "_face_detector", lambda: detector)
+    image = np.zeros((1500, 4000, 3), dtype=np.uint8)
+
+    photos_service.detect_faces(
+        image, PhotoConfig(face_detection_max_edge=1000, face_min_size=48)
+    )
+
+    assert detector.shapes == [(750, 2000)]
+    assert detector.min_sizes == [(24, 24)]
+
+
+def _synthetic_face(size: int) -> np.ndarray:
+    face = np.full((200, 200), 60, dtype=np.uint8)
+    cv2.ellipse(face, (100, 105), (70, 90), 0, 0, 360, 200, -1)
+    for eye_x in (70, 130):
+        cv2.ellipse(face, (eye_x, 85), (16, 9), 0, 0, 360, 40, -1)
+        cv2.line(face, (eye_x - 20, 65), (eye_x + 20, 65), 50, 6)
+    cv2.line(face, (100, 90), (100, 125), 170, 8)
+    cv2.ellipse(face, (100, 150), (28, 9), 0, 0, 360, 70, -1)
+    face = cv2.GaussianBlur(face, (9, 9), 0)
+    return cv2.resize(face, (size, size), interpolation=cv2.INTER_AREA)
+
+
+@pytest.mark.skipif(
+    not hasattr(cv2, "CascadeClassifier"), reason="OpenCV ohne Haar-Cascade"
+)
+def test_real_cascade_finds_small_face_in_large_photo(monkeypatch) -> None:
+    monkeypatch.setattr(photos_service, "_DETECTOR_STATE", threading.local())
+    image = np.full((3000, 4000), 60, dtype=np.uint8)
+    image[1400:1450, 2000:2050] = _synthetic_face(50)
+
+    boxes = photos_service.detect_faces(
+        cv2.cvtColor(image, cv2.COLOR_GRAY2BGR),
+        PhotoConfig(face_min_neighbors=3, face_min_size=48),
+    )
+
+    assert any(
+        left <= 2025 <= left + width and top <= 1425 <= top + height
+        for left, top, width, height in boxes
+    )
+
+
+class _FakeCascade:
+    loads = 0
+
+    def __init__(self, path: str) -> None:
+        type(self).loads += 1
+
+    def empty(self) -> bool:
+        return False
+
+
+def test_face_detector_is_cached_per_thread(monkeypatch) -> None:
+    monkeypatch.setattr(
+        photos_service.cv2, "CascadeClassifier", _FakeCascade, raising=False
+    )
+    monkeypatch.setattr(photos_service, "_DETECTOR_STATE", threading.local())
+    first = photos_service._face_detector()
+    other_thread: list[object] = []
+    worker = threading.Thread(
+        target=lambda: other_thread.append(photos_service._face_detector())
+    )
+    worker.start()
+    worker.join()
+
+    assert photos_service._face_detector() is first
+    assert other_thread[0] is not first
+    assert _FakeCascade.loads == 2
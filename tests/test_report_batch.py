@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import zipfile
+
+from openai import RateLimitError
+
+from documents import DocumentGenerationError
+from services.report_batch import (
+    AdaptiveConcurrencyLimiter,
+    ReportRequest,
+    generate_reports,
+    write_reports_zip,
+)
+
+
+class _FakeRateLimitError(RateLimitError):
+    def __init__(self) -> None:
+        Exception.__init__(self, "rate limited")
+
+
+def _rate_limit_error() -> DocumentGenerationError:
+    error = DocumentGenerationError("Ratenlimit erreicht.")
+    error.__cause__ = _FakeRateLimitError()
+    return error
+
+
+def test_limiter_halves_on_rate_limit_and_recovers() -> None:
+    now = [0.0]
+    limiter = AdaptiveConcurrencyLimiter(
+        4, increase_after=2, cooldown_seconds=0.0, clock=lambda: now[0]
+    )
+
+    limiter.acquire()
+    limiter.release(rate_limited=True)
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+
+
+def test_generate_reports_runs_concurrently_and_retries_rate_limits() -> None:
+    requests = [ReportRequest({"name": f"Kind {index}"}, "Notiz") for index in range(6)]
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    failed_once: set[str] = set()
+
+    def _generate(request: ReportRequest) -> tuple[bytes, str]:
+        nonlocal active, peak
+        name = request.child["name"]
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            threading.Event().wait(0.05)
+            if name == "Kind 2" and name not in failed_once:
+                failed_once.add(name)
+                raise _rate_limit_error()
+            if name == "Kind 5":
+                raise DocumentGenerationError("Ungültige Anfrage.")
+            return name.encode(), "Bericht.docx"
+        finally:
+            with lock:
+                active -= 1
+
+    limiter = AdaptiveConcurrencyLimiter(3, cooldown_seconds=0.0)
+    report_archive = write_reports_zip(
+        generate_reports(requests, _generate, max_concurrency=3, limiter=limiter)
+    )
+
+    assert 1 < peak <= 3
+    assert report_archive.file_count == 5
+    assert [outcome.request.child["name"] for outcome in report_archive.failed] == [
+        "Kind 5"
+    ]
+    with zipfile.ZipFile(report_archive.archive) as archive:
+        names = archive.namelist()
+    assert len(set(names)) == 5
+    assert "Bericht.docx" in names
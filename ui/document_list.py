@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+import streamlit as st
+
+DOCX_MIME_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+DocumentLoader = Callable[[str, str], bytes]
+PreviewLoader = Callable[[str, str], str]
+
+
+def document_revision(file_meta: dict[str, Any]) -> str:
+    """Inhaltsstand einer Datei (Änderungszeit, sonst MD5) als Cache-Schlüssel."""
+    return str(file_meta.get("modifiedTime") or file_meta.get("md5Checksum") or "")
+
+
+def _modified_label(file_meta: dict[str, Any]) -> str:
+    raw_value = str(file_meta.get("modifiedTime") or "")
+    try:
+        modified = datetime.fromisoformat(raw_value)
+    except ValueError:
+        return ""
+    return modified.strftime("%d.%m.%Y %H:%M")
+
+
+def render_document_list(
+    files: list[dict[str, Any]],
+    *,
+    key_prefix: str,
+    load_bytes: DocumentLoader,
+    load_preview: PreviewLoader | None = None,
+    download_label: str = "Download / Herunterladen",
+) -> None:
+    """Listet Dokumente allein aus Metadaten.
+
+    Die Vorschau wird erst beim Aufklappen geladen, der Inhalt für den
+    Download erst beim Klick. Beide Loader erhalten ``(file_id, revision)``,
+    damit gecachte Ergebnisse bei Änderungen automatisch verfallen.
+    """
+    for file_meta in files:
+        file_id = str(file_meta.get("id", ""))
+        file_name = str(file_meta.get("name") or file_id)
+        revision = document_revision(file_meta)
+        modified_label = _modified_label(file_meta)
+        download_kwargs: dict[str, Any] = {
+            "data": partial(load_bytes, file_id, revision),
+            "file_name": file_name,
+            "mime": DOCX_MIME_TYPE,
+            "key": f"{key_prefix}_download_{file_id}",
+        }
+
+        if load_preview is None:
+            st.markdown(f"**{file_name}** ")
+            if modified_label:
+                st.caption(modified_label)
+            st.download_button(download_label, **download_kwargs)
+            continue
+
+        label = f"📄 {file_name}"
+        if modified_label:
+            label = f"{label} · {modified_label}"
+        expander = st.expander(
+            label, key=f"{key_prefix}_preview_{file_id}", on_change="rerun"
+        )
+        with expander:
+            if expander.open:
+                st.caption("Vorschau gespeichertes Dokument / Preview saved document")
+                st.markdown(load_preview(file_id, revision))
+            st.download_button(download_label, **download_kwargs)
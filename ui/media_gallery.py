@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import replace
 from math import ceil
 
 import streamlit as st
@@ -16,8 +18,23 @@ def _filtered_items(items: list[MediaItem], kind_filter: str) -> list[MediaItem]
 
 
 def render_media_gallery(
-    items: list[MediaItem], *, page_size: int = 24
+    items: list[MediaItem],
+    *,
+    page_size: int = 24,
+    thumbnail_loader: Callable[[MediaItem], bytes | None] | None = None,
+    preview_loader: Callable[[MediaItem], bytes | None] | None = None,
+    prefetch: Callable[[list[MediaItem]], None] | None = None,
+    show_kind_filter: bool = True,
+    original_loader: Callable[[MediaItem], bytes | None] | None = None,
 ) -> MediaItem | None:
+    """Zeigt ein Raster aus Thumbnails; die Vorschau lädt erst das ausgewählte Medium.
+
+    ``thumbnail_loader`` wird nur für die Medien der aktuellen Seite aufgerufen,
+    ``prefetch`` erhält die Medien der Folgeseite zum Vorladen im Hintergrund.
+    Ohne ``show_kind_filter`` entfällt die Typ-Auswahl (z. B. reine Bildalben).
+    Videos zeigen Poster und Vorschau-Clip; ``original_loader`` lädt das
+    Originalvideo erst, wenn es ausdrücklich abgespielt werden soll.
+    """
     ensure_defaults(
         {
             UIKeys.MEDIA_PAGE: 0,
@@ -26,16 +43,18 @@ def render_media_gallery(
         }
     )
 
-    kind_filter = st.segmented_control(
-        "Typ / Type",
-        options=["all", "image", "video"],
-        format_func=lambda value: {
-            "all": "Alle / All",
-            "image": "Bilder / Images",
-            "video": "Videos / Videos",
-        }[value],
-        key=UIKeys.MEDIA_KIND_FILTER,
-    )
+    kind_filter = "all"
+    if show_kind_filter:
+        kind_filter = st.segmented_control(
+            "Typ / Type",
+            options=["all", "image", "video"],
+            format_func=lambda value: {
+                "all": "Alle / All",
+                "image": "Bilder / Images",
+                "video": "Videos / Videos",
+            }[value],
+            key=UIKeys.MEDIA_KIND_FILTER,
+        )
 
     visible_items = _filtered_items(items, kind_filter or "all")
     if not visible_items:
@@ -59,16 +78,26 @@ def render_media_gallery(
             ss_set(UIKeys.MEDIA_PAGE, min(max_pages - 1, current_page + 1))
             st.rerun()
 
-    page_items = visible_items[
-        current_page * page_size : (current_page + 1) * page_size
-    ]
+    page_start = current_page * page_size
+    page_items = visible_items[page_start : page_start + page_size]
+    if thumbnail_loader is not None:
+        page_items = [
+            (
+                replace(item, thumb_bytes=thumbnail_loader(item))
+                if item.thumb_bytes is None
+                else item
+            )
+            for item in page_items
+        ]
 
     grid_cols = st.columns(4)
     for index, item in enumerate(page_items):
         with grid_cols[index % 4]:
             with card(key=f"media_tile_{item.id}"):
-                if item.thumb_bytes and item.is_image:
+                if item.thumb_bytes:
                     st.image(item.thumb_bytes, use_container_width=True)
+                    if item.is_video:
+                        st.caption("🎬 Video")
                 elif item.is_video:
                     st.caption("🎬 Video")
                 else:
@@ -81,6 +110,10 @@ def render_media_gallery(
                 ):
                     ss_set(UIKeys.MEDIA_SELECTED, item.id)
 
+    next_page_items = visible_items[page_start + page_size : page_start + 2 * page_size]
+    if prefetch is not None and next_page_items:
+        prefetch(next_page_items)
+
     selected_id = str(ss_get(UIKeys.MEDIA_SELECTED, "") or "").strip()
     selected_item = next(
         (item for item in visible_items if item.id == selected_id), None
@@ -92,6 +125,9 @@ def render_media_gallery(
         )
         return None
 
+    if selected_item.preview_bytes is None and preview_loader is not None:
+        selected_item.preview_bytes = preview_loader(selected_item)
+
     with card("Vorschau / Preview"):
         if selected_item.is_video:
             if selected_item.preview_bytes:
@@ -102,6 +138,13 @@ def render_media_gallery(
                 st.warning(
                     "Keine Videovorschau verfügbar. / No video preview available."
                 )
+            if original_loader is not None and st.toggle(
+                "Original abspielen / Play original",
+                key=f"media_play_original_{selected_item.id}",
+            ):
+                original_bytes = original_loader(selected_item)
+                if original_bytes:
+                    st.video(original_bytes)
         else:
             if selected_item.preview_bytes:
                 st.image(selected_item.preview_bytes, use_container_width=True)
@@ -14,6 +14,9 @@ class UIKeys:
     MEDIA_GALLERY_CHILD_SELECT = "media.gallery_child_select"
     MEDIA_UPLOAD_CHILD_SELECT = "media.upload_child_select"
     MEDIA_STATUS_CHILD_SELECT = "media.status_child_select"
+    MEDIA_THUMBNAILS_PENDING = "media.thumbnails_pending"
+    CONTRACTS_LISTING = "contracts.listing"
+    DOCUMENT_JOB_IDS = "documents.job_ids"
 
 
 def ss_get(key: str, default: Any = None) -> Any: